@@ -2,18 +2,37 @@
 """
 ATS Score Calculator Script
 Usage: python agents/ats_agent.py <resume_path> [job_description_path]
+       python agents/ats_agent.py <resumes, directories or globs>... [--jd job.txt] [--output results.jsonl]
+                                  [--workers N] [--gauge-dir DIR [--png]] [--resume-from results.jsonl]
+
+With one resume the report is printed and a score gauge saved. Otherwise (or with
+--output / --format) every resume found is scored across a process pool and one JSONL
+or CSV row per resume is written as soon as it finishes. `--resume-from` skips files
+whose content hash already has a scored row in an earlier output, so an interrupted
+overnight run picks up where it stopped.
 """
 
-import sys
+import argparse
+import csv
+import glob
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from core.ats import ATSAnalyzer, create_ats_score_circle
-from core.utils import load_job_description
+from core.document import as_document
+from core.resume_cache import file_sha256
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+ROW_FIELDS = ['resume_path', 'sha256', 'overall_score']
+ROW_TAIL_FIELDS = ['missing_skills', 'top_improvements', 'gauge_path', 'error']
 
 class ATSAgent:
     """
@@ -35,64 +54,211 @@ class ATSAgent:
         """
         return self._analyzer.calculate_ats_score(resume_path, job_description_text)
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python agents/ats_agent.py <resume_path> [job_description_path]")
-        print("Example: python agents/ats_agent.py data/raw/resumes/resume.pdf data/raw/job_descriptions/job.txt")
-        sys.exit(1)
-    
-    resume_path = sys.argv[1]
-    job_description_path = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    # Validate resume path
-    if not os.path.exists(resume_path):
-        print(f"Error: Resume file not found at {resume_path}")
-        sys.exit(1)
-    
-    # Load job description if provided
-    job_description = None
-    if job_description_path:
-        if not os.path.exists(job_description_path):
-            print(f"Warning: Job description file not found at {job_description_path}")
+def load_job_description(file_path: str) -> str:
+    """Loads a job description from a text file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def expand_inputs(inputs: Iterable[str]) -> List[str]:
+    """Resume files named by `inputs` (files, directories searched recursively, or glob patterns), sorted, once each"""
+    found = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            paths = glob.glob(os.path.join(item, '**', '*'), recursive=True)
+        elif os.path.exists(item):
+            paths = [item]
         else:
-            job_description = load_job_description(job_description_path)
-    
+            paths = glob.glob(item, recursive=True)
+        found.update(os.path.abspath(path) for path in paths
+                     if os.path.isfile(path) and path.lower().endswith(RESUME_EXTENSIONS))
+    return sorted(found)
+
+def scored_hashes(path: str) -> set:
+    """Content hashes with a scored (error-free) row in an earlier JSONL or CSV output"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = []
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # a row cut short when the previous run was stopped
+    return {row['sha256'] for row in rows if row.get('sha256') and not row.get('error')}
+
+# Per worker process: one analyzer, and the job description cleaned once
+_worker_state = {}
+
+def _init_worker(job_description: str | None, profile: str | None):
+    _worker_state['analyzer'] = ATSAnalyzer(profile)
+    try:
+        _worker_state['job_description'] = as_document(job_description) if job_description else None
+    except Exception:
+        # Left raw, so each resume reports the failure in its row instead of the pool breaking
+        _worker_state['job_description'] = job_description
+
+def _score_one(resume_path: str, sha256: str, gauge_dir: str | None, png: bool) -> Dict:
+    """Worker entry point: scores one resume into an output row"""
+    analyzer = _worker_state['analyzer']
+    result = analyzer.calculate_ats_score(resume_path, _worker_state['job_description'])
+    row = {'resume_path': resume_path, 'sha256': sha256, 'overall_score': result['overall_score']}
+    for category, data in result.get('category_scores', {}).items():
+        row[category] = round(data['score'], 4)
+    row['missing_skills'] = result.get('missing_skills', [])
+    row['top_improvements'] = [item['phrase'] for item in result.get('improvements', [])[:5]]
+    row['gauge_path'] = None
+    row['error'] = result.get('error')
+    if gauge_dir and not row['error']:
+        name = f"ats_score_{Path(resume_path).stem}_{sha256[:8]}.{'png' if png else 'svg'}"
+        row['gauge_path'] = create_ats_score_circle(result['overall_score'], os.path.join(gauge_dir, name))
+    return row
+
+def score_resumes(resume_paths: List[str], job_description: str = None, workers: int = None, profile: str = None,
+                  gauge_dir: str = None, png: bool = False, skip_hashes: set = frozenset()) -> Iterator[Dict]:
+    """
+    Scores resumes across `workers` processes (default: every core; 1 scores in this process),
+    yielding one row per resume in completion order. Files whose content hash is in
+    `skip_hashes` are not scored, nor is a second copy of the same file.
+    """
+    if gauge_dir:
+        os.makedirs(gauge_dir, exist_ok=True)
+    pending, seen = [], set(skip_hashes)
+    for path in resume_paths:
+        try:
+            sha256 = file_sha256(path)
+        except OSError as e:
+            yield {'resume_path': path, 'sha256': None, 'error': str(e)}
+            continue
+        if sha256 not in seen:
+            seen.add(sha256)
+            pending.append((path, sha256))
+
+    if workers == 1:
+        _init_worker(job_description, profile)
+        for path, sha256 in pending:
+            yield _score_one(path, sha256, gauge_dir, png)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(job_description, profile)) as pool:
+        futures = {pool.submit(_score_one, path, sha256, gauge_dir, png): (path, sha256) for path, sha256 in pending}
+        for future in as_completed(futures):
+            path, sha256 = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:  # the worker itself failed, e.g. killed
+                yield {'resume_path': path, 'sha256': sha256, 'error': str(e)}
+
+def trim_partial_row(path: str, block_size: int = 1 << 16):
+    """Cuts a row left unfinished by an interrupted run off the end of an output file"""
+    with open(path, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b'\n':
+            return
+        keep = 0
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b'\n')
+            if newline >= 0:
+                keep = start + newline + 1
+                break
+            end = start
+        f.truncate(keep)
+
+class RowWriter:
+    """Writes rows as JSONL or CSV, flushing each one so partial runs stay usable"""
+    def __init__(self, stream, fmt: str, categories: List[str], write_header: bool = True):
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = ROW_FIELDS + list(categories) + ROW_TAIL_FIELDS
+        self._csv = None
+        if fmt == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=self.fields, extrasaction='ignore')
+            if write_header:
+                self._csv.writeheader()
+
+    def write(self, row: Dict):
+        row = {field: row.get(field) for field in self.fields}
+        if self._csv is not None:
+            for field in ('missing_skills', 'top_improvements'):
+                row[field] = '; '.join(row[field] or [])
+            self._csv.writerow(row)
+        else:
+            self.stream.write(json.dumps(row) + '\n')
+        self.stream.flush()
+
+def run_bulk(args, resume_paths: List[str], job_description: str | None):
+    fmt = args.format or ('csv' if args.output and args.output.lower().endswith('.csv') else 'jsonl')
+    skip = scored_hashes(args.resume_from) if args.resume_from else set()
+    categories = list(ATSAnalyzer(args.profile).ats_criteria)
+
+    appending = bool(args.output) and os.path.exists(args.output) and args.resume_from and \
+        os.path.abspath(args.output) == os.path.abspath(args.resume_from)
+    if appending:
+        trim_partial_row(args.output)
+        appending = os.path.getsize(args.output) > 0  # a file cut down to nothing needs its CSV header again
+    stream = open(args.output, 'a' if appending else 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    print(f"🔍 Scoring {len(resume_paths)} resume(s) with {args.workers or os.cpu_count()} worker(s)"
+          f"{f', skipping {len(skip)} already scored' if skip else ''}...", file=sys.stderr)
+    done = failed = 0
+    try:
+        writer = RowWriter(stream, fmt, categories, write_header=not appending)
+        for row in score_resumes(resume_paths, job_description, args.workers, args.profile,
+                                 args.gauge_dir, args.png, skip):
+            writer.write(row)
+            done += 1
+            failed += bool(row.get('error'))
+            if args.output:
+                print(f"  [{done}] {row.get('overall_score', '-')}%  {row['resume_path']}", file=sys.stderr)
+    finally:
+        if args.output:
+            stream.close()
+    print(f"✅ {done} resume(s) processed, {failed} failed", file=sys.stderr)
+
+def run_single(args, resume_path: str, job_description: str | None, job_description_path: str | None):
     # Initialize ATS analyzer
-    ats_analyzer = ATSAnalyzer()
-    
+    ats_analyzer = ATSAnalyzer(args.profile)
+
     print("🔍 Analyzing resume for ATS compatibility...")
     print(f"📄 Resume: {resume_path}")
     if job_description:
         print(f"📋 Job Description: {job_description_path}")
     print("-" * 50)
-    
+
     try:
         # Calculate ATS score
         result = ats_analyzer.calculate_ats_score(resume_path, job_description)
-        
+
         if 'error' in result:
             print(f"❌ Error: {result['error']}")
             sys.exit(1)
-        
+
         # Display results
         print(f"🎯 Overall ATS Score: {result['overall_score']}%")
         print("\n📊 Category Breakdown:")
-        
+
         for category, data in result['category_scores'].items():
             category_name = category.replace('_', ' ').title()
             score_percent = data['score'] * 100
             weight_percent = data['weight'] * 100
             print(f"  • {category_name}: {score_percent:.1f}% (Weight: {weight_percent:.0f}%)")
-        
+
         print("\n💡 Recommendations:")
         for i, rec in enumerate(result['recommendations'], 1):
             print(f"  {i}. {rec}")
-        
+
         # Create circular score visualization
-        output_path = f"ats_score_{Path(resume_path).stem}.png"
+        output_path = os.path.join(args.gauge_dir or '', f"ats_score_{Path(resume_path).stem}.{'png' if args.png else 'svg'}")
         create_ats_score_circle(result['overall_score'], output_path)
         print(f"\n📈 Score visualization saved to: {output_path}")
-        
+
         # Determine overall assessment
         score = result['overall_score']
         if score >= 80:
@@ -101,10 +267,54 @@ def main():
             print("\n⚠️  Good, but there's room for improvement.")
         else:
             print("\n❌ Your resume needs significant improvements for ATS compatibility.")
-        
+
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         sys.exit(1)
 
+def main():
+    parser = argparse.ArgumentParser(description="Score resumes for ATS compatibility")
+    parser.add_argument("inputs", nargs="+",
+                        help="resume files, directories or glob patterns; a .txt file is read as the job description")
+    parser.add_argument("--jd", help="job description text file")
+    parser.add_argument("--profile", help="industry profile adding extra checks (core.ats_rules.ATS_PROFILES)")
+    parser.add_argument("--output", help="write one row per resume here (.jsonl or .csv) instead of stdout")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="row format (default: from --output, else jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--gauge-dir", help="save a score gauge per resume in this directory")
+    parser.add_argument("--png", action="store_true", help="save gauges as PNG instead of SVG")
+    parser.add_argument("--resume-from", help="earlier JSONL/CSV output; resumes already scored there are skipped")
+    args = parser.parse_args()
+
+    job_description_path = args.jd
+    inputs = []
+    for item in args.inputs:
+        if item.lower().endswith('.txt') and job_description_path is None:
+            job_description_path = item
+        else:
+            inputs.append(item)
+    if not inputs:
+        parser.error("no resume given; pass resume files, directories or glob patterns besides the job description")
+
+    # Load job description if provided
+    job_description = None
+    if job_description_path:
+        if not os.path.exists(job_description_path):
+            print(f"Warning: Job description file not found at {job_description_path}", file=sys.stderr)
+        else:
+            job_description = load_job_description(job_description_path)
+
+    bulk = args.output or args.format or args.resume_from or len(inputs) > 1 or any(
+        os.path.isdir(item) or not os.path.exists(item) for item in inputs)
+    if not bulk:
+        run_single(args, inputs[0], job_description, job_description_path)
+        return
+
+    resume_paths = expand_inputs(inputs)
+    if not resume_paths:
+        print(f"Error: no {'/'.join(RESUME_EXTENSIONS)} resumes found in {', '.join(inputs)}", file=sys.stderr)
+        sys.exit(1)
+    run_bulk(args, resume_paths, job_description)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,6 +4,7 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.embedding import calculate_resume_jd_similarity
 from agents.ingestion_agent import IngestionAgent
+from core.document import ParsedDocument
 
 class EmbeddingAgent:
     """
@@ -11,14 +12,14 @@ class EmbeddingAgent:
     and calculates their similarity score.
     It utilizes functions from `core/embedding.py`.
     """
-    def process(self, cleaned_resume_list: list[str], cleaned_jd_list: list[str]):
+    def process(self, cleaned_resume_list: ParsedDocument | list[str], cleaned_jd_list: ParsedDocument | list[str]):
         """
         Generates embeddings for the cleaned resume and job description and calculates
         their cosine similarity.
 
         Args:
-            cleaned_resume_list (list[str]): The preprocessed tokens of the resume.
-            cleaned_jd_list (list[str]): The preprocessed tokens of the job description.
+            cleaned_resume_list (ParsedDocument | list[str]): The parsed resume or its preprocessed tokens.
+            cleaned_jd_list (ParsedDocument | list[str]): The parsed job description or its preprocessed tokens.
 
         Returns:
             float: The cosine similarity score between the resume and job description embeddings.
@@ -2,7 +2,8 @@ import os
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from core.utils import process_documents
+from core.utils import process_documents, process_many, parse_documents
+from core.document import ParsedDocument
 
 class IngestionAgent:
     """
@@ -28,6 +29,44 @@ class IngestionAgent:
             print(f"Error during ingestion: {e}")
             raise
 
+    def ingest_documents(self, resume_path: str, jd_text: str,
+                         sandbox: bool = None) -> tuple[ParsedDocument, ParsedDocument]:
+        """
+        Loads and preprocesses the resume and job description into ParsedDocuments,
+        which downstream agents share instead of re-tokenizing.
+
+        Args:
+            resume_path (str): The file path to the resume (PDF or DOCX).
+            jd_text (str): The raw job description text.
+            sandbox (bool): Extract the resume in a supervised worker process under time and
+                memory limits; failures raise core.sandbox.ExtractionError.
+
+        Returns:
+            tuple[ParsedDocument, ParsedDocument]: The resume and job description documents.
+        """
+        print(f"Ingesting documents: Resume - {resume_path},Job Description Text Provided.")
+        try:
+            return parse_documents(resume_path, jd_text, sandbox=sandbox)
+        except Exception as e:
+            print(f"Error during ingestion: {e}")
+            raise
+
+    def ingest_many(self, resume_paths: list[str], jd_text: str, max_workers: int = None):
+        """
+        Loads and preprocesses many resumes against one job description using a worker pool.
+
+        Args:
+            resume_paths (list[str]): File paths to the resumes.
+            jd_text (str): The raw job description text, cleaned once for the whole batch.
+            max_workers (int): Number of worker processes (defaults to the CPU count).
+
+        Yields:
+            dict: One result per resume as it finishes, with the same keys as `ingest` plus
+            "resume_path", or {"resume_path", "error"} if that resume failed.
+        """
+        print(f"Ingesting {len(resume_paths)} resumes against one Job Description.")
+        yield from process_many(resume_paths, jd_text, max_workers=max_workers)
+
 # if __name__ == "__main__":
 #     # Example Usage:
 #     RESUME_PATH = "../data/raw/resumes/Ahmed Raza - AI Engineer.pdf"
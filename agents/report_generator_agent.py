@@ -1,15 +1,13 @@
 import os
-import nltk
-from core.utils import process_documents
+from core.utils import process_many
 from core.embedding import calculate_resume_jd_similarity
 from core.llm_interface import generate_insights
 from core.report_generator import generate_pdf_report
+from core.sections import segment_sections
+from core.skills import extract_skills, missing_skills, skills_chart_data
+from core.dedup import cluster_near_duplicates
 
-# --- DOWNLOAD NLTK DATA ---
-nltk.download("punkt")       # regular tokenizer
-nltk.download("punkt_tab")   # fix for LangChain/PyPDFLoader issue
-nltk.download("stopwords")
-nltk.download("wordnet")
+# NLTK corpora are never downloaded here; install them once with `python -m core.nltk_resources`
 
 # --- PATHS ---
 RESUMES_DIR = "data/raw/resumes"
@@ -18,49 +16,87 @@ OUTPUT_DIR = "data/output"
 ANALYSIS_DIR = os.path.join(OUTPUT_DIR, "analysis_reports")
 os.makedirs(ANALYSIS_DIR, exist_ok=True)
 
-# --- EXAMPLE SKILLS DICTIONARY ---
-skills_dict = {
-    "Python": 80,
-    "C++": 70,
-    "SQL": 65,
-    "JavaScript": 60
-}
-
-# --- LOOP THROUGH RESUMES ---
-for resume_file in os.listdir(RESUMES_DIR):
-    if not resume_file.lower().endswith(".pdf"):
-        continue
-
-    resume_path = os.path.join(RESUMES_DIR, resume_file)
-    print(f"Processing resume: {resume_file}")
-
-    try:
-        # --- Load and preprocess resume + JD ---
-        processed = process_documents(resume_path, JD_PATH)
-        cleaned_resume = " ".join(processed["cleaned_resume"])
-        cleaned_jd = " ".join(processed["cleaned_job_description"])
-
-        # --- Calculate similarity score ---
-        similarity_score = calculate_resume_jd_similarity(cleaned_resume, cleaned_jd)
-
-        # --- Generate insights from LLM ---
-        insights = generate_insights(cleaned_resume, cleaned_jd, similarity_score)
-
-        # --- FIX: Convert lists in insights to strings for proper PDF formatting ---
-        for key in insights:
-            if isinstance(insights[key], list):
-                insights[key] = "\n\n".join(insights[key])  # join list items into paragraphs
-
-        # --- Generate PDF report ---
-        report_path = generate_pdf_report(
-            insights=insights,
-            score=similarity_score,
-            resume_name=os.path.splitext(resume_file)[0],
-            skills=skills_dict,
-            output_dir=ANALYSIS_DIR
-        )
-
-        print(f"✅ Report generated at: {report_path}\n")
-
-    except Exception as e:
-        print(f"❌ Error while processing {resume_file}: {e}\n")
\ No newline at end of file
+# --- PROCESS RESUMES ---
+def analyze_resume(processed: dict, jd_skills: dict) -> tuple[float, dict, dict]:
+    """Runs the expensive stages (embedding, LLM) for one resume; returns (score, insights, skills chart)."""
+    cleaned_resume = " ".join(processed["cleaned_resume"])
+    cleaned_jd = " ".join(processed["cleaned_job_description"])
+
+    # --- Calculate similarity score ---
+    similarity_score = calculate_resume_jd_similarity(
+        processed["cleaned_resume"], processed["cleaned_job_description"]
+    )
+
+    # --- Extract skills from the taxonomy (no LLM call) ---
+    resume_text = processed["raw_resume_text"]
+    resume_skills = extract_skills(resume_text, segment_sections(resume_text))
+    skills_dict = skills_chart_data(resume_skills, jd_skills)
+
+    # --- Generate insights from LLM ---
+    insights = generate_insights(cleaned_resume, cleaned_jd, similarity_score)
+    if "missing_skills" not in insights:
+        gap = missing_skills(resume_skills, jd_skills)
+        insights["missing_skills"] = ", ".join(gap) if gap else "No missing skills found."
+
+    # --- FIX: Convert lists in insights to strings for proper PDF formatting ---
+    for key in insights:
+        if isinstance(insights[key], list):
+            insights[key] = "\n\n".join(insights[key])  # join list items into paragraphs
+    return similarity_score, insights, skills_dict
+
+def main():
+    with open(JD_PATH, "r", encoding="utf-8") as f:
+        jd_text = f.read()
+
+    resume_paths = [
+        os.path.join(RESUMES_DIR, resume_file)
+        for resume_file in sorted(os.listdir(RESUMES_DIR))
+        if resume_file.lower().endswith((".pdf", ".docx"))
+    ]
+
+    # Resumes are parsed and cleaned in parallel; the JD is cleaned once for the whole batch
+    processed_by_path = {}
+    for processed in process_many(resume_paths, jd_text):
+        if "error" in processed:
+            print(f"❌ Error while processing {os.path.basename(processed['resume_path'])}: {processed['error']}\n")
+            continue
+        processed_by_path[processed["resume_path"]] = processed
+
+    # Near-duplicate copies of a resume share one embedding + LLM pass
+    clusters = cluster_near_duplicates(
+        (path, processed_by_path[path]["cleaned_resume"]) for path in resume_paths if path in processed_by_path
+    )
+    duplicates = sum(len(cluster.duplicates) for cluster in clusters)
+    if duplicates:
+        print(f"Found {duplicates} near-duplicate resume(s); analyzing {len(clusters)} distinct resumes.\n")
+
+    jd_skills = None
+    for cluster in clusters:
+        processed = processed_by_path[cluster.representative]
+        resume_file = os.path.basename(cluster.representative)
+        print(f"Processing resume: {resume_file}")
+
+        try:
+            if jd_skills is None:
+                jd_skills = extract_skills(processed["raw_jd_text"])
+            similarity_score, insights, skills_dict = analyze_resume(processed, jd_skills)
+
+            # --- Generate PDF reports: the representative's analysis is reused for its duplicates ---
+            for path, similarity in [(cluster.representative, 1.0)] + cluster.duplicates:
+                if path != cluster.representative:
+                    print(f"↳ {os.path.basename(path)} is a near-duplicate of {resume_file} "
+                          f"(~{similarity:.0%} similar); reusing its analysis")
+                report_path = generate_pdf_report(
+                    insights=insights,
+                    score=similarity_score,
+                    resume_name=os.path.splitext(os.path.basename(path))[0],
+                    skills=skills_dict,
+                    output_dir=ANALYSIS_DIR
+                )
+                print(f"✅ Report generated at: {report_path}\n")
+
+        except Exception as e:
+            print(f"❌ Error while processing {resume_file}: {e}\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: ATS resume × job description score matrix vs one check call per pair
+Usage: python benchmarks/bench_ats_batch.py [--resumes 200 1000] [--jds 50] [--pair-sample 200]
+
+Generates synthetic cleaned resumes and job descriptions, scores the full matrix with
+ATSAnalyzer.score_matrix, and compares pairs per second with calling the four category
+checks once per pair (measured on a sample of pairs).
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.ats import ATSAnalyzer
+from core.document import ParsedDocument
+
+VOCABULARY = [f"term{i}" for i in range(8000)] + [
+    "python", "aws", "docker", "react", "sql", "developed", "led", "managed", "improved", "delivered",
+]
+
+
+def make_document(rng, words: int) -> ParsedDocument:
+    tokens = [rng.choice(VOCABULARY) for _ in range(words)]
+    lines = [" ".join(tokens[i:i + 12]) for i in range(0, len(tokens), 12)]
+    text = "SUMMARY\n" + "\n".join(lines[:3]) + "\nEXPERIENCE\n" + "\n".join(lines[3:]) + "\nSKILLS\nPython, AWS"
+    return ParsedDocument(text, tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--jds", type=int, default=50)
+    parser.add_argument("--pair-sample", type=int, default=200,
+                        help="pairs scored one call at a time for the baseline")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    analyzer = ATSAnalyzer()
+    jds = [make_document(rng, rng.randint(150, 400)) for _ in range(args.jds)]
+
+    print(f"{'Resumes':>8} {'JDs':>5} {'Matrix s':>9} {'Pairs/s':>10} {'Per-pair pairs/s':>17}")
+    print("-" * 54)
+    for size in args.resumes:
+        resumes = [make_document(rng, rng.randint(300, 700)) for _ in range(size)]
+        start = time.perf_counter()
+        analyzer.score_matrix(resumes, jds)
+        elapsed = time.perf_counter() - start
+
+        pairs = [(rng.choice(resumes), rng.choice(jds)) for _ in range(args.pair_sample)]
+        start = time.perf_counter()
+        for resume, jd in pairs:
+            text = resume.raw_text
+            ATSAnalyzer.check_format_compatibility.fn(analyzer, text, resume.sections, resume.layout)
+            ATSAnalyzer.check_keyword_optimization.fn(analyzer, text, resume, jd)
+            ATSAnalyzer.check_structure_quality.fn(analyzer, text, resume.sections)
+            ATSAnalyzer.check_content_quality.fn(analyzer, text, resume)
+        per_pair = len(pairs) / (time.perf_counter() - start)
+        print(f"{size:>8} {len(jds):>5} {elapsed:>9.2f} {size * len(jds) / elapsed:>10.0f} {per_pair:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Microbenchmark: clean_text throughput before and after the precompiled pipeline
+Usage: python benchmarks/bench_clean_text.py [--repeat N]
+
+Runs the original clean_text implementation and the current fast path over the
+resumes in data/raw/resumes plus the sample job description and reports
+tokens/second for each. Requires the NLTK stopwords, wordnet and punkt corpora.
+"""
+
+import argparse
+import glob
+import os
+import re
+import string
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import nltk
+from nltk.corpus import stopwords
+from nltk.stem import WordNetLemmatizer
+from core.utils import clean_text, iter_resume_pages
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw')
+
+
+def legacy_clean_text(text: str) -> list[str]:
+    """The clean_text implementation before the precompiled pipeline."""
+    text = text.lower()
+    text = re.sub(f'[{re.escape(string.punctuation)}]', '', text)
+    text = re.sub(r'\d+', '', text)
+    tokens = nltk.word_tokenize(text)
+    stop_words = set(stopwords.words('english'))
+    tokens = [word for word in tokens if word not in stop_words]
+    lemmatizer = WordNetLemmatizer()
+    return [lemmatizer.lemmatize(word) for word in tokens]
+
+
+def load_corpus() -> list[str]:
+    texts = [" ".join(iter_resume_pages(path)) for path in sorted(glob.glob(os.path.join(DATA_DIR, "resumes", "*.pdf")))]
+    with open(os.path.join(DATA_DIR, "job_descriptions", "ai_engineer.txt"), encoding="utf-8") as f:
+        texts.append(f.read())
+    return texts
+
+
+def throughput(func, texts: list[str], repeat: int) -> tuple[float, int]:
+    func(texts[0])  # warm-up: corpus loading and first WordNet lookup are one-off costs
+    tokens = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            tokens += len(func(text))
+    return tokens / (time.perf_counter() - start), tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    texts = load_corpus()
+    mismatches = sum(1 for text in texts if clean_text(text) != legacy_clean_text(text))
+
+    print(f"Documents: {len(texts)}, repeats: {args.repeat}, parity mismatches: {mismatches}")
+    print(f"{'Implementation':<28} {'Tokens/s':>12}")
+    print("-" * 41)
+    before, _ = throughput(legacy_clean_text, texts, args.repeat)
+    print(f"{'before (legacy)':<28} {before:>12,.0f}")
+    for mode in ("nltk", "regex"):
+        after, _ = throughput(lambda text: clean_text(text, tokenizer=mode), texts, args.repeat)
+        print(f"{'after (tokenizer=' + mode + ')':<28} {after:>12,.0f}   {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: streaming DOCX extraction vs the PDF path for the same content
+Usage: python benchmarks/bench_docx_extraction.py [--repeat N]
+
+For every resume in data/raw/resumes, the PDF text is written into an
+equivalent DOCX (one paragraph per line, a page break between PDF pages) and
+both files are extracted with core.utils.iter_resume_pages.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.utils import iter_resume_pages
+
+RESUMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'resumes')
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def write_docx(path: str, pages: list[str]):
+    """Writes a minimal DOCX with one paragraph per line and page breaks between pages."""
+    body = []
+    for page_number, page in enumerate(pages):
+        if page_number:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+        for line in page.split("\n"):
+            body.append(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>')
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(body)}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr("_rels/.rels", RELS)
+        archive.writestr("word/document.xml", document)
+
+
+def best_time(path: str, repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = " ".join(iter_resume_pages(path))
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Resume':<40} {'PDF ms':>9} {'DOCX ms':>9} {'Speedup':>9}  Same text")
+    print("-" * 82)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for pdf_path in sorted(glob.glob(os.path.join(RESUMES_DIR, "*.pdf"))):
+            docx_path = os.path.join(tmp_dir, os.path.basename(pdf_path)[:-4] + ".docx")
+            write_docx(docx_path, list(iter_resume_pages(pdf_path)))
+
+            pdf_time, pdf_text = best_time(pdf_path, args.repeat)
+            docx_time, docx_text = best_time(docx_path, args.repeat)
+            print(f"{os.path.basename(pdf_path)[:40]:<40} {pdf_time * 1000:>9.2f} {docx_time * 1000:>9.2f} "
+                  f"{pdf_time / docx_time:>8.1f}x  {'yes' if pdf_text == docx_text else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: MinHash LSH near-duplicate clustering vs all-pairs comparison
+Usage: python benchmarks/bench_near_duplicates.py [--sizes 500 1000 2000 4000] [--dup-rate 0.2]
+
+Generates batches of synthetic cleaned resumes in which a share of the documents are
+lightly edited copies of others, clusters them with core.dedup, and reports time per
+document (flat if clustering is linear), recall/precision of the duplicate pairs, and
+the time an exact all-pairs Jaccard comparison takes on the same batch.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.dedup import DEFAULT_THRESHOLD, SHINGLE_SIZE, cluster_near_duplicates
+
+VOCABULARY = [f"term{i}" for i in range(5000)]
+
+
+def make_batch(size: int, dup_rate: float, seed: int = 0):
+    """Returns ([(key, tokens)], {duplicate key: original key})."""
+    rng = random.Random(seed)
+    documents, truth = [], {}
+    for i in range(size):
+        if documents and rng.random() < dup_rate:
+            original_key, original = rng.choice([d for d in documents if d[0] not in truth][-50:])
+            tokens = list(original)
+            for _ in range(rng.randint(1, 4)):  # trivial edits: a changed phone number, a new skill
+                tokens[rng.randrange(len(tokens))] = rng.choice(VOCABULARY)
+            truth[f"doc{i}"] = original_key
+        else:
+            tokens = [rng.choice(VOCABULARY) for _ in range(rng.randint(250, 450))]
+        documents.append((f"doc{i}", tokens))
+    return documents, truth
+
+
+def shingles(tokens):
+    return {tuple(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def all_pairs(documents, threshold):
+    sets = [(key, shingles(tokens)) for key, tokens in documents]
+    pairs = set()
+    for i, (key, a) in enumerate(sets):
+        for other, b in sets[:i]:
+            if len(a & b) / len(a | b) >= threshold:
+                pairs.add((key, other))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 4000])
+    parser.add_argument("--dup-rate", type=float, default=0.2)
+    parser.add_argument("--all-pairs-max", type=int, default=1000,
+                        help="largest batch to also compare all pairs on (quadratic)")
+    args = parser.parse_args()
+
+    print(f"{'Docs':>6} {'LSH s':>8} {'us/doc':>8} {'Clusters':>9} {'Recall':>7} {'Precision':>10} {'All-pairs s':>12}")
+    print("-" * 66)
+    for size in args.sizes:
+        documents, truth = make_batch(size, args.dup_rate)
+        start = time.perf_counter()
+        clusters = cluster_near_duplicates(documents, DEFAULT_THRESHOLD)
+        elapsed = time.perf_counter() - start
+
+        found = {key: cluster.representative for cluster in clusters for key, _ in cluster.duplicates}
+        recall = sum(1 for key, original in truth.items() if found.get(key) == original) / max(len(truth), 1)
+        precision = sum(1 for key, original in found.items() if truth.get(key) == original) / max(len(found), 1)
+
+        exact = "-"
+        if size <= args.all_pairs_max:
+            start = time.perf_counter()
+            all_pairs(documents, DEFAULT_THRESHOLD)
+            exact = f"{time.perf_counter() - start:.2f}"
+        print(f"{size:>6} {elapsed:>8.2f} {elapsed / size * 1e6:>8.0f} {len(clusters):>9} "
+              f"{recall:>7.3f} {precision:>10.3f} {exact:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: serial vs page-parallel PDF extraction
+Usage: python benchmarks/bench_parallel_extraction.py [--workers N] [--pages 8 32 128]
+
+Times core.utils extraction on the resumes in data/raw/resumes and on generated
+long documents, reporting the parallel speedup by page count and checking that
+both paths return identical text.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from fpdf import FPDF
+from core.utils import extract_pages_parallel, iter_resume_pages
+
+RESUMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'resumes')
+
+PARAGRAPH = (
+    "Designed and deployed machine learning pipelines for document understanding, "
+    "reducing manual review time by 40%. Led a team of 4 engineers building "
+    "retrieval-augmented generation services on AWS with Docker and Kubernetes. "
+)
+
+
+def generate_long_pdf(path: str, pages: int):
+    """Writes a synthetic multi-page CV with dense text on every page."""
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=10)
+    for page in range(pages):
+        pdf.add_page()
+        pdf.multi_cell(0, 5, f"Publication list, page {page + 1}\n" + PARAGRAPH * 18)
+    pdf.output(path)
+
+
+def time_call(func, repeat: int = 3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench(path: str, label: str, workers: int):
+    serial_time, serial_pages = time_call(lambda: list(iter_resume_pages(path)))
+    parallel_time, parallel_pages = time_call(lambda: extract_pages_parallel(path, max_workers=workers))
+    identical = serial_pages == parallel_pages
+    speedup = serial_time / parallel_time if parallel_time else float("inf")
+    print(f"{label:<45} {len(serial_pages):>6} {serial_time:>10.3f} {parallel_time:>10.3f} {speedup:>8.2f}x  {'yes' if identical else 'NO'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 8, 32, 128])
+    args = parser.parse_args()
+
+    print(f"Workers: {args.workers} (cpu_count={os.cpu_count()})")
+    print(f"{'Document':<45} {'Pages':>6} {'Serial s':>10} {'Parallel s':>10} {'Speedup':>9}  Identical")
+    print("-" * 95)
+
+    for path in sorted(glob.glob(os.path.join(RESUMES_DIR, "*.pdf"))):
+        bench(path, os.path.basename(path)[:45], args.workers)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for pages in args.pages:
+            path = os.path.join(tmp_dir, f"generated_{pages}.pdf")
+            generate_long_pdf(path, pages)
+            bench(path, f"generated ({pages} pages)", args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: PDF extraction backends (PyMuPDF, pypdf, pdfminer.six)
+Usage: python benchmarks/bench_pdf_backends.py [--repeat N] [--reference pypdf]
+
+Extracts every resume in data/raw/resumes with each installed backend and reports
+pages/second together with text parity against the reference backend (pypdf, the
+library the original PyPDFLoader path used):
+  exact   - pages whose text is identical to the reference
+  words   - similarity of the word sequences (difflib ratio, 1.0 = same words in the same order)
+  vocab   - Jaccard overlap of the lowercased word sets, which is what keyword matching sees
+"""
+
+import argparse
+import difflib
+import glob
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.pdf_backends import BACKEND_PREFERENCE, PDF_BACKENDS, available_backends, get_pdf_backend
+
+RESUMES_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'resumes')
+
+
+def extract(backend, path: str, repeat: int) -> tuple[float, list[str]]:
+    best = float("inf")
+    pages = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pages = list(backend.iter_pages(path))
+        best = min(best, time.perf_counter() - start)
+    return best, pages
+
+
+def parity(pages: list[str], reference: list[str]) -> tuple[int, float, float]:
+    exact = sum(1 for page, ref in zip(pages, reference) if page == ref)
+    words, ref_words = " ".join(pages).split(), " ".join(reference).split()
+    word_ratio = difflib.SequenceMatcher(None, words, ref_words, autojunk=False).ratio()
+    vocab, ref_vocab = {w.lower() for w in words}, {w.lower() for w in ref_words}
+    jaccard = len(vocab & ref_vocab) / len(vocab | ref_vocab) if vocab | ref_vocab else 1.0
+    return exact, word_ratio, jaccard
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reference", default="pypdf", choices=BACKEND_PREFERENCE)
+    args = parser.parse_args()
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)  # font descriptor warnings
+
+    backends = available_backends()
+    missing = [name for name in BACKEND_PREFERENCE if name not in backends]
+    print(f"Installed backends: {', '.join(backends)}" + (f" (missing: {', '.join(missing)})" if missing else ""))
+    print(f"Auto-selected backend: {get_pdf_backend().name}\n")
+
+    paths = sorted(glob.glob(os.path.join(RESUMES_DIR, "*.pdf")))
+    reference = get_pdf_backend(args.reference)
+    reference_pages = {path: list(reference.iter_pages(path)) for path in paths}
+
+    print(f"{'Backend':<10} {'Resume':<38} {'Pages':>5} {'ms':>9} {'pages/s':>9} {'exact':>7} {'words':>6} {'vocab':>6}")
+    print("-" * 96)
+    for name in backends:
+        backend = PDF_BACKENDS[name]
+        total_pages = total_time = 0
+        for path in paths:
+            seconds, pages = extract(backend, path, args.repeat)
+            exact, word_ratio, jaccard = parity(pages, reference_pages[path])
+            total_pages += len(pages)
+            total_time += seconds
+            print(f"{name:<10} {os.path.basename(path)[:38]:<38} {len(pages):>5} {seconds * 1000:>9.2f} "
+                  f"{len(pages) / seconds:>9.1f} {exact:>3}/{len(pages):<3} {word_ratio:>6.3f} {jaccard:>6.3f}")
+        print(f"{name:<10} {'TOTAL':<38} {total_pages:>5} {total_time * 1000:>9.2f} {total_pages / total_time:>9.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,91 +1,59 @@
-import re
-import math
 from typing import Dict, List, Tuple
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Circle, Wedge
 import numpy as np
-from core.utils import load_resume, clean_text
+from core.utils import load_resume_document, RESUME_MAX_PAGES, RESUME_MAX_CHARS
+from core.ats_gauge import GAUGE_SIZE, gauge_svg, save_gauge
+from core.ats_batch import (BATCH_CHUNK_CELLS, ATSScoreMatrix, chunk_rows, keyword_coverage, profile_matrix,
+                            shared_tokens, token_matrix)
+from core.ats_rules import ATS_CRITERIA, ATSPlan, compile_plan, with_profile
+from core.ats_session import ATSSession
+from core.ats_whatif import Improvement, rank_improvements
+from core.document import SHARED_VOCABULARY, ParsedDocument, as_document, raw_text_of
+from core.jd_keywords import jd_keyword_profile
+from core.layout import LayoutFacts
+from core.sections import SectionIndex
+from core.skills import extract_skills, missing_skills
+from core.sandbox import ExtractionError
 from prefect import task
 class ATSAnalyzer:
     """
     ATS (Applicant Tracking System) Score Calculator
-    Analyzes resume compatibility with ATS systems and provides a score
+    Analyzes resume compatibility with ATS systems and provides a score.
+    The checks are declared as data in `ats_criteria` (see core.ats_rules) and run as one compiled plan;
+    `profile` adds the industry-specific categories of core.ats_rules.ATS_PROFILES.
     """
     
-    def __init__(self):
-        self.ats_criteria = {
-            'format_compatibility': {
-                'weight': 0.25,
-                'checks': [
-                    'has_standard_sections',
-                    'no_tables_or_columns',
-                    'no_graphics_or_images',
-                    'standard_fonts',
-                    'proper_file_format'
-                ]
-            },
-            'keyword_optimization': {
-                'weight': 0.30,
-                'checks': [
-                    'relevant_keywords',
-                    'industry_terms',
-                    'skill_keywords',
-                    'action_verbs'
-                ]
-            },
-            'structure_quality': {
-                'weight': 0.25,
-                'checks': [
-                    'clear_contact_info',
-                    'professional_summary',
-                    'work_experience_format',
-                    'education_section',
-                    'skills_section'
-                ]
-            },
-            'content_quality': {
-                'weight': 0.20,
-                'checks': [
-                    'quantified_achievements',
-                    'consistent_formatting',
-                    'no_grammar_errors',
-                    'appropriate_length',
-                    'professional_tone'
-                ]
-            }
-        }
+    def __init__(self, profile: str = None):
+        self.profile = profile
+        self.ats_criteria = with_profile(ATS_CRITERIA, profile)
+
+    @property
+    def plan(self) -> ATSPlan:
+        """`ats_criteria` compiled into an execution plan (cached per distinct criteria)"""
+        return compile_plan(self.ats_criteria)
     
-    def calculate_ats_score(self, resume_path: str, job_description: str = None) -> Dict:
+    def calculate_ats_score(self, resume_path: str, job_description: str = None, sandbox: bool = None) -> Dict:
         """
         Calculate comprehensive ATS score for a resume
         
         Args:
             resume_path: Path to the resume file
             job_description: Optional job description for keyword matching
+            sandbox: Extract the resume in a supervised worker process (see core.sandbox)
             
         Returns:
             Dictionary containing score breakdown and recommendations
         """
         try:
             # Load and process resume
-            resume_text = load_resume(resume_path)
-            resume_tokens = clean_text(resume_text)
+            resume_doc = load_resume_document(
+                resume_path, max_pages=RESUME_MAX_PAGES, max_chars=RESUME_MAX_CHARS, sandbox=sandbox
+            )
+            resume_text = resume_doc.raw_text
+            if job_description:
+                job_description = as_document(job_description)  # cleaned once for every check
             
             # Calculate scores for each category
-            scores = {}
-            total_score = 0
-            
-            for category, config in self.ats_criteria.items():
-                category_score = self._calculate_category_score(
-                    category, resume_text, resume_tokens, job_description
-                )
-                scores[category] = {
-                    'score': category_score,
-                    'weight': config['weight'],
-                    'weighted_score': category_score * config['weight']
-                }
-                total_score += scores[category]['weighted_score']
+            scores, total_score = self.weigh_scores(self._score_document(resume_doc, job_description))
             
             # Generate recommendations
             recommendations = self._generate_recommendations(scores, resume_text)
@@ -94,9 +62,19 @@ class ATSAnalyzer:
                 'overall_score': round(total_score * 100, 1),
                 'category_scores': scores,
                 'recommendations': recommendations,
+                'missing_skills': self.skill_gap(resume_text, job_description, resume_doc) if job_description else [],
+                'improvements': [improvement._asdict() for improvement in
+                                 self.rank_improvements(resume_doc, job_description)],
                 'resume_text': resume_text
             }
             
+        except ExtractionError as e:
+            return {
+                'overall_score': 0,
+                **e.as_dict(),
+                'category_scores': {},
+                'recommendations': ['Error processing resume. Please check file format.']
+            }
         except Exception as e:
             return {
                 'overall_score': 0,
@@ -104,276 +82,227 @@ class ATSAnalyzer:
                 'category_scores': {},
                 'recommendations': ['Error processing resume. Please check file format.']
             }
-    
-    def _calculate_category_score(self, category: str, resume_text: str, 
-                                resume_tokens: List[str], job_description: str = None) -> float:
-        """Calculate score for a specific ATS category"""
-        
-        if category == 'format_compatibility':
-            return self._check_format_compatibility(resume_text)
-        elif category == 'keyword_optimization':
-            return self._check_keyword_optimization(resume_text, resume_tokens, job_description)
-        elif category == 'structure_quality':
-            return self._check_structure_quality(resume_text)
-        elif category == 'content_quality':
-            return self._check_content_quality(resume_text, resume_tokens)
-        
-        return 0.0
+
+    def _score_document(self, resume_doc: ParsedDocument, job_description: str | ParsedDocument = None) -> Dict[str, float]:
+        """{category: score} for a loaded resume, from one run of the plan"""
+        plan = self.plan
+        return plan.evaluate(plan.context(resume_doc.raw_text, resume_doc, layout=resume_doc.layout,
+                                          job_description=job_description))
+
     @task
-    def check_format_compatibility(self, resume_text: str) -> float:
-        """Check resume format compatibility with ATS systems"""
-        score = 0.0
-        checks = 0
-        
-        # Check for standard sections
-        standard_sections = ['experience', 'education', 'skills', 'summary', 'objective']
-        found_sections = sum(1 for section in standard_sections 
-                           if section.lower() in resume_text.lower())
-        score += (found_sections / len(standard_sections)) * 0.3
-        checks += 1
-        
-        # Check for problematic elements
-        problematic_patterns = [
-            r'<table>', r'<img>', r'<graphic>', r'<image>',
-            r'columns?', r'table', r'graphic', r'image'
-        ]
-        
-        has_problematic = any(re.search(pattern, resume_text.lower()) 
-                            for pattern in problematic_patterns)
-        if not has_problematic:
-            score += 0.3
-        checks += 1
-        
-        # Check for standard fonts (basic check)
-        font_patterns = [r'arial', r'times', r'calibri', r'helvetica']
-        has_standard_font = any(re.search(pattern, resume_text.lower()) 
-                              for pattern in font_patterns)
-        if has_standard_font or not re.search(r'font', resume_text.lower()):
-            score += 0.2
-        checks += 1
-        
-        # Check file format (assuming PDF is good)
-        score += 0.2  # PDF is ATS-friendly
-        checks += 1
-        
-        return min(score, 1.0)
+    def score_categories(self, resume_doc: ParsedDocument, job_description: str | ParsedDocument = None) -> Dict[str, float]:
+        """Runs every check of the plan on a loaded resume; returns {category: score}"""
+        return self._score_document(resume_doc, job_description)
+
+    def weigh_scores(self, category_scores: Dict[str, float]) -> Tuple[Dict, float]:
+        """Applies the category weights: ({category: {'score', 'weight', 'weighted_score'}}, total in [0, 1])"""
+        scores = {}
+        total_score = 0
+        for category, score in category_scores.items():
+            weight = self.ats_criteria[category]['weight']
+            scores[category] = {
+                'score': score,
+                'weight': weight,
+                'weighted_score': score * weight
+            }
+            total_score += scores[category]['weighted_score']
+        return scores, total_score
+
+    def start_session(self, resume: str | ParsedDocument, job_description: str | ParsedDocument = None,
+                      layout: LayoutFacts = None, tokenizer=None) -> ATSSession:
+        """
+        An ATSSession that keeps the scores of `resume` current as its text is edited,
+        re-scanning only the changed lines (see core.ats_session). The format checks use
+        `layout`, or a ParsedDocument's own layout facts.
+        """
+        if layout is None:
+            layout = getattr(resume, 'layout', None)
+        return ATSSession(self, raw_text_of(resume), job_description, layout, tokenizer)
+
+    def rank_improvements(self, resume: str | ParsedDocument, job_description: str | ParsedDocument = None,
+                          top_n: int = 10, tokenizer=None) -> List[Improvement]:
+        """
+        The missing JD keywords, skills, rule keywords (action verbs, ...) and sections
+        ranked by the exact overall score gain adding each would bring (see core.ats_whatif).
+        """
+        if tokenizer is None:
+            from core.utils import clean_text
+            tokenizer = clean_text
+        resume = as_document(resume)
+        plan = self.plan
+        context = plan.context(resume.raw_text, resume, layout=resume.layout, job_description=job_description)
+        return rank_improvements(plan, context, tokenizer, top_n)
+
+    def _check(self, category: str, resume_text: str, resume_tokens=None, sections: SectionIndex = None,
+               layout: LayoutFacts = None, job_description=None) -> float:
+        plan = self.plan
+        return plan.category_score(category, plan.context(resume_text, resume_tokens, sections, layout, job_description))
+
     @task
-    def check_keyword_optimization(self, resume_text: str, resume_tokens: List[str], 
-                                  job_description: str = None) -> float:
-        """Check keyword optimization"""
-        score = 0.0
-        
-        # Common industry keywords
-        industry_keywords = [
-            'python', 'machine learning', 'ai', 'data analysis', 'sql',
-            'javascript', 'react', 'node', 'api', 'database', 'cloud',
-            'aws', 'azure', 'docker', 'kubernetes', 'git', 'agile'
-        ]
-        
-        found_keywords = sum(1 for keyword in industry_keywords 
-                           if keyword.lower() in resume_text.lower())
-        score += min(found_keywords / 10, 1.0) * 0.4
-        
-        # Action verbs
-        action_verbs = [
-            'developed', 'implemented', 'managed', 'led', 'created',
-            'designed', 'built', 'optimized', 'improved', 'delivered'
-        ]
-        
-        found_verbs = sum(1 for verb in action_verbs 
-                         if verb.lower() in resume_text.lower())
-        score += min(found_verbs / 5, 1.0) * 0.3
-        
-        # Job description keyword matching
-        if job_description:
-            jd_tokens = clean_text(job_description)
-            common_tokens = set(resume_tokens) & set(jd_tokens)
-            if len(jd_tokens) > 0:
-                keyword_match_ratio = len(common_tokens) / len(jd_tokens)
-                score += min(keyword_match_ratio * 2, 1.0) * 0.3
-        else:
-            score += 0.3  # Default score if no job description
-        
-        return min(score, 1.0)
+    def check_format_compatibility(self, resume_text: str, sections: SectionIndex = None,
+                                   layout: LayoutFacts = None) -> float:
+        """
+        Check resume format compatibility with ATS systems. `sections` defaults to segmenting resume_text.
+        `layout` holds the images, tables, columns and fonts recorded while the file was extracted
+        (ParsedDocument.layout); without it (pasted text) they are guessed from the text.
+        """
+        return self._check('format_compatibility', resume_text, sections=sections, layout=layout)
+
+    @task
+    def check_keyword_optimization(self, resume_text: str, resume_tokens: List[str] | ParsedDocument, 
+                                  job_description: str | ParsedDocument = None) -> float:
+        """
+        Check keyword optimization. Tokens and JD may be passed as ParsedDocuments to avoid
+        re-cleaning; their taxonomy skills are then extracted once and shared.
+        """
+        return self._check('keyword_optimization', resume_text, resume_tokens, job_description=job_description)
+    
+    @staticmethod
+    def _skills_of(text: str, document=None) -> Dict:
+        """Taxonomy skills of `text`, reusing the ParsedDocument's cached extraction when given one"""
+        if isinstance(document, ParsedDocument):
+            return document.skills
+        return extract_skills(text)
+
+    def skill_gap(self, resume_text: str, job_description: str | ParsedDocument,
+                  resume_doc: ParsedDocument = None) -> List[str]:
+        """Taxonomy skills the job description asks for that the resume does not mention"""
+        jd_skills = self._skills_of(getattr(job_description, 'raw_text', job_description), job_description)
+        return missing_skills(self._skills_of(resume_text, resume_doc), jd_skills)
     
     @task
-    def check_structure_quality(self, resume_text: str) -> float:
-        """Check resume structure quality"""
-        score = 0.0
-        
-        # Check for contact information
-        contact_patterns = [
-            r'@\w+\.\w+',  # Email
-            r'\(\d{3}\)\s*\d{3}-\d{4}',  # Phone
-            r'\d{3}-\d{3}-\d{4}',  # Phone alternative
-            r'linkedin\.com',  # LinkedIn
-            r'github\.com'  # GitHub
-        ]
-        
-        contact_found = sum(1 for pattern in contact_patterns 
-                          if re.search(pattern, resume_text.lower()))
-        score += min(contact_found / 3, 1.0) * 0.25
-        
-        # Check for professional summary
-        summary_keywords = ['summary', 'profile', 'objective', 'about']
-        has_summary = any(keyword in resume_text.lower() for keyword in summary_keywords)
-        if has_summary:
-            score += 0.2
-        
-        # Check for work experience section
-        experience_keywords = ['experience', 'employment', 'work history', 'career']
-        has_experience = any(keyword in resume_text.lower() for keyword in experience_keywords)
-        if has_experience:
-            score += 0.2
-        
-        # Check for education section
-        education_keywords = ['education', 'degree', 'university', 'college', 'bachelor', 'master']
-        has_education = any(keyword in resume_text.lower() for keyword in education_keywords)
-        if has_education:
-            score += 0.2
-        
-        # Check for skills section
-        skills_keywords = ['skills', 'technical skills', 'competencies', 'expertise']
-        has_skills = any(keyword in resume_text.lower() for keyword in skills_keywords)
-        if has_skills:
-            score += 0.15
-        
-        return min(score, 1.0)
+    def check_structure_quality(self, resume_text: str, sections: SectionIndex = None) -> float:
+        """
+        Check resume structure quality. Sections found by the segmenter are looked up
+        directly; the keyword scan is only the fallback for resumes without that heading.
+        """
+        return self._check('structure_quality', resume_text, sections=sections)
+
     @task
-    def check_content_quality(self, resume_text: str, resume_tokens: List[str]) -> float:
+    def check_content_quality(self, resume_text: str, resume_tokens: List[str] | ParsedDocument) -> float:
         """Check content quality"""
-        score = 0.0
-        
-        # Check for quantified achievements
-        quantified_patterns = [
-            r'\d+%', r'\$\d+', r'\d+x', r'\d+\+', r'\d+ years?',
-            r'increased by \d+', r'reduced by \d+', r'improved by \d+'
-        ]
-        
-        quantified_found = sum(1 for pattern in quantified_patterns 
-                             if re.search(pattern, resume_text.lower()))
-        score += min(quantified_found / 3, 1.0) * 0.3
-        
-        # Check resume length (not too short, not too long)
-        word_count = len(resume_tokens)
-        if 200 <= word_count <= 800:
-            score += 0.3
-        elif 100 <= word_count < 200 or 800 < word_count <= 1200:
-            score += 0.15
-        
-        # Check for consistent formatting (basic check)
-        lines = resume_text.split('\n')
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
-        if len(non_empty_lines) > 10:  # Reasonable number of sections
-            score += 0.2
-        
-        # Check for professional tone (basic keyword check)
-        professional_keywords = ['achieved', 'developed', 'implemented', 'managed', 'led']
-        professional_found = sum(1 for keyword in professional_keywords 
-                               if keyword.lower() in resume_text.lower())
-        score += min(professional_found / 3, 1.0) * 0.2
-        
-        return min(score, 1.0)
-    
-    @task
-    def generate_recommendations(self, scores: Dict, resume_text: str) -> List[str]:
+        return self._check('content_quality', resume_text, resume_tokens)
+
+    def score_matrix(self, resumes: List[str | ParsedDocument], job_descriptions: List[str | ParsedDocument],
+                     chunk_cells: int = BATCH_CHUNK_CELLS) -> ATSScoreMatrix:
+        """
+        Score every resume against every job description: many resumes for one posting,
+        or one resume for many postings. Returns an ATSScoreMatrix of N×M arrays.
+
+        Only the plan's pair rules (job-description keyword matching) depend on the pair, so
+        each resume runs the other rules once and becomes one sparse token row, and each job
+        description one column of its cached keyword profile (core.jd_keywords); the pair
+        rules come from sparse products and the category weights from one
+        matrix product, a block of `chunk_cells` pairs at a time. Pass ParsedDocuments (from
+        load_resume_document) to reuse their cleaning, sections and layout; a falsy job
+        description scores like calculate_ats_score without one.
+        """
+        resumes = [as_document(resume) for resume in resumes]
+        jds = [jd if jd else None for jd in job_descriptions]
+        plan = self.plan
+        categories = plan.categories
+        weights = np.array([plan.weights[category] for category in categories])
+        pair_rules = {}     # column -> job description rules of that category
+        for category, rule in plan.pair_rules:
+            pair_rules.setdefault(categories.index(category), []).append(rule)
+        kinds = {rule['type'] for _, rule in plan.pair_rules}
+
+        # Resume-only rules, one row per resume; columns with pair rules stay uncapped sums
+        resume_scores = np.empty((len(resumes), len(categories)))
+        for i, doc in enumerate(resumes):
+            context = plan.context(doc.raw_text, doc, layout=doc.layout)
+            resume_scores[i] = [plan.category_score(category, context, pairs=False) for category in categories]
+        for column in range(len(categories)):
+            if column not in pair_rules:
+                resume_scores[:, column] = np.minimum(resume_scores[:, column], 1.0)
+
+        # Job descriptions as token columns (jd_overlap) and keyword weight columns (jd_keywords)
+        has_jd = np.array([jd is not None for jd in jds], dtype=bool)
+        jd_docs = [as_document(jd) if jd is not None else None for jd in jds] if 'jd_overlap' in kinds else None
+        # Every id in this batch comes from one vocabulary
+        vocabulary = SHARED_VOCABULARY.acquire()
+        profiles = [jd_keyword_profile(jd, vocabulary) if jd is not None else None for jd in jds] \
+            if 'jd_keywords' in kinds else None
+        resume_matrix = token_matrix(resumes, vocabulary)
+        jd_matrix = token_matrix(jd_docs, vocabulary) if jd_docs is not None else None
+        width = len(vocabulary)
+        resume_matrix.resize((len(resumes), width))
+        non_empty = {}      # rule type -> which job descriptions have any tokens
+        if jd_docs is not None:
+            jd_matrix.resize((len(jds), width))
+            jd_columns = jd_matrix.T.tocsc()
+            jd_lengths = np.array([len(jd) if jd is not None else 0 for jd in jd_docs], dtype=float)
+            non_empty['jd_overlap'] = jd_lengths > 0
+        if profiles is not None:
+            weight_columns = profile_matrix(profiles, width)
+            non_empty['jd_keywords'] = np.array([profile is not None and len(profile) > 0 for profile in profiles])
+
+        pair_scores = {column: np.empty((len(resumes), len(jds))) for column in pair_rules}
+        overall = np.empty((len(resumes), len(jds)))
+        step = chunk_rows(len(jds), chunk_cells)
+        for start in range(0, len(resumes), step):
+            rows = slice(start, start + step)
+            matches = {}    # rule type -> the pair values it scales by `factor`
+            if jd_docs is not None:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    matches['jd_overlap'] = shared_tokens(resume_matrix[rows], jd_columns) / jd_lengths
+            if profiles is not None:
+                matches['jd_keywords'] = keyword_coverage(resume_matrix[rows], weight_columns)
+            block = np.repeat(resume_scores[rows, None, :], len(jds), axis=1)
+            for column, rules in pair_rules.items():
+                score = block[:, :, column]
+                for rule in rules:
+                    # No job description: the rule's default; one without tokens adds nothing
+                    no_match = np.where(has_jd, 0.0, rule.get('default', 0.0))
+                    kind = rule['type']
+                    score = score + np.where(non_empty[kind],
+                                             np.minimum(matches[kind] * rule['factor'], 1.0) * rule['points'],
+                                             no_match)
+                pair_scores[column][rows] = block[:, :, column] = np.minimum(score, 1.0)
+            overall[rows] = block @ weights * 100
+
+        category_scores = {
+            category: pair_scores[column] if column in pair_scores
+            else np.broadcast_to(resume_scores[:, column, None], overall.shape)
+            for column, category in enumerate(categories)
+        }
+        return ATSScoreMatrix(overall, category_scores)
+
+    def _generate_recommendations(self, scores: Dict, resume_text: str) -> List[str]:
         """Generate improvement recommendations based on scores"""
         recommendations = []
         
         for category, data in scores.items():
-            score = data['score']
-            
-            if category == 'format_compatibility' and score < 0.7:
-                recommendations.append("Improve format compatibility: Use standard fonts, avoid tables/graphics, ensure proper file format")
-            
-            elif category == 'keyword_optimization' and score < 0.7:
-                recommendations.append("Optimize keywords: Include more industry-specific terms and action verbs")
-            
-            elif category == 'structure_quality' and score < 0.7:
-                recommendations.append("Improve structure: Ensure all standard sections (contact, summary, experience, education, skills) are present")
-            
-            elif category == 'content_quality' and score < 0.7:
-                recommendations.append("Enhance content: Add quantified achievements and maintain professional tone")
+            recommendation = self.ats_criteria[category].get('recommendation')
+            if recommendation and data['score'] < 0.7:
+                recommendations.append(recommendation)
         
         if not recommendations:
             recommendations.append("Great job! Your resume has good ATS compatibility.")
         
         return recommendations
 
-def create_ats_score_circle(score: float, save_path: str = None) -> str:
+    @task
+    def generate_recommendations(self, scores: Dict, resume_text: str) -> List[str]:
+        """Generate improvement recommendations based on scores"""
+        return self._generate_recommendations(scores, resume_text)
+
+def create_ats_score_circle(score: float, save_path: str = None, size: int = GAUGE_SIZE, theme: str = 'light') -> str:
     """
-    Create a circular percentage display for ATS score
+    Create a circular percentage display for ATS score (see core.ats_gauge)
     
     Args:
         score: ATS score (0-100)
-        save_path: Optional path to save the image
+        save_path: Optional path to save the image; PNG for a .png path, SVG otherwise
+        size: Width and height in pixels
+        theme: 'light' or 'dark'
         
     Returns:
-        Path to saved image or displays the plot
+        Path to saved image, or the SVG markup when no path is given
     """
-    # Create figure and axis
-    fig, ax = plt.subplots(figsize=(8, 8))
-    ax.set_xlim(-1.1, 1.1)
-    ax.set_ylim(-1.1, 1.1)
-    ax.set_aspect('equal')
-    
-    # Remove axes
-    ax.axis('off')
-    
-    # Define colors based on score
-    if score >= 80:
-        color = '#2E8B57'  # Sea Green
-        bg_color = '#E8F5E8'
-    elif score >= 60:
-        color = '#FF8C00'  # Dark Orange
-        bg_color = '#FFF8E8'
-    else:
-        color = '#DC143C'  # Crimson
-        bg_color = '#FFE8E8'
-    
-    # Create background circle
-    background_circle = Circle((0, 0), 1, color=bg_color, alpha=0.3)
-    ax.add_patch(background_circle)
-    
-    # Create progress circle
-    theta = np.linspace(0, 2 * np.pi * (score / 100), 1000)
-    x = np.cos(theta)
-    y = np.sin(theta)
-    
-    # Plot the progress arc
-    ax.plot(x, y, color=color, linewidth=20, alpha=0.8)
-    
-    # Add score text
-    ax.text(0, 0.1, f'{score:.1f}%', fontsize=48, fontweight='bold', 
-            ha='center', va='center', color=color)
-    ax.text(0, -0.2, 'ATS Score', fontsize=20, fontweight='normal', 
-            ha='center', va='center', color='#333333')
-    
-    # Add title
-    ax.text(0, 1.3, 'Resume ATS Compatibility', fontsize=24, fontweight='bold', 
-            ha='center', va='center', color='#333333')
-    
-    # Add score interpretation
-    if score >= 80:
-        interpretation = "Excellent ATS Compatibility"
-    elif score >= 60:
-        interpretation = "Good ATS Compatibility"
-    else:
-        interpretation = "Needs Improvement"
-    
-    ax.text(0, -0.4, interpretation, fontsize=16, fontweight='normal', 
-            ha='center', va='center', color=color)
-    
-    plt.tight_layout()
-    
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close()
-        return save_path
-    else:
-        plt.show()
-        return ""
+        return save_gauge(score, save_path, size, theme)
+    return gauge_svg(score, size, theme)
 
 # Example usage and testing
 if __name__ == "__main__":
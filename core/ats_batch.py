@@ -0,0 +1,87 @@
+"""
+Sparse matrices for scoring many resumes against many job descriptions at once.
+
+Every document becomes one binary row over the shared token vocabulary (1 where the
+token occurs at least once). The number of distinct tokens a resume shares with a job
+description, which the keyword check compares with the JD's length, is then a single
+sparse product for a whole block of resume × JD pairs. With job descriptions as
+weighted keyword columns (core.jd_keywords) the same product gives each pair's
+weighted keyword coverage.
+"""
+from typing import Collection, Dict, List, NamedTuple, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from core.document import SHARED_VOCABULARY, ParsedDocument, Vocabulary
+from core.jd_keywords import JDKeywordProfile
+
+# Resume rows are scored in blocks of about this many resume × JD cells, bounding the
+# dense intermediates whatever the batch size
+BATCH_CHUNK_CELLS = 1 << 20
+
+
+class ATSScoreMatrix(NamedTuple):
+    """Scores of every resume (rows) against every job description (columns)."""
+    overall: np.ndarray          # N×M weighted totals, 0-100 like 'overall_score'
+    category_scores: Dict[str, np.ndarray]  # ats_criteria category -> N×M scores in [0, 1]
+
+
+def token_matrix(documents: Sequence[ParsedDocument], vocabulary: Vocabulary = None) -> sparse.csr_matrix:
+    """Binary documents × vocabulary matrix of which distinct tokens each document contains."""
+    if vocabulary is None:
+        vocabulary = SHARED_VOCABULARY.acquire()
+    rows: List[np.ndarray] = []
+    for document in documents:
+        if document is None:
+            ids = ()
+        elif document.vocabulary is vocabulary:
+            ids = document.token_id_set
+        else:
+            ids = vocabulary.encode(document.token_set)
+        # Sorted, so sums over a row always run in the same order
+        rows.append(np.sort(np.fromiter(ids, dtype=np.int64, count=len(ids))))
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=indptr[1:])
+    indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(vocabulary)))
+
+
+def chunk_rows(columns: int, chunk_cells: int = BATCH_CHUNK_CELLS) -> int:
+    """Resume rows per block so that a block holds about `chunk_cells` pairs."""
+    return max(1, chunk_cells // max(columns, 1))
+
+
+def shared_tokens(resume_rows: sparse.csr_matrix, jd_columns: sparse.csc_matrix) -> np.ndarray:
+    """Dense block of distinct tokens shared by each resume row and each JD column."""
+    return (resume_rows @ jd_columns).toarray()
+
+
+def profile_matrix(profiles: Sequence[JDKeywordProfile], width: int) -> sparse.csc_matrix:
+    """vocabulary (`width` rows) × profiles matrix of keyword weights; None profiles give empty columns."""
+    columns = [profile if profile is not None else JDKeywordProfile(np.zeros(0, np.int64), np.zeros(0))
+               for profile in profiles]
+    indptr = np.zeros(len(columns) + 1, dtype=np.int64)
+    np.cumsum([len(column) for column in columns], out=indptr[1:])
+    indices = np.concatenate([column.token_ids for column in columns]) if columns else np.zeros(0, np.int64)
+    data = np.concatenate([column.weights for column in columns]) if columns else np.zeros(0)
+    return sparse.csc_matrix((data, indices, indptr), shape=(width, len(columns)))
+
+
+def keyword_coverage(resume_rows: sparse.csr_matrix, weight_columns: sparse.csc_matrix) -> np.ndarray:
+    """Dense block of the summed JD keyword weight each resume row contains, per profile column."""
+    return (resume_rows @ weight_columns).toarray()
+
+
+def token_set_coverage(token_ids: Collection[int], profile: JDKeywordProfile) -> float:
+    """
+    The keyword coverage of one resume, given its distinct token ids (in the profile's vocabulary),
+    without building matrices. The matched weights are added one at a time in ascending
+    token id order, as keyword_coverage adds them, so both agree exactly.
+    """
+    present = np.fromiter(token_ids, dtype=np.int64, count=len(token_ids))
+    coverage = 0.0
+    for weight in profile.weights[np.isin(profile.token_ids, present)].tolist():
+        coverage += weight
+    return coverage
@@ -0,0 +1,100 @@
+"""
+Single-pass feature scan for the ATS rules.
+
+Every keyword list and regex the ATS rules look for (core.ats_rules) is compiled once
+into a FeatureScanner, and `scan` lowercases the resume once and walks it a single time.
+One pattern (the keywords folded into a prefix trie, plus the regexes) finds the next
+position where any feature can start; there every feature is tried in turn, and the
+walk resumes one character on, so overlapping and nested matches are all seen ("led"
+inside "skilled", "improved" at the start of "improved by 20"). A feature is therefore
+present exactly when `re.search` of its pattern (or `in` for a keyword) succeeds on the
+lowercased text, which keeps scores identical to checking each pattern on its own.
+
+The result is a feature-count vector, one count per distinct pattern in `features`,
+that every rule reads through `count_present` and `keyword_hits`.
+"""
+import functools
+import re
+from typing import Dict, List, Sequence, Tuple
+
+
+def _keyword_trie(keywords) -> str:
+    """A regex matching any of `keywords`, factored on shared prefixes so each position costs one branch"""
+    branches = {}
+    for keyword in keywords:
+        branches.setdefault(keyword[0], []).append(keyword[1:])
+    alternatives = []
+    for char, rests in sorted(branches.items()):
+        rest = _keyword_trie([r for r in rests if r]) if any(rests) else ''
+        if rest:
+            rest = f"(?:{rest}){'?' if '' in rests else ''}"
+        alternatives.append(re.escape(char) + rest)
+    return '|'.join(alternatives)
+
+
+class FeatureScanner:
+    """
+    Named groups of keywords (plain lowercase substrings) and regexes compiled into one scan.
+    A keyword or pattern shared by several groups is scanned once.
+    """
+    def __init__(self, keyword_groups: Dict[str, Sequence[str]], pattern_groups: Dict[str, Sequence[str]]):
+        self.keyword_groups = {name: tuple(keywords) for name, keywords in keyword_groups.items()}
+        for name, keywords in self.keyword_groups.items():
+            if not all(keywords) or any(keyword != keyword.lower() for keyword in keywords):
+                raise ValueError(f"keywords of {name!r} must be non-empty lowercase strings")
+        groups = {name: [re.escape(keyword) for keyword in keywords] for name, keywords in self.keyword_groups.items()}
+        for name, patterns in pattern_groups.items():
+            if name in groups:
+                raise ValueError(f"feature group {name!r} is declared twice")
+            groups[name] = list(patterns)
+
+        features, index, self.groups = [], {}, {}
+        for name, patterns in groups.items():
+            for pattern in patterns:
+                if re.compile(pattern).groups:
+                    raise ValueError(f"ATS feature pattern {pattern!r} must not contain capturing groups")
+                if pattern not in index:
+                    index[pattern] = len(features)
+                    features.append(pattern)
+            self.groups[name] = tuple(index[pattern] for pattern in patterns)
+        self.features = tuple(features)
+
+        keywords = sorted({keyword for group in self.keyword_groups.values() for keyword in group})
+        regexes = [f'(?:{pattern})' for patterns in pattern_groups.values() for pattern in patterns]
+        # Finds the next position where any feature may start
+        self._finder = re.compile('|'.join(([_keyword_trie(keywords)] if keywords else []) + regexes))
+        # _scanners[i] tries features i.. in order at one position; the empty group after each
+        # feature is the only group, so match.lastindex says which one matched
+        alternatives = [f'(?:{pattern})()' for pattern in features]
+        self._scanners = tuple(re.compile('|'.join(alternatives[i:])) for i in range(len(features)))
+        # The rules of one resume share a single scan
+        self.scan = functools.lru_cache(maxsize=64)(self._scan)
+
+    def _scan(self, text: str) -> Tuple[int, ...]:
+        """Counts, for every pattern in `features`, the positions of the lowercased text where it matches."""
+        total = len(self.features)
+        if not total:
+            return ()
+        counts = [0] * total
+        text = text.lower()
+        scanners = self._scanners
+        search = self._finder.search
+        pos = 0
+        while (found := search(text, pos)) is not None:
+            start = found.start()
+            feature = 0
+            # Every feature matching here, not just the first alternative
+            while feature < total and (match := scanners[feature].match(text, start)) is not None:
+                feature += match.lastindex - 1
+                counts[feature] += 1
+                feature += 1
+            pos = start + 1
+        return tuple(counts)
+
+    def count_present(self, features: Tuple[int, ...], group: str) -> int:
+        """How many distinct patterns of `group` occur at least once"""
+        return sum(1 for i in self.groups[group] if features[i])
+
+    def keyword_hits(self, features: Tuple[int, ...], group: str) -> List[Tuple[str, bool]]:
+        """(keyword, occurs in the text) for each keyword of a keyword group"""
+        return [(keyword, features[i] > 0) for keyword, i in zip(self.keyword_groups[group], self.groups[group])]
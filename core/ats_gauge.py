@@ -0,0 +1,147 @@
+"""
+ATS score gauge rendering.
+
+The gauge is a ring filled clockwise from the top in the score band's color, with the
+score, "ATS Score" and the band's verdict in the middle. `gauge_svg` writes the SVG
+markup directly, with no plotting library involved; `gauge_png` rasterizes the same
+drawing with matplotlib's Agg canvas (an explicit Figure, never pyplot's global state)
+only when a PNG is asked for. Both are memoized by (score rounded to the displayed
+0.1, size, theme), so re-rendering the same score in a batch run or a UI rerun is a
+cache lookup.
+"""
+import functools
+import io
+import math
+from typing import Dict, NamedTuple
+from xml.sax.saxutils import escape
+
+GAUGE_SIZE = 400        # pixels, width and height
+GAUGE_PNG_DPI = 100
+_CACHE_SIZE = 1024
+
+# Drawing units; the SVG viewBox and the PNG axes are both VIEW × VIEW
+VIEW = 120
+_CENTER = (60, 66)
+_RADIUS = 40
+_STROKE = 9
+
+
+class GaugeTheme(NamedTuple):
+    background: str
+    text: str
+    track: str
+    fill_opacity: float     # of the band's pale fill inside the ring
+
+
+GAUGE_THEMES: Dict[str, GaugeTheme] = {
+    'light': GaugeTheme(background='#FFFFFF', text='#333333', track='#E6E6E6', fill_opacity=0.3),
+    'dark': GaugeTheme(background='#0E1117', text='#FAFAFA', track='#31333F', fill_opacity=0.08),
+}
+
+# (lowest score, ring color, inner fill, verdict), best band first
+SCORE_BANDS = [
+    (80, '#2E8B57', '#E8F5E8', "Excellent ATS Compatibility"),  # Sea Green
+    (60, '#FF8C00', '#FFF8E8', "Good ATS Compatibility"),       # Dark Orange
+    (0, '#DC143C', '#FFE8E8', "Needs Improvement"),             # Crimson
+]
+
+
+def score_band(score: float) -> tuple:
+    """(color, fill, verdict) of the band `score` falls in"""
+    for lowest, color, fill, verdict in SCORE_BANDS:
+        if score >= lowest:
+            break
+    return color, fill, verdict
+
+
+def _key(score: float, size: int, theme: str) -> tuple:
+    if theme not in GAUGE_THEMES:
+        raise ValueError(f"Unknown gauge theme {theme!r}. Available: {', '.join(GAUGE_THEMES)}")
+    return round(min(max(float(score), 0.0), 100.0), 1), int(size), theme
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _svg(score: float, size: int, theme_name: str) -> str:
+    theme = GAUGE_THEMES[theme_name]
+    color, fill, verdict = score_band(score)
+    cx, cy = _CENTER
+    circumference = 2 * math.pi * _RADIUS
+    filled = circumference * score / 100
+    text = 'text-anchor="middle" dominant-baseline="central" font-family="Helvetica, Arial, sans-serif"'
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {VIEW} {VIEW}" '
+        f'role="img" aria-label="ATS score {score:.1f}%">'
+        f'<rect width="{VIEW}" height="{VIEW}" fill="{theme.background}"/>'
+        f'<text x="{cx}" y="10" {text} font-size="7" font-weight="bold" fill="{theme.text}">'
+        f'Resume ATS Compatibility</text>'
+        f'<circle cx="{cx}" cy="{cy}" r="{_RADIUS + _STROKE / 2}" fill="{fill}" fill-opacity="{theme.fill_opacity}"/>'
+        f'<circle cx="{cx}" cy="{cy}" r="{_RADIUS}" fill="none" stroke="{theme.track}" stroke-width="{_STROKE}"/>'
+        f'<circle cx="{cx}" cy="{cy}" r="{_RADIUS}" fill="none" stroke="{color}" stroke-width="{_STROKE}" '
+        f'stroke-opacity="0.8" stroke-dasharray="{filled:.3f} {circumference:.3f}" '
+        f'transform="rotate(-90 {cx} {cy})"/>'
+        f'<text x="{cx}" y="{cy - 6}" {text} font-size="16" font-weight="bold" fill="{color}">{score:.1f}%</text>'
+        f'<text x="{cx}" y="{cy + 8}" {text} font-size="6" fill="{theme.text}">ATS Score</text>'
+        f'<text x="{cx}" y="{cy + 16}" {text} font-size="4.5" fill="{color}">{escape(verdict)}</text>'
+        f'</svg>'
+    )
+
+
+def gauge_svg(score: float, size: int = GAUGE_SIZE, theme: str = 'light') -> str:
+    """SVG markup of the score gauge (score 0-100), `size` pixels square"""
+    return _svg(*_key(score, size, theme))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _png(score: float, size: int, theme_name: str, dpi: int) -> bytes:
+    # The Agg canvas directly: no pyplot, so no global figure registry or GUI backend
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Arc, Circle
+
+    theme = GAUGE_THEMES[theme_name]
+    color, fill, verdict = score_band(score)
+    figure = Figure(figsize=(size / dpi, size / dpi), dpi=dpi, facecolor=theme.background)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.set_xlim(0, VIEW)
+    ax.set_ylim(VIEW, 0)    # y down, like the SVG
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    points = size / VIEW * 72 / dpi     # one drawing unit in points
+    cx, cy = _CENTER
+    ax.add_patch(Circle(_CENTER, _RADIUS + _STROKE / 2, facecolor=fill, alpha=theme.fill_opacity, edgecolor='none'))
+    ax.add_patch(Circle(_CENTER, _RADIUS, fill=False, edgecolor=theme.track, linewidth=_STROKE * points))
+    if score > 0:
+        # Clockwise from the top; with y pointing down, angles increase clockwise
+        ax.add_patch(Arc(_CENTER, 2 * _RADIUS, 2 * _RADIUS, theta1=-90, theta2=-90 + 3.6 * score,
+                         edgecolor=color, alpha=0.8, linewidth=_STROKE * points))
+    text = dict(ha='center', va='center', family='sans-serif')
+    ax.text(cx, 10, 'Resume ATS Compatibility', fontsize=7 * points, fontweight='bold', color=theme.text, **text)
+    ax.text(cx, cy - 6, f'{score:.1f}%', fontsize=16 * points, fontweight='bold', color=color, **text)
+    ax.text(cx, cy + 8, 'ATS Score', fontsize=6 * points, color=theme.text, **text)
+    ax.text(cx, cy + 16, verdict, fontsize=4.5 * points, color=color, **text)
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png', dpi=dpi, facecolor=theme.background)
+    return buffer.getvalue()
+
+
+def gauge_png(score: float, size: int = GAUGE_SIZE, theme: str = 'light', dpi: int = GAUGE_PNG_DPI) -> bytes:
+    """PNG bytes of the score gauge, `size` pixels square"""
+    return _png(*_key(score, size, theme), int(dpi))
+
+
+def save_gauge(score: float, path: str, size: int = GAUGE_SIZE, theme: str = 'light') -> str:
+    """Writes the gauge to `path`, as PNG for a .png path and SVG otherwise; returns the path"""
+    if path.lower().endswith('.png'):
+        with open(path, 'wb') as f:
+            f.write(gauge_png(score, size, theme))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(gauge_svg(score, size, theme))
+    return path
+
+
+def gauge_cache_info() -> dict:
+    return {'svg': _svg.cache_info()._asdict(), 'png': _png.cache_info()._asdict()}
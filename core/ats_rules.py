@@ -0,0 +1,398 @@
+"""
+Declarative ATS checks compiled into one execution plan.
+
+ATS_CRITERIA declares each category's weight, its recommendation and its rules as data:
+the keywords or regex patterns a rule looks for, its thresholds and the points it is
+worth. `compile_plan` turns a criteria dict into an ATSPlan. Every rule's keywords and
+patterns go into one FeatureScanner and each rule becomes a small function over a
+shared ResumeContext, so a resume is lowercased and scanned once, segmented once and
+its skills extracted once, however many rules and categories read them. Industry
+profiles (ATS_PROFILES) add categories of further rules to the same plan at no extra
+pass over the text. calculate_ats_score, the Prefect flow and the batch scorer all run
+the plan.
+
+Rule types:
+    constant        `points`, always
+    coverage        found / len(keywords) * points; with `or_section`, a keyword naming
+                    a section the segmenter found counts as found
+    count           min(found / target, 1) * points; found = distinct keywords and patterns present
+    absent          `points` if none of the keywords or patterns occur; with `layout_facts`,
+                    extracted files are judged on those LayoutFacts counts instead
+    standard_fonts  `points` if a standard font is named or `mention` never occurs; extracted
+                    files: if their LayoutFacts list no nonstandard font
+    section         `points` if the segmenter found `section`, else if any keyword occurs
+    skills          min(distinct technical taxonomy skills / target, 1) * points
+    word_count      points of the first [min, max, points] band the token count falls in
+    line_count      `points` if the text has more than `more_than` non-empty lines
+    jd_overlap      min(shared tokens / JD tokens * factor, 1) * points, or `default` without
+                    a job description
+    jd_keywords     min(keyword coverage * factor, 1) * points, or `default` without a job
+                    description; coverage is the share of the JD's BM25 keyword weight
+                    (core.jd_keywords) the resume contains
+
+jd_overlap and jd_keywords are pair rules: they are applied after the category's other rules.
+
+A category's score is the sum of its rules' points in order, capped at 1.
+"""
+import copy
+import functools
+import json
+from functools import cached_property
+from typing import Callable, Dict, List, Tuple
+
+from core.ats_batch import token_set_coverage
+from core.ats_features import FeatureScanner
+from core.document import SHARED_VOCABULARY, ParsedDocument, as_document, ids_in
+from core.jd_keywords import JDKeywordProfile, jd_keyword_profile
+from core.sections import segment_sections
+from core.skills import extract_skills, technical_skills
+
+ATS_CRITERIA = {
+    'format_compatibility': {
+        'weight': 0.25,
+        'recommendation': "Improve format compatibility: Use standard fonts, avoid tables/graphics, "
+                          "ensure proper file format",
+        'rules': [
+            {'check': 'has_standard_sections', 'type': 'coverage', 'or_section': True, 'points': 0.3,
+             'keywords': ['experience', 'education', 'skills', 'summary', 'objective']},
+            {'check': 'no_tables_graphics_or_columns', 'type': 'absent', 'points': 0.3,
+             'layout_facts': ['image_count', 'table_count', 'multi_column_pages'],
+             'patterns': [r'<table>', r'<img>', r'<graphic>', r'<image>',
+                          r'columns?', r'table', r'graphic', r'image']},
+            {'check': 'standard_fonts', 'type': 'standard_fonts', 'points': 0.2,
+             'keywords': ['arial', 'times', 'calibri', 'helvetica'], 'mention': ['font']},
+            {'check': 'proper_file_format', 'type': 'constant', 'points': 0.2},  # PDF is ATS-friendly
+        ],
+    },
+    'keyword_optimization': {
+        'weight': 0.30,
+        'recommendation': "Optimize keywords: Include more industry-specific terms and action verbs",
+        'rules': [
+            {'check': 'skill_keywords', 'type': 'skills', 'target': 10, 'points': 0.4},
+            {'check': 'action_verbs', 'type': 'count', 'target': 5, 'points': 0.3,
+             'keywords': ['developed', 'implemented', 'managed', 'led', 'created',
+                          'designed', 'built', 'optimized', 'improved', 'delivered']},
+            {'check': 'relevant_keywords', 'type': 'jd_keywords', 'factor': 2, 'points': 0.3, 'default': 0.3},
+        ],
+    },
+    'structure_quality': {
+        'weight': 0.25,
+        'recommendation': "Improve structure: Ensure all standard sections (contact, summary, experience, "
+                          "education, skills) are present",
+        'rules': [
+            {'check': 'clear_contact_info', 'type': 'count', 'target': 3, 'points': 0.25,
+             'patterns': [r'@\w+\.\w+', r'\(\d{3}\)\s*\d{3}-\d{4}', r'\d{3}-\d{3}-\d{4}',
+                          r'linkedin\.com', r'github\.com']},
+            {'check': 'professional_summary', 'type': 'section', 'section': 'summary', 'points': 0.2,
+             'keywords': ['summary', 'profile', 'objective', 'about']},
+            {'check': 'work_experience', 'type': 'section', 'section': 'experience', 'points': 0.2,
+             'keywords': ['experience', 'employment', 'work history', 'career']},
+            {'check': 'education_section', 'type': 'section', 'section': 'education', 'points': 0.2,
+             'keywords': ['education', 'degree', 'university', 'college', 'bachelor', 'master']},
+            {'check': 'skills_section', 'type': 'section', 'section': 'skills', 'points': 0.15,
+             'keywords': ['skills', 'technical skills', 'competencies', 'expertise']},
+        ],
+    },
+    'content_quality': {
+        'weight': 0.20,
+        'recommendation': "Enhance content: Add quantified achievements and maintain professional tone",
+        'rules': [
+            {'check': 'quantified_achievements', 'type': 'count', 'target': 3, 'points': 0.3,
+             'patterns': [r'\d+%', r'\$\d+', r'\d+x', r'\d+\+', r'\d+ years?',
+                          r'increased by \d+', r'reduced by \d+', r'improved by \d+']},
+            {'check': 'appropriate_length', 'type': 'word_count', 'bands': [[200, 800, 0.3], [100, 1200, 0.15]]},
+            {'check': 'consistent_formatting', 'type': 'line_count', 'more_than': 10, 'points': 0.2},
+            {'check': 'professional_tone', 'type': 'count', 'target': 3, 'points': 0.2,
+             'keywords': ['achieved', 'developed', 'implemented', 'managed', 'led']},
+        ],
+    },
+}
+
+# Extra categories per industry; their weight is taken proportionally from the base categories
+ATS_PROFILES = {
+    'software_engineering': {
+        'engineering_practices': {
+            'weight': 0.15,
+            'recommendation': "Show engineering practice: Mention testing, code review, CI/CD and "
+                              "links to your code",
+            'rules': [
+                {'check': 'delivery_practices', 'type': 'count', 'target': 3, 'points': 0.6,
+                 'keywords': ['unit test', 'integration test', 'code review', 'ci/cd', 'continuous integration',
+                              'agile', 'scrum', 'microservice', 'version control', 'git']},
+                {'check': 'code_links', 'type': 'count', 'target': 1, 'points': 0.4,
+                 'patterns': [r'github\.com', r'gitlab\.com', r'bitbucket\.org', r'stackoverflow\.com']},
+            ],
+        },
+    },
+    'healthcare': {
+        'clinical_credentials': {
+            'weight': 0.15,
+            'recommendation': "Highlight clinical credentials: List licenses, certifications and "
+                              "compliance experience (e.g. HIPAA)",
+            'rules': [
+                {'check': 'licenses_and_certifications', 'type': 'count', 'target': 2, 'points': 0.5,
+                 'keywords': ['licensed', 'license', 'certified', 'certification', 'board certified',
+                              'bls', 'acls', 'registered nurse']},
+                {'check': 'clinical_terms', 'type': 'count', 'target': 3, 'points': 0.5,
+                 'keywords': ['patient', 'clinical', 'hipaa', 'ehr', 'emr', 'care plan', 'compliance']},
+            ],
+        },
+    },
+}
+
+
+def with_profile(criteria: Dict, profile: str = None) -> Dict:
+    """A copy of `criteria` with the categories of ATS_PROFILES[profile] added and the weights rescaled"""
+    criteria = copy.deepcopy(criteria)
+    if not profile:
+        return criteria
+    if profile not in ATS_PROFILES:
+        raise ValueError(f"Unknown ATS profile {profile!r}. Available: {', '.join(sorted(ATS_PROFILES))}")
+    extra = copy.deepcopy(ATS_PROFILES[profile])
+    scale = 1 - sum(config['weight'] for config in extra.values())
+    for config in criteria.values():
+        config['weight'] *= scale
+    criteria.update(extra)
+    return criteria
+
+
+# Rule types that depend on the job description
+PAIR_RULE_TYPES = ('jd_overlap', 'jd_keywords')
+
+# The ResumeContext views each rule type reads
+RULE_VIEWS = {
+    'constant': (),
+    'coverage': ('features', 'sections'),
+    'count': ('features',),
+    'absent': ('features', 'layout'),
+    'standard_fonts': ('features', 'layout'),
+    'section': ('features', 'sections'),
+    'skills': ('skills',),
+    'word_count': ('word_count',),
+    'line_count': ('non_empty_lines',),
+    'jd_overlap': ('token_id_set', 'jd'),
+    'jd_keywords': ('token_id_set', 'jd_profile'),
+}
+
+
+class ResumeContext:
+    """
+    The views of one resume that rules share, each computed on first use. A view can be
+    set up front instead (as `sections` can be passed, or as core.ats_session does).
+    Token ids are in `vocabulary`: the resume document's, or the shared one's current
+    Vocabulary, held for the context's lifetime.
+    """
+
+    def __init__(self, scanner: FeatureScanner, text: str, tokens=None, sections=None, layout=None,
+                 job_description=None):
+        self.scanner = scanner
+        self.text = text
+        self.tokens = tokens
+        self.layout = layout
+        self.job_description = job_description
+        self.vocabulary = tokens.vocabulary if isinstance(tokens, ParsedDocument) else SHARED_VOCABULARY.acquire()
+        if sections is not None:
+            self.sections = sections
+
+    @cached_property
+    def features(self) -> Tuple[int, ...]:
+        return self.scanner.scan(self.text)
+
+    @cached_property
+    def sections(self):
+        if isinstance(self.tokens, ParsedDocument):
+            return self.tokens.sections
+        return segment_sections(self.text)
+
+    @cached_property
+    def skills(self) -> Dict:
+        if isinstance(self.tokens, ParsedDocument):
+            return self.tokens.skills
+        return extract_skills(self.text)
+
+    @cached_property
+    def document(self) -> ParsedDocument:
+        return as_document(self.text, self.tokens)
+
+    @cached_property
+    def token_id_set(self) -> frozenset:
+        return ids_in(self.document, self.vocabulary)
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.tokens if self.tokens is not None else self.document)
+
+    @cached_property
+    def non_empty_lines(self) -> int:
+        return sum(1 for line in self.text.split('\n') if line.strip())
+
+    @cached_property
+    def jd(self) -> ParsedDocument:
+        return as_document(self.job_description) if self.job_description else None
+
+    @cached_property
+    def jd_profile(self) -> JDKeywordProfile:
+        return jd_keyword_profile(self.job_description, self.vocabulary) if self.job_description else None
+
+    def found(self, groups: List[str]) -> int:
+        return sum(self.scanner.count_present(self.features, group) for group in groups)
+
+
+def _groups(rule: Dict, name: str, keyword_groups: Dict, pattern_groups: Dict, key: str = 'keywords') -> List[str]:
+    """Registers the rule's keywords and patterns with the scanner; returns their group names"""
+    groups = []
+    if rule.get(key):
+        keyword_groups[name] = [keyword.lower() for keyword in rule[key]]
+        groups.append(name)
+    if key == 'keywords' and rule.get('patterns'):
+        pattern_groups[name + ':patterns'] = list(rule['patterns'])
+        groups.append(name + ':patterns')
+    return groups
+
+
+def _compile_rule(rule: Dict, name: str, keyword_groups: Dict, pattern_groups: Dict) -> Callable:
+    kind = rule['type']
+    points = rule.get('points', 0.0)
+    if kind == 'constant':
+        return lambda ctx: points
+    if kind == 'skills':
+        target = rule['target']
+        return lambda ctx: min(len(technical_skills(ctx.skills)) / target, 1.0) * points
+    if kind == 'word_count':
+        bands = [tuple(band) for band in rule['bands']]
+
+        def word_count(ctx):
+            count = ctx.word_count
+            return next((band_points for low, high, band_points in bands if low <= count <= high), 0.0)
+        return word_count
+    if kind == 'line_count':
+        more_than = rule['more_than']
+        return lambda ctx: points if ctx.non_empty_lines > more_than else 0.0
+    if kind == 'jd_overlap':
+        factor, default = rule['factor'], rule.get('default', 0.0)
+
+        def jd_overlap(ctx):
+            if ctx.jd is None:
+                return default
+            if len(ctx.jd) == 0:
+                return 0.0
+            return min(len(ctx.token_id_set & ids_in(ctx.jd, ctx.vocabulary)) / len(ctx.jd) * factor, 1.0) * points
+        return jd_overlap
+    if kind == 'jd_keywords':
+        factor, default = rule['factor'], rule.get('default', 0.0)
+
+        def jd_keywords(ctx):
+            profile = ctx.jd_profile
+            if profile is None:
+                return default
+            if len(profile) == 0:
+                return 0.0
+            return min(token_set_coverage(ctx.token_id_set, profile) * factor, 1.0) * points
+        return jd_keywords
+
+    groups = _groups(rule, name, keyword_groups, pattern_groups)
+    if kind == 'coverage':
+        keywords = rule['keywords']
+        use_sections = rule.get('or_section', False)
+
+        def coverage(ctx):
+            hits = ctx.scanner.keyword_hits(ctx.features, name)
+            found = sum(1 for keyword, hit in hits if hit or (use_sections and keyword in ctx.sections))
+            return (found / len(keywords)) * points
+        return coverage
+    if kind == 'count':
+        target = rule['target']
+        return lambda ctx: min(ctx.found(groups) / target, 1.0) * points
+    if kind == 'section':
+        section = rule['section']
+        return lambda ctx: points if section in ctx.sections or ctx.found(groups) > 0 else 0.0
+    if kind == 'absent':
+        facts = rule.get('layout_facts')
+
+        def absent(ctx):
+            if facts and ctx.layout is not None:
+                present = any(getattr(ctx.layout, fact) for fact in facts)
+            else:
+                present = ctx.found(groups) > 0
+            return 0.0 if present else points
+        return absent
+    if kind == 'standard_fonts':
+        mention = _groups(rule, name + ':mention', keyword_groups, pattern_groups, key='mention')
+
+        def standard_fonts(ctx):
+            if ctx.layout is not None:
+                standard = not ctx.layout.nonstandard_fonts
+            else:
+                standard = ctx.found(groups) > 0 or not ctx.found(mention)
+            return points if standard else 0.0
+        return standard_fonts
+    raise ValueError(f"Unknown ATS rule type {kind!r} in {name}")
+
+
+class ATSPlan:
+    """A criteria dict compiled into one feature scan plus a function per rule."""
+
+    def __init__(self, criteria: Dict):
+        keyword_groups, pattern_groups = {}, {}
+        self.weights = {}
+        self.recommendations = {}
+        self._rules = {}        # category -> [rule function], pair rules last
+        self.pair_rules = []    # (category, rule) of the rules that depend on the job description
+        self.views = {}         # category -> the ResumeContext views its rules read
+        self.rule_specs = {}    # category -> [(rule, rule name)] in evaluation order
+        for category, config in criteria.items():
+            self.weights[category] = config['weight']
+            self.recommendations[category] = config.get('recommendation')
+            rules, pair, specs, pair_specs = [], [], [], []
+            for rule in config['rules']:
+                name = f"{category}.{rule['check']}"
+                function = _compile_rule(rule, name, keyword_groups, pattern_groups)
+                if rule['type'] in PAIR_RULE_TYPES:
+                    pair.append(function)
+                    pair_specs.append((rule, name))
+                    self.pair_rules.append((category, rule))
+                else:
+                    rules.append(function)
+                    specs.append((rule, name))
+            self._rules[category] = (rules, pair)
+            self.rule_specs[category] = specs + pair_specs
+            self.views[category] = frozenset(view for rule in config['rules'] for view in RULE_VIEWS[rule['type']])
+        self.scanner = FeatureScanner(keyword_groups, pattern_groups)
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self.weights)
+
+    def rule_groups(self, name: str, key: str = 'keywords') -> List[str]:
+        """The scanner groups of rule `name`: its keywords and patterns, or with key='mention' its mention keywords"""
+        suffixes = (':mention',) if key == 'mention' else ('', ':patterns')
+        return [name + suffix for suffix in suffixes if name + suffix in self.scanner.groups]
+
+    def context(self, text: str, tokens=None, sections=None, layout=None, job_description=None) -> ResumeContext:
+        return ResumeContext(self.scanner, text, tokens, sections, layout, job_description)
+
+    def category_score(self, category: str, context: ResumeContext, pairs: bool = True) -> float:
+        """The category's score; with pairs=False, the uncapped sum of the rules that ignore the job description"""
+        rules, pair = self._rules[category]
+        score = 0.0
+        for rule in rules:
+            score += rule(context)
+        if not pairs:
+            return score
+        for rule in pair:
+            score += rule(context)
+        return min(score, 1.0)
+
+    def evaluate(self, context: ResumeContext) -> Dict[str, float]:
+        """{category: score} for every category"""
+        return {category: self.category_score(category, context) for category in self.weights}
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_cached(criteria_json: str) -> ATSPlan:
+    return ATSPlan(json.loads(criteria_json))
+
+
+def compile_plan(criteria: Dict) -> ATSPlan:
+    """The ATSPlan for `criteria`, compiled once per distinct criteria dict."""
+    return _compile_cached(json.dumps(criteria))
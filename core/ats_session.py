@@ -0,0 +1,230 @@
+"""
+Incremental ATS re-scoring for a resume that is being edited.
+
+Candidates iterate on a resume: edit a bullet, re-score, repeat. Every view the ATS
+rules read (core.ats_rules.ResumeContext) is a sum over lines: feature counts, the
+heading lines the segmenter would find, taxonomy skills, cleaned tokens, non-empty
+lines. An ATSSession keeps those per-line facts plus their running totals. `update`
+diffs the new text against the old by lines, and only the lines that changed are
+rescanned, their facts subtracted from and added to the totals. After that only the
+categories whose views changed are scored again. For a one-line edit that is one
+line's scan, skills and cleaning, a few microseconds of bookkeeping and a handful of rules.
+
+Features, skills and tokens are found line by line. A match broken across a line break
+is therefore not counted; on the rule patterns that is only a phone number split
+across lines or a multi-word skill wrapped onto the next line. Otherwise the scores
+equal ATSAnalyzer scoring the whole text.
+"""
+from collections import Counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from core.ats_rules import ResumeContext
+from core.document import SHARED_VOCABULARY, Vocabulary, as_document
+from core.jd_keywords import jd_keyword_profile
+from core.sections import heading_section
+from core.skills import SkillMatch, extract_skills, get_skill_taxonomy
+
+
+class LineFacts(NamedTuple):
+    """What one line contributes to the resume's views."""
+    features: Tuple[int, ...]   # FeatureScanner counts
+    heading: Optional[str]      # section the line opens, if it is a heading
+    skills: Tuple[str, ...]     # distinct taxonomy skills on the line
+    token_ids: Tuple[int, ...]  # cleaned tokens as ids in the session's vocabulary
+    blank: bool
+
+
+def line_facts(plan, line: str, tokenize: Callable, vocabulary: Vocabulary) -> LineFacts:
+    """The facts `plan`'s rules read from a single line, with token ids in `vocabulary`"""
+    return LineFacts(
+        features=plan.scanner.scan(line),
+        heading=heading_section(line),
+        skills=tuple(extract_skills(line)),
+        token_ids=tuple(vocabulary.encode(tokenize(line))),
+        blank=not line.strip(),
+    )
+
+
+class ATSSession:
+    """
+    Scores of one resume kept up to date as its text is edited.
+
+    `analyzer` is the ATSAnalyzer whose plan and weights are used; `layout` the
+    LayoutFacts of the original file (editing text does not change how the file was
+    laid out); `tokenizer` the cleaning used for word counts and keyword matching
+    (core.utils.clean_text by default).
+    """
+
+    def __init__(self, analyzer, text: str, job_description=None, layout=None, tokenizer: Callable = None):
+        if tokenizer is None:
+            from core.utils import clean_text
+            tokenizer = clean_text
+        self.analyzer = analyzer
+        self.plan = analyzer.plan
+        self.layout = layout
+        self.tokenize = tokenizer
+        self.vocabulary = SHARED_VOCABULARY.acquire()  # kept, so token ids stay comparable across edits
+        self._lines: List[str] = []
+        self._facts: List[LineFacts] = []
+        self._features = [0] * len(self.plan.scanner.features)
+        self._headings = Counter()
+        self._skills = Counter()
+        self._tokens = Counter()    # token id -> occurrences
+        self._word_count = 0
+        self._non_empty = 0
+        self._views = {}
+        self.stats = {'updates': 0, 'lines_rescanned': 0, 'categories_rescored': 0}
+        self._replace(0, 0, text.split('\n'))
+        self._views = self._current_views()
+        self._load_job_description(job_description)
+        self._scores = self.plan.evaluate(self._context())
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self._lines)
+
+    @property
+    def scores(self) -> Dict[str, float]:
+        """{category: score} for the current text"""
+        return dict(self._scores)
+
+    @property
+    def overall_score(self) -> float:
+        """The weighted total, 0-100 like 'overall_score'"""
+        return round(self.analyzer.weigh_scores(self._scores)[1] * 100, 1)
+
+    def result(self) -> Dict:
+        """The current scores in the shape calculate_ats_score returns"""
+        scores, total = self.analyzer.weigh_scores(self._scores)
+        text = self.text
+        return {
+            'overall_score': round(total * 100, 1),
+            'category_scores': scores,
+            'recommendations': self.analyzer._generate_recommendations(scores, text),
+            'resume_text': text,
+        }
+
+    def rank_improvements(self, top_n: int = None) -> list:
+        """The additions that would raise the current score most (see core.ats_whatif)"""
+        from core.ats_whatif import rank_improvements
+        return rank_improvements(self.plan, self._context(), self.tokenize, top_n)
+
+    def set_job_description(self, job_description) -> Dict[str, float]:
+        """Scores against another job description (None for none); rescores the categories that read it"""
+        self._load_job_description(job_description)
+        return self._rescore({'jd', 'jd_profile'})
+
+    def _load_job_description(self, job_description) -> None:
+        self.job_description = job_description or None
+        self._jd_profile = jd_keyword_profile(self.job_description, self.vocabulary) if self.job_description else None
+        # Cleaned only when a jd_overlap rule compares against the document itself
+        reads_jd = any('jd' in views for views in self.plan.views.values())
+        self._jd = as_document(self.job_description) if self.job_description and reads_jd else None
+
+    def update(self, text: str) -> Dict[str, float]:
+        """Re-scores after the text changed to `text`; only the lines that differ are rescanned"""
+        lines = text.split('\n')
+        old = self._lines
+        limit = min(len(old), len(lines))
+        start = 0
+        while start < limit and old[start] == lines[start]:
+            start += 1
+        suffix = 0
+        while suffix < limit - start and old[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+        return self.replace_lines(start, len(old) - suffix, lines[start:len(lines) - suffix])
+
+    def apply_edit(self, start: int, end: int, replacement: str) -> Dict[str, float]:
+        """Re-scores after text[start:end] is replaced with `replacement` (character offsets)"""
+        text = self.text
+        first = text.count('\n', 0, start)
+        last = first + text.count('\n', start, end)
+        line_start = text.rfind('\n', 0, start) + 1
+        line_end = text.find('\n', end)
+        line_end = len(text) if line_end < 0 else line_end
+        edited = text[line_start:start] + replacement + text[end:line_end]
+        return self.replace_lines(first, last + 1, edited.split('\n'))
+
+    def replace_lines(self, start: int, end: int, lines: List[str]) -> Dict[str, float]:
+        """Re-scores after lines[start:end] of the text are replaced with `lines`"""
+        self.stats['updates'] += 1
+        if end > start or lines:
+            self._replace(start, end, lines)
+            views = self._current_views()
+            changed = {view for view, value in views.items() if self._views.get(view) != value}
+            self._views = views
+            return self._rescore(changed)
+        return self.scores
+
+    def _replace(self, start: int, end: int, lines: List[str]) -> None:
+        for facts in self._facts[start:end]:
+            self._account(facts, -1)
+        new_facts = [line_facts(self.plan, line, self.tokenize, self.vocabulary) for line in lines]
+        for facts in new_facts:
+            self._account(facts, 1)
+        self._lines[start:end] = lines
+        self._facts[start:end] = new_facts
+        self.stats['lines_rescanned'] += len(lines)
+
+    def _account(self, facts: LineFacts, sign: int) -> None:
+        """Adds (sign 1) or removes (sign -1) one line's facts from the running totals"""
+        totals = self._features
+        for i, count in enumerate(facts.features):
+            if count:
+                totals[i] += sign * count
+        if facts.heading:
+            self._headings[facts.heading] += sign
+        for skill in facts.skills:
+            self._skills[skill] += sign
+        for token_id in facts.token_ids:
+            self._tokens[token_id] += sign
+        self._word_count += sign * len(facts.token_ids)
+        self._non_empty += sign * (not facts.blank)
+
+    def _current_views(self) -> Dict:
+        """The totals as the values the rules compare, for detecting what an edit changed"""
+        return {
+            'features': tuple(self._features),
+            'sections': self._section_names(),
+            'skills': frozenset(skill for skill, count in self._skills.items() if count > 0),
+            'token_id_set': frozenset(token_id for token_id, count in self._tokens.items() if count > 0),
+            'word_count': self._word_count,
+            'non_empty_lines': self._non_empty,
+        }
+
+    def _section_names(self) -> frozenset:
+        """The sections segment_sections would index: every heading, plus "contact" for text above the first"""
+        names = {name for name, count in self._headings.items() if count > 0}
+        if names:
+            for facts in self._facts:
+                if facts.heading:
+                    break
+                if not facts.blank:
+                    names.add('contact')
+                    break
+        return frozenset(names)
+
+    def _context(self) -> ResumeContext:
+        views = self._views
+        categories = get_skill_taxonomy().categories
+        context = self.plan.context(None, layout=self.layout, job_description=self.job_description)
+        context.vocabulary = self.vocabulary
+        context.features = views['features']
+        context.sections = views['sections']
+        context.skills = {skill: SkillMatch(skill, categories[skill], self._skills[skill], [], [])
+                          for skill in views['skills']}
+        context.token_id_set = views['token_id_set']
+        context.word_count = views['word_count']
+        context.non_empty_lines = views['non_empty_lines']
+        context.jd = self._jd
+        context.jd_profile = self._jd_profile
+        return context
+
+    def _rescore(self, changed: set) -> Dict[str, float]:
+        stale = [category for category, views in self.plan.views.items() if views & changed]
+        if stale:
+            context = self._context()
+            for category in stale:
+                self._scores[category] = self.plan.category_score(category, context)
+            self.stats['categories_rescored'] += len(stale)
+        return self.scores
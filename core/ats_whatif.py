@@ -0,0 +1,237 @@
+"""
+What-if simulation of ATS score gains.
+
+Instead of generic advice ("Optimize keywords"), `rank_improvements` lists the concrete
+additions that would raise the score, each with the exact gain. The candidates are
+every JD keyword and taxonomy skill the resume lacks, every rule keyword (action verbs,
+section words, ...) it does not use, and every missing section heading a rule looks for.
+Each candidate is modelled as adding that phrase on a line of its own. Its effect on
+the resume's views is the phrase's LineFacts (core.ats_session), so each candidate is
+one row of a candidate-edit matrix over the current feature vector. Every rule is then
+evaluated for all rows at once with array operations that mirror core.ats_rules step
+for step, in the same order. The gains therefore equal re-scoring the resume with the
+phrase appended, exactly, while scoring all candidates costs about as much as one re-score.
+"""
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from core.ats_rules import ATSPlan, ResumeContext
+from core.ats_session import line_facts
+from core.document import ids_in, raw_text_of
+from core.sections import SECTION_HEADINGS
+from core.skills import TECHNICAL_CATEGORIES, extract_skills, get_skill_taxonomy, technical_skills
+
+
+class Improvement(NamedTuple):
+    """One addition to the resume and what it is worth."""
+    kind: str                       # 'section', 'keyword', 'skill' or 'jd_keyword'
+    phrase: str                     # the text to add, on a line of its own
+    source: str                     # the rule that asks for it, or 'job_description'
+    gain: float                     # overall score points (0-100) it adds
+    category_gains: Dict[str, float]  # category -> change of its score (0-1)
+
+
+def _section_names(context: ResumeContext) -> set:
+    # A SectionIndex iterates spans, a session's section set iterates names
+    return {getattr(section, 'name', section) for section in context.sections}
+
+
+def candidate_phrases(plan: ATSPlan, context: ResumeContext) -> List[Tuple[str, str, str]]:
+    """(kind, phrase, source) for everything the resume could add; each phrase once"""
+    candidates, seen = [], set()
+
+    def add(kind, phrase, source):
+        if phrase.lower() not in seen:
+            seen.add(phrase.lower())
+            candidates.append((kind, phrase, source))
+
+    sections = _section_names(context)
+    for specs in plan.rule_specs.values():
+        for rule, name in specs:
+            if rule['type'] == 'section' and rule['section'] not in sections:
+                add('section', rule['section'].upper(), name)
+            if rule['type'] == 'coverage' and rule.get('or_section'):
+                for keyword in rule['keywords']:
+                    if keyword in SECTION_HEADINGS and keyword not in sections:
+                        add('section', keyword.upper(), name)
+    for specs in plan.rule_specs.values():
+        for rule, name in specs:
+            if rule['type'] in ('coverage', 'count', 'section') and name in plan.scanner.keyword_groups:
+                for keyword, hit in plan.scanner.keyword_hits(context.features, name):
+                    if not hit:
+                        add('keyword', keyword, name)
+    if context.job_description:
+        have = context.skills
+        for skill in extract_skills(raw_text_of(context.job_description)):
+            if skill not in have:
+                add('skill', skill, 'job_description')
+        profile = context.jd_profile
+        if profile is not None:
+            present = context.token_id_set
+            for i in np.argsort(-profile.weights, kind='stable'):
+                token_id = int(profile.token_ids[i])
+                if token_id not in present:
+                    add('jd_keyword', context.vocabulary.token(token_id), 'job_description')
+    return candidates
+
+
+class _EditMatrix:
+    """The resume's views with each candidate line added: row 0 is the resume as it is"""
+
+    def __init__(self, plan: ATSPlan, context: ResumeContext, phrases: List[str], tokenize: Callable):
+        facts = [line_facts(plan, phrase, tokenize, context.vocabulary) for phrase in phrases]
+        self.rows = len(facts) + 1
+        self.plan = plan
+        self.context = context
+        self.facts = facts
+
+        width = len(plan.scanner.features)
+        present = np.zeros((self.rows, width), dtype=bool)
+        present[:] = np.array(context.features, dtype=np.int64).reshape(width) > 0
+        if facts and width:
+            present[1:] |= np.array([f.features for f in facts], dtype=np.int64) > 0
+        self.present = present
+
+        self.base_sections = _section_names(context)
+        self._sections = {}
+
+        categories = get_skill_taxonomy().categories
+        have = set(technical_skills(context.skills))
+        self.technical = np.array([len(have)] + [
+            len(have | {skill for skill in f.skills if categories[skill] in TECHNICAL_CATEGORIES}) for f in facts
+        ])
+
+        self.base_tokens = context.token_id_set
+        self.word_count = np.array([context.word_count] + [context.word_count + len(f.token_ids) for f in facts])
+        self.non_empty_lines = np.array([context.non_empty_lines] +
+                                        [context.non_empty_lines + (not f.blank) for f in facts])
+
+    def found(self, groups: List[str]) -> np.ndarray:
+        total = np.zeros(self.rows, dtype=np.int64)
+        for group in groups:
+            total += self.present[:, list(self.plan.scanner.groups[group])].sum(axis=1)
+        return total
+
+    def has_section(self, name: str) -> np.ndarray:
+        cached = self._sections.get(name)
+        if cached is None:
+            # A first heading turns the text above it into the "contact" section
+            opens_contact = not self.base_sections and self.context.non_empty_lines > 0
+            cached = np.array([name in self.base_sections] + [
+                f.heading == name or (name == 'contact' and opens_contact and f.heading is not None)
+                for f in self.facts
+            ])
+            self._sections[name] = cached
+        return cached
+
+    def jd_coverage(self, profile) -> np.ndarray:
+        hits = np.zeros((self.rows, len(profile)), dtype=bool)
+        hits[:] = np.isin(profile.token_ids, np.fromiter(self.base_tokens, np.int64, len(self.base_tokens)))
+        for row, f in enumerate(self.facts, 1):
+            hits[row] |= np.isin(profile.token_ids, np.array(f.token_ids, dtype=np.int64))
+        # A running sum adds the weights one at a time in token id order, like token_set_coverage
+        return np.cumsum(hits * profile.weights, axis=1)[:, -1]
+
+    def jd_shared(self, jd_ids: frozenset) -> np.ndarray:
+        base = self.base_tokens & jd_ids
+        return np.array([len(base)] + [len(base | (set(f.token_ids) & jd_ids)) for f in self.facts])
+
+
+def _rule_values(rule: Dict, name: str, edits: _EditMatrix):
+    """The rule's points for every row, as core.ats_rules computes them for one resume"""
+    plan, context = edits.plan, edits.context
+    kind = rule['type']
+    points = rule.get('points', 0.0)
+    groups = plan.rule_groups(name)
+    if kind == 'constant':
+        return points
+    if kind == 'coverage':
+        hits = np.zeros(edits.rows, dtype=np.int64)
+        indices = plan.scanner.groups[name]
+        for keyword, index in zip(plan.scanner.keyword_groups[name], indices):
+            hit = edits.present[:, index]
+            if rule.get('or_section', False):
+                hit = hit | edits.has_section(keyword)
+            hits += hit
+        return (hits / len(rule['keywords'])) * points
+    if kind == 'count':
+        return np.minimum(edits.found(groups) / rule['target'], 1.0) * points
+    if kind == 'section':
+        return np.where(edits.has_section(rule['section']) | (edits.found(groups) > 0), points, 0.0)
+    if kind == 'absent':
+        if rule.get('layout_facts') and context.layout is not None:
+            return 0.0 if any(getattr(context.layout, fact) for fact in rule['layout_facts']) else points
+        return np.where(edits.found(groups) > 0, 0.0, points)
+    if kind == 'standard_fonts':
+        if context.layout is not None:
+            return 0.0 if context.layout.nonstandard_fonts else points
+        mention = plan.rule_groups(name, key='mention')
+        return np.where((edits.found(groups) > 0) | (edits.found(mention) == 0), points, 0.0)
+    if kind == 'skills':
+        return np.minimum(edits.technical / rule['target'], 1.0) * points
+    if kind == 'word_count':
+        count = edits.word_count
+        values = np.zeros(edits.rows)
+        matched = np.zeros(edits.rows, dtype=bool)
+        for low, high, band_points in rule['bands']:
+            band = ~matched & (low <= count) & (count <= high)
+            values[band] = band_points
+            matched |= band
+        return values
+    if kind == 'line_count':
+        return np.where(edits.non_empty_lines > rule['more_than'], points, 0.0)
+    if kind in ('jd_overlap', 'jd_keywords'):
+        default = rule.get('default', 0.0)
+        if kind == 'jd_overlap':
+            jd = context.jd
+            if jd is None:
+                return default
+            if len(jd) == 0:
+                return 0.0
+            return np.minimum(edits.jd_shared(ids_in(jd, context.vocabulary)) / len(jd) * rule['factor'], 1.0) * points
+        profile = context.jd_profile
+        if profile is None:
+            return default
+        if len(profile) == 0:
+            return 0.0
+        return np.minimum(edits.jd_coverage(profile) * rule['factor'], 1.0) * points
+    raise ValueError(f"Unknown ATS rule type {kind!r} in {name}")
+
+
+def simulate(plan: ATSPlan, context: ResumeContext, phrases: List[str], tokenize: Callable) -> Dict[str, np.ndarray]:
+    """
+    {category: scores} for the resume as it is (index 0) and with each phrase added
+    (index i + 1), plus 'overall' (0-1) under the plan's weights.
+    """
+    edits = _EditMatrix(plan, context, phrases, tokenize)
+    scores = {}
+    overall = np.zeros(edits.rows)
+    for category, specs in plan.rule_specs.items():
+        score = np.zeros(edits.rows)
+        for rule, name in specs:
+            score = score + _rule_values(rule, name, edits)
+        scores[category] = np.minimum(score, 1.0)
+        overall = overall + scores[category] * plan.weights[category]
+    scores['overall'] = overall
+    return scores
+
+
+def rank_improvements(plan: ATSPlan, context: ResumeContext, tokenize: Callable, top_n: int = None) -> List[Improvement]:
+    """The candidate additions that raise the overall score, largest gain first"""
+    candidates = candidate_phrases(plan, context)
+    if not candidates:
+        return []
+    scores = simulate(plan, context, [phrase for _, phrase, _ in candidates], tokenize)
+    gains = (scores['overall'][1:] - scores['overall'][0]) * 100
+    order = np.argsort(-gains, kind='stable')
+    improvements = []
+    for i in order[:top_n] if top_n else order:
+        if gains[i] <= 1e-9:
+            break
+        kind, phrase, source = candidates[i]
+        category_gains = {category: float(values[i + 1] - values[0])
+                          for category, values in scores.items()
+                          if category != 'overall' and values[i + 1] != values[0]}
+        improvements.append(Improvement(kind, phrase, source, float(gains[i]), category_gains))
+    return improvements
@@ -0,0 +1,124 @@
+"""
+Near-duplicate detection for batches of resumes.
+
+Bulk screening often sees the same candidate several times with trivial edits (a new
+phone number, a reordered skills line). Each document's cleaned token stream is turned
+into word shingles and summarised by a MinHash signature; signatures are split into LSH
+bands, and documents sharing any band bucket become candidate pairs. A document joins
+the cluster of a candidate only if its estimated Jaccard similarity to that cluster's
+representative (its first document) reaches the threshold, so every duplicate is close
+to the representative whose results it shares. Clusters are not transitive closures: in
+a chain A ~ B ~ C where A and C differ, C starts a cluster of its own. Every document is
+hashed once and only bucket-mates' clusters are compared, so clustering a batch takes
+roughly linear time.
+"""
+import zlib
+from typing import Hashable, Iterable, NamedTuple, Sequence
+
+import numpy as np
+
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs above ~0.7 Jaccard almost always share a bucket
+LSH_BANDS = 16
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8
+
+# Universal hashing modulo the largest 32-bit prime; a * x + b stays below 2**64
+_PRIME = np.uint64(4294967291)
+_rng = np.random.default_rng(1)
+_A = _rng.integers(1, 2 ** 32 - 1, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2 ** 32 - 1, size=NUM_PERM, dtype=np.uint64)
+
+
+def _shingle_hashes(tokens: Sequence[str]) -> np.ndarray:
+    """32-bit hashes of the document's distinct word shingles (the tokens themselves for very short documents)."""
+    if len(tokens) < SHINGLE_SIZE:
+        shingles = set(tokens)
+    else:
+        shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+def minhash_signature(tokens: Iterable[str]) -> np.ndarray | None:
+    """The NUM_PERM-value MinHash signature of a token stream, or None for an empty one."""
+    hashes = _shingle_hashes(list(tokens))
+    if not len(hashes):
+        return None
+    return ((_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+
+def estimated_jaccard(signature: np.ndarray, other: np.ndarray) -> float:
+    return float(np.count_nonzero(signature == other)) / NUM_PERM
+
+
+class DuplicateCluster(NamedTuple):
+    """A representative (the first member seen) and the near-duplicates that share its results."""
+    representative: Hashable
+    duplicates: list        # [(key, estimated Jaccard similarity to the representative)]
+
+
+class NearDuplicateIndex:
+    """Incremental MinHash LSH index; add documents, then read off the clusters."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, bands: int = LSH_BANDS):
+        if NUM_PERM % bands:
+            raise ValueError(f"bands must divide {NUM_PERM}")
+        self.threshold = threshold
+        self.bands = bands
+        self._rows = NUM_PERM // bands
+        self._keys = []
+        self._signatures = []
+        self._parent = []
+        self._buckets = [{} for _ in range(bands)]
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def add(self, key: Hashable, tokens: Iterable[str]) -> None:
+        index = len(self._keys)
+        signature = minhash_signature(tokens)
+        self._keys.append(key)
+        self._signatures.append(signature)
+        self._parent.append(index)
+        if signature is None:
+            return  # empty documents are never merged
+        candidates = set()
+        for band, buckets in enumerate(self._buckets):
+            bucket = buckets.setdefault(signature[band * self._rows:(band + 1) * self._rows].tobytes(), [])
+            candidates.update(bucket)
+            bucket.append(index)
+        best = best_similarity = None
+        for root in sorted({self._find(other) for other in candidates}):
+            similarity = estimated_jaccard(signature, self._signatures[root])
+            if similarity >= self.threshold and (best is None or similarity > best_similarity):
+                best, best_similarity = root, similarity
+        if best is not None:
+            # Join the cluster whose representative is most similar (the earliest on ties)
+            self._parent[index] = best
+
+    def clusters(self) -> list[DuplicateCluster]:
+        """One DuplicateCluster per distinct document, in order of first appearance."""
+        members = {}
+        for index in range(len(self._keys)):
+            members.setdefault(self._find(index), []).append(index)
+        result = []
+        for root, indexes in members.items():
+            representative = self._signatures[root]
+            result.append(DuplicateCluster(
+                self._keys[root],
+                [(self._keys[i], estimated_jaccard(representative, self._signatures[i])) for i in indexes[1:]]
+            ))
+        return result
+
+
+def cluster_near_duplicates(documents: Iterable[tuple[Hashable, Iterable[str]]],
+                            threshold: float = DEFAULT_THRESHOLD) -> list[DuplicateCluster]:
+    """Clusters (key, cleaned tokens) pairs whose estimated Jaccard similarity is at least `threshold`."""
+    index = NearDuplicateIndex(threshold)
+    for key, tokens in documents:
+        index.add(key, tokens)
+    return index.clusters()
@@ -0,0 +1,240 @@
+import os
+import threading
+from array import array
+from typing import Iterable, Iterator
+
+from core.sections import SectionIndex, segment_sections
+
+
+# Tokens the shared vocabulary may hold before new documents start a fresh one
+VOCABULARY_MAX_TOKENS = int(os.environ.get("ARIA_VOCABULARY_MAX_TOKENS", 200_000))
+
+
+class Vocabulary:
+    """
+    Interned token vocabulary mapping token strings to dense integer ids.
+    Each distinct token string is stored once no matter how many documents contain it.
+    """
+    def __init__(self):
+        self._ids = {}
+        self._tokens = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def encode(self, tokens: Iterable[str]) -> array:
+        """Returns the token ids of `tokens` as an array('I'), interning unseen tokens."""
+        ids = self._ids
+        encoded = array('I')
+        for token in tokens:
+            token_id = ids.get(token)
+            if token_id is None:
+                with self._lock:
+                    token_id = ids.get(token)
+                    if token_id is None:
+                        token_id = len(self._tokens)
+                        self._tokens.append(token)
+                        ids[token] = token_id
+            encoded.append(token_id)
+        return encoded
+
+    def decode(self, token_ids: Iterable[int]) -> list[str]:
+        """Returns the token strings for `token_ids`."""
+        tokens = self._tokens
+        return [tokens[token_id] for token_id in token_ids]
+
+    def token(self, token_id: int) -> str:
+        return self._tokens[token_id]
+
+
+class SharedVocabulary:
+    """
+    The process-wide vocabulary, bounded. It only grows, and a server sees every token of
+    every resume and JD (typos, emails, IDs), so once the current Vocabulary holds
+    `max_tokens` tokens the next `acquire` starts a new, empty one. Whoever holds ids
+    (a document, a ResumeContext, a session, a JD profile) keeps a reference to the
+    Vocabulary that issued them, so the ids stay valid, and an old Vocabulary is freed
+    once nothing refers to it. Ids from different Vocabularies are never compared:
+    `ids_in` re-encodes a document into the Vocabulary a computation uses.
+    """
+    def __init__(self, max_tokens: int = VOCABULARY_MAX_TOKENS):
+        self.max_tokens = max_tokens
+        self.current = Vocabulary()
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._release_hooks = []
+
+    def acquire(self) -> Vocabulary:
+        """The Vocabulary to encode new work with, starting a new one if the current is full."""
+        released = False
+        with self._lock:
+            if len(self.current) >= self.max_tokens:
+                self.current = Vocabulary()
+                self.generation += 1
+                released = True
+            current = self.current
+        if released:
+            for hook in self._release_hooks:
+                hook()
+        return current
+
+    def on_release(self, hook) -> None:
+        """Calls `hook()` whenever a full Vocabulary is replaced, so caches can drop ids in it."""
+        self._release_hooks.append(hook)
+
+    def __len__(self) -> int:
+        return len(self.current)
+
+    def encode(self, tokens: Iterable[str]) -> array:
+        return self.current.encode(tokens)
+
+    def decode(self, token_ids: Iterable[int]) -> list[str]:
+        return self.current.decode(token_ids)
+
+    def token(self, token_id: int) -> str:
+        return self.current.token(token_id)
+
+
+SHARED_VOCABULARY = SharedVocabulary()
+
+
+class ParsedDocument:
+    """
+    Compact representation of a parsed resume or job description shared by every stage.
+
+    Holds the raw text once and the cleaned tokens as an array('I') of ids into a shared
+    vocabulary (by default SHARED_VOCABULARY's current one), plus the layout facts
+    (`core.layout.LayoutFacts`) collected when a resume file was extracted; documents
+    built from plain text have no layout. Derived views (cleaned text, lowercase text,
+    token sets, sections, skills) are computed on first access and reused. Iterating a
+    document yields its cleaned tokens and len() is the token count, so it can stand in
+    for the token lists stages used to pass around.
+    """
+    __slots__ = ("raw_text", "token_ids", "vocabulary", "source", "layout",
+                 "_cleaned_text", "_lower_text", "_token_id_set", "_token_set", "_sections", "_skills")
+
+    def __init__(self, raw_text: str, tokens: Iterable[str], source: str = None,
+                 vocabulary: Vocabulary = None, layout=None):
+        self.raw_text = raw_text
+        if vocabulary is None:
+            vocabulary = SHARED_VOCABULARY.acquire()
+        self.vocabulary = vocabulary
+        self.token_ids = vocabulary.encode(tokens)
+        self.source = source
+        self.layout = layout
+        self._cleaned_text = None
+        self._lower_text = None
+        self._token_id_set = None
+        self._token_set = None
+        self._sections = None
+        self._skills = None
+
+    @classmethod
+    def from_text(cls, text: str, source: str = None) -> "ParsedDocument":
+        """Cleans `text` with `core.utils.clean_text` and wraps the result."""
+        from core.utils import clean_text
+        return cls(text, clean_text(text), source=source)
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    def __bool__(self) -> bool:
+        # Truthiness follows the raw text, like the plain strings documents replace
+        return bool(self.raw_text)
+
+    def __iter__(self) -> Iterator[str]:
+        token = self.vocabulary.token
+        return (token(token_id) for token_id in self.token_ids)
+
+    def __reduce__(self):
+        # Token ids are only meaningful within one process, so pickle (e.g. across a
+        # worker pool) as text + tokens and re-intern on the receiving side.
+        return (_unpickle_document, (self.raw_text, self.tokens, self.source, self.layout))
+
+    def __repr__(self) -> str:
+        return f"ParsedDocument(source={self.source!r}, chars={len(self.raw_text)}, tokens={len(self)})"
+
+    @property
+    def tokens(self) -> list[str]:
+        """The cleaned tokens as a new list of strings."""
+        return self.vocabulary.decode(self.token_ids)
+
+    @property
+    def cleaned_text(self) -> str:
+        """The cleaned tokens joined by spaces, as fed to the embedding model."""
+        if self._cleaned_text is None:
+            self._cleaned_text = " ".join(self)
+        return self._cleaned_text
+
+    @property
+    def lower_text(self) -> str:
+        """The raw text lowercased, for case-insensitive keyword checks."""
+        if self._lower_text is None:
+            self._lower_text = self.raw_text.lower()
+        return self._lower_text
+
+    @property
+    def token_id_set(self) -> frozenset:
+        """The distinct token ids, for fast overlap between documents sharing a vocabulary."""
+        if self._token_id_set is None:
+            self._token_id_set = frozenset(self.token_ids)
+        return self._token_id_set
+
+    @property
+    def token_set(self) -> frozenset:
+        """The distinct cleaned tokens."""
+        if self._token_set is None:
+            self._token_set = frozenset(self)
+        return self._token_set
+
+    @property
+    def sections(self) -> SectionIndex:
+        """The resume's section spans (contact, summary, experience, ...), segmented on first access."""
+        if self._sections is None:
+            self._sections = segment_sections(self.raw_text)
+        return self._sections
+
+    @property
+    def skills(self) -> dict:
+        """{canonical skill: SkillMatch} from the skills taxonomy, extracted on first access."""
+        if self._skills is None:
+            from core.skills import extract_skills
+            self._skills = extract_skills(self.raw_text, self.sections)
+        return self._skills
+
+    def overlap(self, other: "ParsedDocument") -> int:
+        """Number of distinct tokens shared with `other`."""
+        if self.vocabulary is other.vocabulary:
+            return len(self.token_id_set & other.token_id_set)
+        return len(self.token_set & other.token_set)
+
+
+def ids_in(document: ParsedDocument, vocabulary: Vocabulary) -> frozenset:
+    """The document's distinct tokens as ids in `vocabulary`, encoding them there if needed."""
+    if document.vocabulary is vocabulary:
+        return document.token_id_set
+    return frozenset(vocabulary.encode(document.token_set))
+
+
+def _unpickle_document(raw_text: str, tokens: list[str], source: str, layout) -> ParsedDocument:
+    return ParsedDocument(raw_text, tokens, source=source, layout=layout)
+
+
+def as_document(text: str, tokens: Iterable[str] = None) -> ParsedDocument:
+    """
+    Returns `text` unchanged if it is already a ParsedDocument; otherwise wraps it,
+    reusing `tokens` when given and cleaning the text when not.
+    """
+    if isinstance(text, ParsedDocument):
+        return text
+    if isinstance(tokens, ParsedDocument):
+        return tokens
+    if tokens is None:
+        return ParsedDocument.from_text(text)
+    return ParsedDocument(text, tokens)
+
+
+def raw_text_of(document) -> str:
+    """Returns the raw text of a ParsedDocument, or the value itself if it is already a string."""
+    return document.raw_text if isinstance(document, ParsedDocument) else document
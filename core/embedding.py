@@ -3,46 +3,43 @@ import sys
 from typing import List
 
 import numpy as np
-from langchain_community.vectorstores import FAISS
-from langchain_groq import ChatGroq
-from langchain_huggingface import HuggingFaceEmbeddings
-from sklearn.metrics.pairwise import cosine_similarity
-from dotenv import load_dotenv
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.utils import process_documents
-
-load_dotenv()
-groq_api_key = os.environ["GROQ_API_KEY"]
-hf_api_key = os.environ["HUGGINGFACEHUB_API_TOKEN"]
-groq_llm = ChatGroq(groq_api_key=groq_api_key, model_name="llama-3.1-8b-instant")
-huggingface_embeddings = HuggingFaceEmbeddings(
-    model_name="sentence-transformers/all-MiniLM-l6-v2",
-    model_kwargs={'device': 'cpu'},
-    encode_kwargs={'normalize_embeddings': True}
-
-)
+from core.document import ParsedDocument
+from core.embedding_cache import get_cached_embeddings
 
 def create_embeddings(texts: List[str]) -> List[List[float]]:
     """
-    Generates embeddings for a list of texts using the pre-initialized HuggingFace Sentence Transformers model.
+    Generates embeddings for a list of texts using the shared HuggingFace Sentence Transformers model
+    (loaded on first use, see core.embedding_provider). Texts embedded before are served from
+    the persistent embedding cache (core.embedding_cache).
     """
-    return huggingface_embeddings.embed_documents(texts)
+    return get_cached_embeddings().embed_documents(texts)
 
 
 def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> float:
     """
     Calculates the cosine similarity between two embedding vectors.
     """
-    return cosine_similarity([embedding1], [embedding2])[0][0]
-def calculate_resume_jd_similarity(cleaned_resume_list: list[str], cleaned_jd_list: list[str]):
+    embedding1 = np.asarray(embedding1, dtype=float)
+    embedding2 = np.asarray(embedding2, dtype=float)
+    norms = np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
+    return float(embedding1 @ embedding2 / norms) if norms else 0.0
+def _cleaned_text(document: ParsedDocument | list[str]) -> str:
+    if isinstance(document, ParsedDocument):
+        return document.cleaned_text  # joined once and reused
+    return " ".join(document)
+
+def calculate_resume_jd_similarity(cleaned_resume_list: ParsedDocument | list[str], cleaned_jd_list: ParsedDocument | list[str]):
     """
     Calculates the cosine similarity between a cleaned resume and job description.
+    Accepts ParsedDocuments or lists of cleaned tokens.
     Optionally stores the embeddings in a FAISS vector database.
     """
     # Generate embeddings
-    cleaned_resume_text = " ".join(cleaned_resume_list)
-    cleaned_jd_text = " ".join(cleaned_jd_list)
+    cleaned_resume_text = _cleaned_text(cleaned_resume_list)
+    cleaned_jd_text = _cleaned_text(cleaned_jd_list)
     texts_to_embed = [cleaned_resume_text, cleaned_jd_text]
     embeddings = create_embeddings(texts_to_embed)
     resume_embedding = embeddings[0]
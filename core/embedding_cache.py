@@ -0,0 +1,316 @@
+"""
+Persistent cache of text embeddings.
+
+The same texts are embedded again and again: one job description against many
+resumes, a resume analyzed twice, the interview chatbot's suggested questions.
+`get_cached_embeddings` returns a LangChain embeddings object that looks every text
+up here first and only runs the model (core.embedding_provider) on the misses, so
+the model is not even loaded while every lookup hits.
+
+Vectors are keyed by (model, normalize flag, SHA-256 of the text). Each (model,
+normalize) pair has a float32 array file that is memory-mapped, one row per vector
+tagged with the first 8 bytes of its text hash; an SQLite index maps hashes to rows
+and records when each was last used. A process also keeps the hash -> row map in
+memory, so a warm lookup is a dict access and a row copy (microseconds), checked
+against the row tag in case another process has since reused the row. Access times
+of those lookups are written in batches. Once `max_entries` vectors are stored per
+model, the least recently used row is overwritten.
+
+    python -m core.embedding_cache [--clear]
+"""
+import atexit
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.embedding_provider import EMBEDDING_MODEL, NORMALIZE_EMBEDDINGS, canonical_model_name, get_embeddings
+from core.resume_cache import DEFAULT_CACHE_DIR
+
+try:
+    from langchain_core.embeddings import Embeddings
+except ImportError:  # LangChain is only needed to pass the cache to vector stores
+    Embeddings = object
+
+DEFAULT_MAX_VECTORS = int(os.environ.get("ARIA_EMBEDDING_CACHE_SIZE", 20000))
+
+
+def text_hash(text: str) -> str:
+    """Hex SHA-256 of the text's UTF-8 bytes"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _row_tag(digest: str) -> int:
+    return int(digest[:16], 16) | 1  # never 0, which marks a row being written
+
+
+class _VectorFile:
+    """The memory-mapped rows of one (model, normalize) pair and this process's view of its index"""
+
+    def __init__(self, path: str, dim: int, capacity: int):
+        self.dim = dim
+        self.dtype = np.dtype([('tag', '<u8'), ('vector', '<f4', (dim,))])
+        size = self.dtype.itemsize * capacity
+        with open(path, 'ab') as f:
+            if f.tell() < size:
+                f.truncate(size)
+        self.rows = np.memmap(path, dtype=self.dtype, mode='r+', shape=(capacity,))
+        self.index: Dict[str, int] = {}
+
+    def read(self, digest: str, row: int) -> Optional[np.ndarray]:
+        tag = _row_tag(digest)
+        record = self.rows[row]
+        if record['tag'] != tag:
+            return None
+        vector = np.array(record['vector'])
+        return vector if record['tag'] == tag else None  # not overwritten while copying
+
+    def write(self, digest: str, row: int, vector) -> None:
+        record = self.rows[row:row + 1]
+        record['tag'] = 0
+        record['vector'] = np.asarray(vector, dtype=np.float32)
+        record['tag'] = _row_tag(digest)
+
+
+class EmbeddingCache:
+    """
+    Size-bounded on-disk cache of embedding vectors, shared by processes using the
+    same `cache_dir`. At most `max_entries` vectors are kept per model; the least
+    recently used are replaced first.
+    """
+    def __init__(self, cache_dir: str = None, max_entries: int = DEFAULT_MAX_VECTORS):
+        self.cache_dir = cache_dir or os.path.join(DEFAULT_CACHE_DIR, "embeddings")
+        self.db_path = os.path.join(self.cache_dir, "index.sqlite3")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._files: Dict[tuple, _VectorFile] = {}
+        self._touched: Dict[tuple, float] = {}  # (model, normalize, hash) -> access time not yet written
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    normalize INTEGER NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    row INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (model, normalize, text_hash)
+                )
+                """
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS spaces (model TEXT, normalize INTEGER, dim INTEGER NOT NULL, "
+                         "PRIMARY KEY (model, normalize))")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_embedding_access ON embeddings(model, normalize, last_access)")
+            # Rows past a smaller bound than the file was created with are dropped
+            conn.execute("DELETE FROM embeddings WHERE row >= ?", (max_entries,))
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:  # commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def _vector_file(self, conn: sqlite3.Connection, space: tuple, dim: int = None) -> Optional[_VectorFile]:
+        """The open rows for `space`, registering it with `dim` if it is new; None if unknown"""
+        vectors = self._files.get(space)
+        if vectors is not None:
+            return vectors
+        row = conn.execute("SELECT dim FROM spaces WHERE model = ? AND normalize = ?", space).fetchone()
+        if row is None:
+            if dim is None:
+                return None
+            conn.execute("INSERT INTO spaces (model, normalize, dim) VALUES (?, ?, ?)", (*space, dim))
+        else:
+            dim = row[0]
+        name = hashlib.sha256(f"{space[0]}\0{space[1]}".encode('utf-8')).hexdigest()[:16]
+        vectors = _VectorFile(os.path.join(self.cache_dir, f"{name}.f32"), dim, self.max_entries)
+        self._files[space] = vectors
+        return vectors
+
+    def get_many(self, model: str, normalize: bool, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """The cached float32 vector of each text, or None where it is not cached"""
+        space = (canonical_model_name(model), int(normalize))
+        digests = [text_hash(text) for text in texts]
+        found: List[Optional[np.ndarray]] = [None] * len(texts)
+        now = time.time()
+        with self._lock:
+            vectors = self._files.get(space)
+            if vectors is not None:
+                for i, digest in enumerate(digests):
+                    row = vectors.index.get(digest)
+                    if row is not None:
+                        found[i] = vectors.read(digest, row)
+            unknown = [i for i, vector in enumerate(found) if vector is None]
+            if unknown:
+                # Rows this process has not seen, or that another process has moved
+                with self._connect() as conn:
+                    vectors = self._vector_file(conn, space)
+                    if vectors is not None:
+                        wanted = list({digests[i] for i in unknown})
+                        rows = {}
+                        for start in range(0, len(wanted), 500):
+                            chunk = wanted[start:start + 500]
+                            rows.update(conn.execute(
+                                f"SELECT text_hash, row FROM embeddings WHERE model = ? AND normalize = ? "
+                                f"AND text_hash IN ({','.join('?' * len(chunk))})", (*space, *chunk)))
+                        for i in unknown:
+                            row = rows.get(digests[i])
+                            if row is not None:
+                                found[i] = vectors.read(digests[i], row)
+                                if found[i] is not None:
+                                    vectors.index[digests[i]] = row
+            for digest, vector in zip(digests, found):
+                if vector is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._touched[(*space, digest)] = now
+        return found
+
+    def put_many(self, model: str, normalize: bool, texts: List[str], vectors) -> None:
+        """Stores one vector per text, replacing the least recently used rows once the cache is full"""
+        if not texts:
+            return
+        space = (canonical_model_name(model), int(normalize))
+        entries = dict(zip((text_hash(text) for text in texts), vectors))
+        with self._lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")  # row allocation must not interleave with other processes
+            self._write_touched(conn)
+            rows = self._vector_file(conn, space, len(next(iter(entries.values()))))
+            now = time.time()
+            for digest, vector in entries.items():
+                if len(vector) != rows.dim:
+                    raise ValueError(f"{space[0]} vectors have {rows.dim} dimensions, got {len(vector)}")
+                existing = conn.execute("SELECT row FROM embeddings WHERE model = ? AND normalize = ? "
+                                        "AND text_hash = ?", (*space, digest)).fetchone()
+                row = existing[0] if existing else self._free_row(conn, space, rows)
+                rows.write(digest, row, vector)
+                rows.index[digest] = row
+                conn.execute("INSERT OR REPLACE INTO embeddings (model, normalize, text_hash, row, last_access) "
+                             "VALUES (?, ?, ?, ?, ?)", (*space, digest, row, now))
+            rows.rows.flush()
+
+    def _free_row(self, conn: sqlite3.Connection, space: tuple, rows: _VectorFile) -> int:
+        count = conn.execute("SELECT COUNT(*) FROM embeddings WHERE model = ? AND normalize = ?", space).fetchone()[0]
+        if count < self.max_entries:
+            return count  # rows are filled in order and only reused after that
+        digest, row = conn.execute("SELECT text_hash, row FROM embeddings WHERE model = ? AND normalize = ? "
+                                   "ORDER BY last_access ASC LIMIT 1", space).fetchone()
+        conn.execute("DELETE FROM embeddings WHERE model = ? AND normalize = ? AND text_hash = ?", (*space, digest))
+        rows.index.pop(digest, None)
+        self.evictions += 1
+        return row
+
+    def _write_touched(self, conn: sqlite3.Connection) -> None:
+        if self._touched:
+            conn.executemany("UPDATE embeddings SET last_access = MAX(last_access, ?) "
+                             "WHERE model = ? AND normalize = ? AND text_hash = ?",
+                             [(when, *key) for key, when in self._touched.items()])
+            self._touched.clear()
+
+    def flush(self) -> None:
+        """Writes the access times of lookups since the last write, so eviction sees them"""
+        with self._lock:
+            if self._touched:
+                with self._connect() as conn:
+                    self._write_touched(conn)
+
+    def stats(self) -> dict:
+        """Returns hit/miss/eviction counters for this process and the current entry count."""
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM embeddings")
+            for vectors in self._files.values():
+                vectors.rows['tag'] = 0
+                vectors.rows.flush()
+                vectors.index.clear()
+            self._touched.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain embeddings for `model_name` served from `cache`; the shared model
+    (core.embedding_provider) is loaded only when a text is not cached.
+    """
+    def __init__(self, model_name: str = EMBEDDING_MODEL, normalize: bool = NORMALIZE_EMBEDDINGS,
+                 cache: EmbeddingCache = None):
+        self.model_name = canonical_model_name(model_name)
+        self.normalize = normalize
+        self.cache = cache or get_embedding_cache()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = self.cache.get_many(self.model_name, self.normalize, texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if missing:
+            computed = get_embeddings(self.model_name, self.normalize).embed_documents(missing)
+            self.cache.put_many(self.model_name, self.normalize, missing, computed)
+            by_text = dict(zip(missing, np.asarray(computed, dtype=np.float32)))
+            vectors = [by_text[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+        return [vector.tolist() for vector in vectors]
+
+    def embed_query(self, text: str) -> List[float]:
+        # The provider's models encode queries and documents alike, so they share entries
+        return self.embed_documents([text])[0]
+
+
+_embedding_cache = None
+_cached_embeddings = {}
+_embedding_cache_lock = threading.Lock()
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Returns the process-wide embedding cache, creating it on first use.
+    """
+    global _embedding_cache
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache()
+            atexit.register(_embedding_cache.flush)
+        return _embedding_cache
+
+
+def get_cached_embeddings(model_name: str = EMBEDDING_MODEL, normalize: bool = NORMALIZE_EMBEDDINGS) -> CachedEmbeddings:
+    """The shared cached embeddings for `model_name`, for use wherever the model itself would be"""
+    key = (canonical_model_name(model_name), normalize)
+    cache = get_embedding_cache()
+    with _embedding_cache_lock:
+        if key not in _cached_embeddings:
+            _cached_embeddings[key] = CachedEmbeddings(*key, cache=cache)
+        return _cached_embeddings[key]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show or clear the persistent embedding cache")
+    parser.add_argument("--clear", action="store_true", help="remove every cached vector")
+    args = parser.parse_args()
+    cache = get_embedding_cache()
+    if args.clear:
+        cache.clear()
+    print(f"📦 {cache.cache_dir}: {cache.stats()['entries']} vectors cached (max {cache.max_entries} per model)")
@@ -0,0 +1,102 @@
+"""
+Process-wide embedding model provider.
+
+Every caller that embeds text (resume/JD similarity, the interview-prep retriever, the
+vector store builder) gets its model from `get_embeddings`. The model is loaded on first
+use, once per process, and then shared, so the process holds one copy of the weights
+instead of one per module or per call. Importing this module does not import torch.
+
+Model names are matched case-insensitively against the known models, so
+"all-MiniLM-l6-v2" and "all-MiniLM-L6-v2" resolve to the same instance (and the same
+Hugging Face cache directory).
+
+Servers can load the model ahead of the first request with `warm_up`, in the
+background if start-up should not wait for it. Container builds can download the
+weights once with:
+
+    python -m core.embedding_provider
+"""
+import threading
+import time
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DEVICE = "cpu"
+# all-MiniLM-L6-v2 ends in a Normalize layer, so its vectors are unit length either way
+NORMALIZE_EMBEDDINGS = True
+
+# lower-cased name -> the name the model is published under
+KNOWN_MODELS = {EMBEDDING_MODEL.lower(): EMBEDDING_MODEL}
+
+_models = {}
+_models_lock = threading.Lock()
+_warm_up_thread = None
+
+
+def canonical_model_name(model_name: str) -> str:
+    """The published spelling of a known model name; other names are returned as given"""
+    return KNOWN_MODELS.get(model_name.lower(), model_name)
+
+
+def _load(model_name: str, normalize: bool):
+    from langchain_huggingface import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={'device': EMBEDDING_DEVICE},
+        encode_kwargs={'normalize_embeddings': normalize}
+    )
+
+
+def get_embeddings(model_name: str = EMBEDDING_MODEL, normalize: bool = NORMALIZE_EMBEDDINGS):
+    """
+    The shared LangChain embeddings object for `model_name`, loaded on first use.
+    Safe to call from several threads: the model is loaded once and the others wait for it.
+    """
+    key = (canonical_model_name(model_name), normalize)
+    embeddings = _models.get(key)
+    if embeddings is None:
+        with _models_lock:
+            embeddings = _models.get(key)
+            if embeddings is None:
+                print(f"🧠 Loading embedding model {key[0]}...")
+                start = time.perf_counter()
+                embeddings = _load(*key)
+                _models[key] = embeddings
+                print(f"✅ Embedding model loaded in {time.perf_counter() - start:.1f}s")
+    return embeddings
+
+
+def loaded_models() -> list:
+    """(model name, normalize) of every model loaded in this process"""
+    return list(_models)
+
+
+def warm_up(model_name: str = EMBEDDING_MODEL, normalize: bool = NORMALIZE_EMBEDDINGS,
+            background: bool = False) -> threading.Thread | None:
+    """
+    Loads the model and embeds one query, so the first request pays neither for the
+    weights nor for the tokenizer and torch start-up. With `background` the work runs
+    in a daemon thread (started once per process) that is returned; callers that need
+    the model meanwhile wait for it in `get_embeddings`.
+    """
+    global _warm_up_thread
+
+    def run():
+        try:
+            get_embeddings(model_name, normalize).embed_query("warm up")
+        except Exception as e:
+            print(f"⚠️ Embedding warm-up failed: {e}")
+            if not background:
+                raise
+
+    if not background:
+        run()
+        return None
+    with _models_lock:
+        if _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(target=run, name="embedding-warm-up", daemon=True)
+            _warm_up_thread.start()
+    return _warm_up_thread
+
+
+if __name__ == "__main__":
+    warm_up()
@@ -0,0 +1,247 @@
+"""
+Weighted job description keyword profiles for ATS keyword matching.
+
+The keyword check used to count the distinct tokens a resume shares with the job
+description, so "experience" or "team" counted as much as "kubernetes". A
+JDKeywordProfile instead weights each distinct JD token BM25-style: a saturated term
+frequency (repeating a word helps, with diminishing returns) times its inverse document
+frequency, taken from an IDF table precomputed over our job descriptions and the
+interview-prep knowledge base. Weights are normalized to sum to 1, so a resume's
+keyword coverage, the summed weight of the JD tokens it contains, is in [0, 1] and is
+one sparse dot product (see core.ats_batch.profile_matrix).
+
+Profiles are cached by the SHA-256 of the JD text and the IDF table in use, so scoring
+many resumes against one posting builds its profile once; a JD passed as a string is not
+even re-cleaned on a hit.
+
+The IDF table is a JSON file ({"documents": N, "df": {token: document frequency}}) built
+offline with `python -m core.jd_keywords` and shipped in data/keywords. Requests only
+ever load it: without the file, every token gets the same IDF and the weights fall back
+to term frequency alone. Rebuild it whenever the corpora or clean_text change. Where the
+NLTK corpora are not installed, the build counts each token together with the lemmas
+WordNet's noun suffix rules could give it, so every lemma clean_text produces still finds
+its document frequency (irregular plurals aside; stopwords are counted but never looked up).
+"""
+import glob
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, NamedTuple
+
+import numpy as np
+
+from core.document import SHARED_VOCABULARY, ParsedDocument, Vocabulary, as_document
+from core.nltk_resources import resource_status
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+JD_CORPUS_DIR = os.path.join(_ROOT, 'data', 'raw', 'job_descriptions')
+KB_CORPUS_DIR = os.path.join(_ROOT, 'rag_core', 'interview_prep_kb')
+IDF_TABLE_PATH = os.environ.get("ARIA_IDF_TABLE", os.path.join(_ROOT, 'data', 'keywords', 'idf_table.json'))
+
+PROFILE_CACHE_SIZE = 256
+BM25_K1 = 1.2  # term frequency saturation
+# WordNet's noun detachment rules (suffix, replacement), as applied by its lemmatizer
+NOUN_SUFFIX_RULES = (("s", ""), ("ses", "s"), ("xes", "x"), ("zes", "z"), ("ches", "ch"), ("shes", "sh"),
+                     ("men", "man"), ("ies", "y"))
+
+
+class IDFTable(NamedTuple):
+    documents: int          # corpus size; 0 for the uniform fallback
+    df: Dict[str, int]      # token -> number of corpus documents containing it
+    digest: str             # identifies the table in profile cache keys
+
+    def idf(self, token: str) -> float:
+        """BM25 inverse document frequency; unseen tokens (df 0) weigh the most, every token 1 without a corpus."""
+        if not self.documents:
+            return 1.0
+        df = self.df.get(token, 0)
+        return math.log(1 + (self.documents - df + 0.5) / (df + 0.5))
+
+
+UNIFORM_IDF = IDFTable(0, {}, "uniform")
+
+
+def _table_from_dict(data: Dict) -> IDFTable:
+    payload = json.dumps(data, sort_keys=True).encode("utf-8")
+    return IDFTable(int(data["documents"]), dict(data["df"]), hashlib.sha256(payload).hexdigest())
+
+
+def corpus_texts(jd_dir: str = JD_CORPUS_DIR, kb_dir: str = KB_CORPUS_DIR) -> Iterable[str]:
+    """The IDF corpus: every job description file, and each knowledge base question with its answer."""
+    for path in sorted(glob.glob(os.path.join(jd_dir, '*.txt'))):
+        with open(path, encoding='utf-8') as f:
+            yield f.read()
+    for path in sorted(glob.glob(os.path.join(kb_dir, '*.json'))):
+        with open(path, encoding='utf-8') as f:
+            for entry in json.load(f):
+                yield f"{entry.get('question', '')}\n{entry.get('answer', '')}"
+
+
+def lemma_candidates(token: str) -> set:
+    """The token and every form NOUN_SUFFIX_RULES turn it into: the lemmas clean_text may give it."""
+    candidates = {token}
+    for suffix, replacement in NOUN_SUFFIX_RULES:
+        if token.endswith(suffix) and len(token) > len(suffix):
+            candidates.add(token[:-len(suffix)] + replacement)
+    return candidates
+
+
+def build_idf_table(texts: Iterable[str] = None) -> IDFTable:
+    """
+    Document frequencies of the cleaned tokens of `texts` (default: corpus_texts()), or of
+    their lemma candidates when the NLTK corpora clean_text needs are not installed.
+    """
+    from core.utils import clean_text, raw_tokens
+    status = resource_status()
+    exact = status["stopwords"] and status["wordnet"]
+    if not exact:
+        print("NLTK stopwords/wordnet not installed: counting lemma candidates instead of clean_text tokens.",
+              file=sys.stderr)
+    df = Counter()
+    documents = 0
+    for text in corpus_texts() if texts is None else texts:
+        if exact:
+            df.update(set(clean_text(text)))
+        else:
+            df.update(set().union(*map(lemma_candidates, raw_tokens(text))))
+        documents += 1
+    return _table_from_dict({"documents": documents, "df": dict(df)})
+
+
+def save_idf_table(table: IDFTable, path: str = IDF_TABLE_PATH) -> str:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"documents": table.documents, "df": table.df}, f, sort_keys=True)
+    return path
+
+
+def load_idf_table(path: str = IDF_TABLE_PATH) -> IDFTable:
+    with open(path, encoding='utf-8') as f:
+        return _table_from_dict(json.load(f))
+
+
+_table = None
+_lock = threading.Lock()
+
+
+def get_idf_table() -> IDFTable:
+    """The process-wide IDF table: loaded from IDF_TABLE_PATH, else uniform. Never built here."""
+    global _table
+    with _lock:
+        if _table is None:
+            try:
+                _table = load_idf_table(IDF_TABLE_PATH)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"IDF table unavailable ({e}); JD keywords are weighted by term frequency only. "
+                      f"Build it with `python -m core.jd_keywords`.", file=sys.stderr)
+                _table = UNIFORM_IDF
+        return _table
+
+
+def set_idf_table(table: IDFTable = None) -> None:
+    """Replaces the process-wide IDF table (None: reload on next use) and drops cached profiles."""
+    global _table
+    with _lock:
+        _table = table
+    with _cache_lock:
+        _cache.clear()
+
+
+class JDKeywordProfile(NamedTuple):
+    """A job description's distinct tokens (ids into `vocabulary`, ascending) and their weights, summing to 1."""
+    token_ids: np.ndarray
+    weights: np.ndarray
+    vocabulary: Vocabulary = None  # None only for an empty profile
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    def top_keywords(self, n: int = 10) -> List[tuple]:
+        """The `n` heaviest (token, weight) pairs"""
+        order = np.argsort(-self.weights, kind='stable')[:n]
+        return [(self.vocabulary.token(int(self.token_ids[i])), float(self.weights[i])) for i in order]
+
+
+def _build_profile(document: ParsedDocument, table: IDFTable, vocabulary: Vocabulary) -> JDKeywordProfile:
+    counts = Counter(document)
+    tokens = sorted(counts)
+    weights = np.array([table.idf(token) * counts[token] * (BM25_K1 + 1) / (counts[token] + BM25_K1)
+                        for token in tokens], dtype=float)
+    ids = np.array(vocabulary.encode(tokens), dtype=np.int64)
+    order = np.argsort(ids)
+    ids, weights = ids[order], weights[order]
+    total = weights.sum()
+    if total > 0:
+        weights /= total
+    return JDKeywordProfile(ids, weights, vocabulary)
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_key(job_description: str | ParsedDocument, table: IDFTable, vocabulary: Vocabulary) -> str:
+    digest = hashlib.sha256()
+    if isinstance(job_description, ParsedDocument):
+        # Documents may carry tokens of their own, so they are part of the key
+        digest.update(b"document\0")
+        digest.update(job_description.raw_text.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(job_description.cleaned_text.encode("utf-8"))
+    else:
+        digest.update(b"text\0")
+        digest.update(job_description.encode("utf-8"))
+    return f"{table.digest}:{id(vocabulary)}:{digest.hexdigest()}"
+
+
+def jd_keyword_profile(job_description: str | ParsedDocument, vocabulary: Vocabulary = None) -> JDKeywordProfile:
+    """
+    The BM25-weighted keyword profile of a job description, with token ids in `vocabulary`
+    (default: the shared one). Cached by the SHA-256 of its text (and tokens, for a
+    ParsedDocument), the IDF table and the vocabulary.
+    """
+    if vocabulary is None:
+        vocabulary = SHARED_VOCABULARY.acquire()
+    table = get_idf_table()
+    key = _cache_key(job_description, table, vocabulary)
+    with _cache_lock:
+        profile = _cache.get(key)
+        if profile is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return profile
+
+    profile = _build_profile(as_document(job_description), table, vocabulary)
+    with _cache_lock:
+        _cache[key] = profile
+        if len(_cache) > PROFILE_CACHE_SIZE:
+            _cache.popitem(last=False)
+        _stats["misses"] += 1
+    return profile
+
+
+def _clear_profiles() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+# Profiles hold ids in (and a reference to) the vocabulary they were built with
+SHARED_VOCABULARY.on_release(_clear_profiles)
+
+
+def jd_profile_cache_stats() -> dict:
+    """Profile cache hits/misses in this process and the IDF table in use."""
+    table = _table
+    with _cache_lock:
+        return dict(_stats, entries=len(_cache),
+                    idf_documents=table.documents if table is not None else None)
+
+
+if __name__ == "__main__":
+    built = build_idf_table()
+    print(f"IDF table: {built.documents} documents, {len(built.df)} tokens -> {save_idf_table(built)}")
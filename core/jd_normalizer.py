@@ -0,0 +1,230 @@
+"""
+Job description normalization.
+
+Job postings carry a lot of text that says nothing about the role: benefits, "how to
+apply", equal-opportunity statements, company blurbs. That text is embedded and sent to
+the LLM on every JD-based feature, so `normalize_job_description` drops it before those
+calls. The JD is split into blocks at heading lines; a block is dropped when its whole
+heading is a known boilerplate heading ("Benefits", "About Us", "Life at Acme"), so a
+content heading that merely starts with one ("Benefits Administration Duties") is kept.
+A boilerplate block ends at the next colon heading or at the next heading-shaped line
+(short, capitalized, no sentence punctuation), so bare section headings such as
+"Responsibilities" bring the role content back. Text outside any heading is never
+dropped wholesale: only the sentences that contain a boilerplate phrase are removed, line
+by line. Results are cached by the SHA-256 of the JD text.
+
+Token counts use tiktoken's cl100k_base encoding when tiktoken is installed, else a
+word-and-punctuation estimate.
+"""
+import functools
+import hashlib
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+JD_CACHE_SIZE = 256
+
+BOILERPLATE_HEADINGS = [
+    "what we offer", "what we can offer", "what you'll get", "what you will get", "what's in it for you",
+    "benefits", "perks", "perks and benefits", "benefits and perks", "compensation and benefits",
+    "salary and benefits", "why join us", "why work with us", "why you'll love working here", "life",
+    "company overview", "about us", "about the company", "who we are", "our company", "our mission",
+    "our values", "our culture", "application process", "how to apply", "to apply", "next steps",
+    "equal opportunity employer", "equal opportunity", "equal employment opportunity", "eeo statement",
+    "diversity and inclusion", "diversity, equity and inclusion", "accommodations", "disclaimer",
+    "privacy notice",
+]
+
+# Phrases that mark a sentence outside any heading as boilerplate
+BOILERPLATE_PHRASES = [
+    "equal opportunity employer", "without regard to race", "regardless of race", "reasonable accommodation",
+    "e-verify", "we are committed to creating a diverse", "we celebrate diversity", "please submit your resume",
+    "to apply, please", "click apply", "apply now", "competitive salary", "comprehensive health benefits",
+    "recruitment agencies",
+]
+
+# A heading is a short line ending with a colon, or a known boilerplate heading on its own line
+_HEADING_LINE_RE = re.compile(r'^[ \t]*([^\n:]{1,60}):[ \t]*$|^[ \t]*([^\n]{1,60}?)[ \t]*$')
+# The whole heading must be boilerplate, optionally as "Our ..."/"The ..." or "... at Acme"
+_BOILERPLATE_HEADING_RE = re.compile(
+    r'(?:(?:our|the)\s+)?(?:' +
+    '|'.join(re.escape(h).replace(r'\ and\ ', r'\s+(?:and|&)\s+').replace(r'\ ', r'\s+')
+             for h in BOILERPLATE_HEADINGS) +
+    r')(?:\s+(?:at|with)\s+[\w&.\' -]{1,40})?',
+    re.IGNORECASE
+)
+# A bare line that reads as a section heading: capitalized, a few words, no sentence punctuation
+_HEADING_SHAPED_RE = re.compile(r"[ \t]*[A-Z][\w&/'()-]*(?:[ \t]+[\w&/'()-]+){0,4}[ \t]*")
+_BOILERPLATE_PHRASE_RE = re.compile('|'.join(re.escape(p) for p in BOILERPLATE_PHRASES), re.IGNORECASE)
+# Rough LLM token count: words and individual punctuation marks
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+class JDNormalization(NamedTuple):
+    text: str
+    removed_headings: list
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+@functools.lru_cache(maxsize=None)
+def _tiktoken_encoding():
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(text: str) -> int:
+    """LLM token count: exact cl100k_base tokens with tiktoken, else words plus punctuation marks."""
+    encoding = _tiktoken_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return sum(1 for _ in _TOKEN_RE.finditer(text))
+
+
+def is_boilerplate_heading(heading: str) -> bool:
+    """Whether the whole heading (without a trailing colon or question mark) is a known boilerplate heading."""
+    return _BOILERPLATE_HEADING_RE.fullmatch(heading.strip().rstrip(":?").strip()) is not None
+
+
+def _split_blocks(text: str) -> list[tuple[str, list[str]]]:
+    """Splits text into (heading, lines) blocks; the heading is "" for text before the first one."""
+    blocks = [("", [])]
+    in_boilerplate = False
+    for line in text.split("\n"):
+        stripped = line.strip()
+        match = _HEADING_LINE_RE.match(line) if stripped else None
+        if match:
+            heading = match.group(1) or match.group(2)
+            boilerplate = is_boilerplate_heading(heading)
+            # Colon headings always start a block, bare boilerplate headings too; any other
+            # heading-shaped line only ends a boilerplate block
+            if (match.group(1) is not None or boilerplate or
+                    (in_boilerplate and _HEADING_SHAPED_RE.fullmatch(line))):
+                blocks.append((heading.strip(), [line]))
+                in_boilerplate = boilerplate
+                continue
+        blocks[-1][1].append(line)
+    return blocks
+
+
+def _strip_boilerplate_sentences(line: str) -> str:
+    """The line without its boilerplate sentences ("" if nothing else is left)."""
+    if _BOILERPLATE_PHRASE_RE.search(line) is None:
+        return line
+    indent = line[:len(line) - len(line.lstrip())]
+    sentences = _SENTENCE_END_RE.split(line.strip())
+    kept = " ".join(s for s in sentences if _BOILERPLATE_PHRASE_RE.search(s) is None)
+    return indent + kept if kept else ""
+
+
+def _strip_unheaded(lines: list[str]) -> tuple[list[str], bool]:
+    """Drops boilerplate sentences from unheaded lines; returns the lines and whether any were dropped."""
+    kept = []
+    dropped = skip_blank = False
+    for line in lines:
+        if not line.strip():
+            if not skip_blank:
+                kept.append(line)
+            continue
+        stripped = _strip_boilerplate_sentences(line)
+        skip_blank = False
+        if stripped == line:
+            kept.append(line)
+            continue
+        dropped = True
+        if stripped:
+            kept.append(stripped)
+        else:
+            # A line that was only boilerplate goes with the blank lines around it
+            while kept and not kept[-1].strip():
+                kept.pop()
+            skip_blank = True
+    return kept, dropped
+
+
+def _normalize(text: str) -> JDNormalization:
+    kept = []
+    removed = []
+    for heading, lines in _split_blocks(text):
+        if heading and is_boilerplate_heading(heading):
+            removed.append(heading)
+            continue
+        if not heading:
+            lines, dropped = _strip_unheaded(lines)
+            if dropped:
+                removed.append("(unheaded boilerplate)")
+        kept.extend(lines)
+
+    normalized = _BLANK_LINES_RE.sub("\n\n", "\n".join(kept)).strip()
+    if not normalized:
+        # Never hand an empty JD to later stages
+        normalized = text
+        removed = []
+    return JDNormalization(normalized, removed, estimate_tokens(text), estimate_tokens(normalized))
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+
+def _lookup(jd_text: str) -> tuple[JDNormalization, bool]:
+    """(normalization, whether it came from the cache)"""
+    key = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()
+    with _cache_lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            _stats["tokens_saved"] += result.tokens_saved
+            return result, True
+
+    result = _normalize(jd_text)
+    with _cache_lock:
+        _cache[key] = result
+        if len(_cache) > JD_CACHE_SIZE:
+            _cache.popitem(last=False)
+        _stats["misses"] += 1
+        _stats["tokens_saved"] += result.tokens_saved
+    return result, False
+
+
+def normalize_job_description(jd_text: str) -> JDNormalization:
+    """
+    Drops boilerplate blocks (benefits, application process, EEO statements, company
+    blurbs) from a job description. Cached by the SHA-256 of the text, so repeated
+    calls with the same JD are a dictionary lookup.
+    """
+    return _lookup(jd_text)[0]
+
+
+def strip_jd_boilerplate(jd_text: str, caller: str = None) -> str:
+    """
+    Returns the normalized JD text. The tokens saved are reported on stderr when a JD is
+    first normalized, not on cache hits. Empty or missing JDs are returned unchanged.
+    """
+    if not jd_text:
+        return jd_text
+    result, cached = _lookup(jd_text)
+    if result.tokens_saved and not cached:
+        where = f" for {caller}" if caller else ""
+        print(f"JD normalization{where}: dropped {len(result.removed_headings)} boilerplate block(s), "
+              f"~{result.tokens_saved} of {result.tokens_before} tokens saved", file=sys.stderr)
+    return result.text
+
+
+def jd_cache_stats() -> dict:
+    """Cache hits/misses and total approximate tokens saved in this process."""
+    with _cache_lock:
+        return dict(_stats, entries=len(_cache))
@@ -0,0 +1,211 @@
+"""
+Layout facts collected while a resume's text is extracted.
+
+The extraction backends already walk every text line, image and font on a page to pull
+its text, so they record what ATS format scoring needs in that same pass: images large
+enough to carry content, the fonts runs are set in, tables and multi-column text. Callers
+that want these facts pass a list as `layout=`, and the extractor appends one PageLayout
+per page it reads; `LayoutFacts.from_pages` sums them for the whole document.
+
+Tables and columns are detected from text geometry alone (line boxes), so the same rules
+apply whichever PDF backend produced the boxes:
+
+- lines are grouped into rows by vertical position, and touching lines in a row are
+  merged into cells;
+- a table is TABLE_MIN_ROWS or more consecutive rows of at least TABLE_MIN_CELLS cells
+  whose left edges line up;
+- a page is multi-column when a vertical gutter splits its cells into a left and a right
+  group that each hold a real share of the text and sit side by side.
+"""
+import re
+from typing import Iterable, NamedTuple, Optional
+
+# Images smaller than this (points, on either side) are icons, bullets and rules that do not hide content
+MIN_IMAGE_PT = 24
+
+TABLE_MIN_ROWS = 3
+TABLE_MIN_CELLS = 3
+# Left edges within this distance (points) count as one table column
+ALIGN_TOLERANCE_PT = 3.0
+
+# A column gutter must be at least this wide (points) ...
+MIN_GUTTER_PT = 12.0
+# ... reach into this horizontal band of the page ...
+GUTTER_BAND = (0.2, 0.8)
+# ... and leave each side with at least this many cells and this share of them
+COLUMN_MIN_CELLS = 5
+COLUMN_MIN_SHARE = 0.2
+# Share of cells allowed to cross the gutter (full-width headers, footers)
+COLUMN_MAX_CROSSING = 0.1
+
+# Font families ATS parsers handle reliably, matched against normalized family names by prefix
+STANDARD_FONT_PREFIXES = (
+    "arial", "helvetica", "times", "calibri", "cambria", "georgia", "garamond", "verdana", "tahoma",
+    "trebuchet", "palatino", "bookantiqua", "centurygothic", "courier", "lucida", "segoeui", "symbol",
+    "liberation", "dejavu", "carlito", "caladea", "roboto", "opensans", "lato", "sourcesans",
+    "cmr", "cmbx", "cmti", "cmsl", "cmsy", "cmmi", "lmroman", "lmsans",
+)
+
+_SUBSET_PREFIX_RE = re.compile(r'^[A-Z]{6}\+')
+_STYLE_SUFFIX_RE = re.compile(r'[,-].*$')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_PS_SUFFIX_RE = re.compile(r'(?:psmt|ps|mt)$')
+
+
+class PageLayout(NamedTuple):
+    """Layout facts for one page."""
+    images: int          # images of at least MIN_IMAGE_PT on each side
+    fonts: tuple         # font family names used by text on the page
+    multi_column: bool
+    tables: int
+
+
+class LayoutFacts(NamedTuple):
+    """Layout facts for a whole document, as used by ATS format scoring."""
+    page_count: int
+    image_count: int
+    fonts: tuple         # distinct font families, sorted
+    multi_column_pages: int
+    table_count: int
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[PageLayout]) -> "LayoutFacts":
+        pages = list(pages)
+        return cls(
+            page_count=len(pages),
+            image_count=sum(page.images for page in pages),
+            fonts=tuple(sorted({font for page in pages for font in page.fonts})),
+            multi_column_pages=sum(1 for page in pages if page.multi_column),
+            table_count=sum(page.tables for page in pages),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LayoutFacts":
+        return cls(**dict(data, fonts=tuple(data["fonts"])))
+
+    def as_dict(self) -> dict:
+        return dict(self._asdict(), fonts=list(self.fonts))
+
+    @property
+    def nonstandard_fonts(self) -> tuple:
+        return tuple(font for font in self.fonts if not is_standard_font(font))
+
+
+def font_family(name: str) -> Optional[str]:
+    """
+    The family of a PDF/DOCX font name: subset prefix ("ABCDEF+") and style suffix
+    (",Bold", "-Italic") removed. Returns None for fonts without a real name, such as
+    PyMuPDF's "Type3 (12 0 R)" placeholders.
+    """
+    if not name:
+        return None
+    name = _SUBSET_PREFIX_RE.sub("", name.lstrip("/"))
+    if name.startswith("Type3"):
+        return None
+    return _STYLE_SUFFIX_RE.sub("", name).strip() or None
+
+
+def is_standard_font(family: str) -> bool:
+    key = _PS_SUFFIX_RE.sub("", _NON_ALNUM_RE.sub("", family.lower()))
+    return key.startswith(STANDARD_FONT_PREFIXES)
+
+
+def families(font_names: Iterable[str]) -> tuple:
+    """Distinct font families of `font_names`, unnamed fonts dropped."""
+    return tuple(sorted({family for family in map(font_family, font_names) if family}))
+
+
+def is_content_image(width: float, height: float) -> bool:
+    return width >= MIN_IMAGE_PT and height >= MIN_IMAGE_PT
+
+
+def _rows(boxes: list) -> list:
+    """Groups (x0, y0, x1, y1) line boxes into rows of cells, top to bottom, cells left to right."""
+    rows = []
+    row = []
+    row_center = row_half = None
+    for box in sorted(boxes, key=lambda b: (b[1] + b[3]) / 2):
+        center = (box[1] + box[3]) / 2
+        half = (box[3] - box[1]) / 2
+        if row and abs(center - row_center) <= min(half, row_half):
+            row.append(box)
+            continue
+        if row:
+            rows.append(row)
+        row, row_center, row_half = [box], center, half
+    if row:
+        rows.append(row)
+
+    merged_rows = []
+    for row in rows:
+        row.sort()
+        height = max(box[3] - box[1] for box in row)
+        cells = [list(row[0])]
+        for x0, y0, x1, y1 in row[1:]:
+            cell = cells[-1]
+            if x0 - cell[2] < height:  # touching or overlapping: same cell (bullets, "Date ,")
+                cell[1], cell[2], cell[3] = min(cell[1], y0), max(cell[2], x1), max(cell[3], y1)
+            else:
+                cells.append([x0, y0, x1, y1])
+        merged_rows.append(cells)
+    return merged_rows
+
+
+def _aligned(row: list, previous: list) -> bool:
+    """True if at least TABLE_MIN_CELLS cells of `row` start where cells of `previous` start."""
+    starts = [cell[0] for cell in previous]
+    matches = sum(1 for cell in row if any(abs(cell[0] - start) <= ALIGN_TOLERANCE_PT for start in starts))
+    return matches >= TABLE_MIN_CELLS
+
+
+def _count_tables(rows: list) -> int:
+    tables = 0
+    run = 0
+    previous = None
+    for row in rows:
+        if len(row) >= TABLE_MIN_CELLS and (run == 0 or _aligned(row, previous)):
+            run += 1
+        else:
+            run = 1 if len(row) >= TABLE_MIN_CELLS else 0
+        if run == TABLE_MIN_ROWS:
+            tables += 1
+        previous = row
+    return tables
+
+
+def _is_multi_column(cells: list, page_width: float) -> bool:
+    total = len(cells)
+    if total < 2 * COLUMN_MIN_CELLS:
+        return False
+    band_start, band_end = page_width * GUTTER_BAND[0], page_width * GUTTER_BAND[1]
+    min_side = max(COLUMN_MIN_CELLS, total * COLUMN_MIN_SHARE)
+    for gutter_start in sorted({cell[2] for cell in cells if cell[2] <= band_end}):
+        left = [cell for cell in cells if cell[2] <= gutter_start]
+        right = [cell for cell in cells if cell[0] >= gutter_start + MIN_GUTTER_PT]
+        crossing = total - len(left) - len(right)
+        if len(left) < min_side or len(right) < min_side or crossing > total * COLUMN_MAX_CROSSING:
+            continue
+        if min(cell[0] for cell in right) < band_start:
+            continue
+        # Side by side rather than one block above the other
+        left_top, left_bottom = min(c[1] for c in left), max(c[3] for c in left)
+        right_top, right_bottom = min(c[1] for c in right), max(c[3] for c in right)
+        overlap = min(left_bottom, right_bottom) - max(left_top, right_top)
+        if overlap > 0.5 * min(left_bottom - left_top, right_bottom - right_top):
+            return True
+    return False
+
+
+def analyze_page(boxes: list, page_width: float, images: int = 0, fonts: Iterable[str] = ()) -> PageLayout:
+    """
+    Builds a PageLayout from the (x0, y0, x1, y1) boxes of a page's non-blank text lines,
+    its content-image count and the raw names of the fonts its text uses.
+    """
+    rows = _rows(boxes)
+    cells = [cell for row in rows for cell in row]
+    return PageLayout(
+        images=images,
+        fonts=families(fonts),
+        multi_column=_is_multi_column(cells, page_width),
+        tables=_count_tables(rows),
+    )
@@ -8,6 +8,8 @@ from langchain_groq import ChatGroq
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.utils import process_documents
 from core.embedding import calculate_resume_jd_similarity
+from core.document import ParsedDocument, raw_text_of
+from core.jd_normalizer import strip_jd_boilerplate
 
 load_dotenv()
 groq_api_key = os.environ["GROQ_API_KEY"]
@@ -17,12 +19,15 @@ if not groq_api_key:
 
 groq_llm = ChatGroq(groq_api_key=groq_api_key, model_name="llama-3.1-8b-instant")
 
-def generate_insights(resume_text: str, jd_text: str, similarity_score: float) -> dict:
+def generate_insights(resume_text: str | ParsedDocument, jd_text: str | ParsedDocument, similarity_score: float) -> dict:
     """
     Generates insights for a resume based on a job description and their matching score
     using an LLM. Insights include Missing Skills, Improvements, Strengths, Weaknesses,
-    and Suggestions.
+    and Suggestions. Accepts raw text or ParsedDocuments.
+    JD boilerplate is stripped before it goes into the prompt.
     """
+    resume_text = raw_text_of(resume_text)
+    jd_text = strip_jd_boilerplate(raw_text_of(jd_text), caller="generate_insights")
     prompt = f"""
 You are an AI assistant specialized in resume analysis and career counseling.
 Your task is to provide a detailed analysis of a candidate's resume against a given job description.
@@ -0,0 +1,138 @@
+"""
+Offline NLTK resource manager.
+
+Every NLTK corpus or model the project uses is resolved here. Availability is
+checked once per process, resources are loaded lazily on first use, and nothing
+is ever downloaded in the request path: a missing resource raises
+`NLTKResourceError` instead of hitting the network.
+
+Corpora are looked up in the bundled directory (`data/nltk_data`, or
+`ARIA_NLTK_DATA`) before NLTK's default search path. Container builds should
+populate it once with:
+
+    python -m core.nltk_resources
+"""
+import functools
+import os
+import threading
+
+import nltk
+
+BUNDLED_NLTK_DATA = os.environ.get(
+    "ARIA_NLTK_DATA",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'nltk_data'))
+)
+
+# nltk.download name -> nltk.data.find path
+NLTK_RESOURCES = {
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "vader_lexicon": "sentiment/vader_lexicon.zip",
+}
+
+# NLTK >= 3.8.2 tokenizes sentences with the pickle-free punkt_tab tables
+PUNKT_RESOURCE = "punkt_tab" if hasattr(nltk.tokenize, "PunktTokenizer") else "punkt"
+
+_data_path_lock = threading.Lock()
+
+
+class NLTKResourceError(LookupError):
+    """Raised when a required NLTK resource is not installed locally."""
+
+
+def _configure_data_path() -> None:
+    with _data_path_lock:
+        if BUNDLED_NLTK_DATA not in nltk.data.path:
+            nltk.data.path.insert(0, BUNDLED_NLTK_DATA)
+
+
+@functools.lru_cache(maxsize=None)
+def resource_status() -> dict:
+    """
+    Returns {resource name: installed?} for every resource in NLTK_RESOURCES.
+    Checked once per process; `warm_up` refreshes it after downloading.
+    """
+    _configure_data_path()
+    status = {}
+    for name, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+            status[name] = True
+        except LookupError:
+            status[name] = False
+    return status
+
+
+def require(name: str) -> None:
+    """Raises NLTKResourceError if the named resource is not installed."""
+    if not resource_status().get(name):
+        raise NLTKResourceError(
+            f"NLTK resource '{name}' is not installed. "
+            f"Run `python -m core.nltk_resources` to download it into {BUNDLED_NLTK_DATA}."
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_stopwords() -> frozenset:
+    """English stopwords as a frozenset, loaded on first use."""
+    require("stopwords")
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+
+@functools.lru_cache(maxsize=None)
+def get_lemmatizer():
+    """A shared WordNetLemmatizer with WordNet already loaded."""
+    require("wordnet")
+    from nltk.corpus import wordnet
+    from nltk.stem import WordNetLemmatizer
+    # Load eagerly: WordNet's lazy loader is not safe to trigger from several threads at once
+    wordnet.ensure_loaded()
+    return WordNetLemmatizer()
+
+
+@functools.lru_cache(maxsize=None)
+def get_sentiment_analyzer():
+    """A shared VADER SentimentIntensityAnalyzer, loaded on first use."""
+    require("vader_lexicon")
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+def word_tokenize(text: str) -> list[str]:
+    """`nltk.word_tokenize` that fails fast instead of downloading Punkt."""
+    require(PUNKT_RESOURCE)
+    return nltk.word_tokenize(text)
+
+
+def warm_up(download: bool = True, download_dir: str = BUNDLED_NLTK_DATA) -> dict:
+    """
+    Entry point for container builds and process start-up. Optionally downloads any
+    missing resources into `download_dir`, then loads every available resource so the
+    first request does not pay for it. Returns the resource status.
+    """
+    if download:
+        missing = [name for name, installed in resource_status().items() if not installed]
+        for name in missing:
+            nltk.download(name, download_dir=download_dir, quiet=True)
+        if missing:
+            resource_status.cache_clear()
+
+    status = resource_status()
+    if status["stopwords"]:
+        get_stopwords()
+    if status["wordnet"]:
+        get_lemmatizer()
+    if status["vader_lexicon"]:
+        get_sentiment_analyzer()
+    return status
+
+
+if __name__ == "__main__":
+    final_status = warm_up()
+    for resource, installed in final_status.items():
+        print(f"{'✅' if installed else '❌'} {resource}")
+    if not all(final_status.values()):
+        raise SystemExit(1)
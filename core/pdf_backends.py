@@ -0,0 +1,272 @@
+"""
+Pluggable PDF text-extraction backends.
+
+Each backend exposes the same three operations (page count, lazy per-page text and a
+page range for worker processes), so `core.utils` does not care which library reads
+the PDF. Passing a list as `layout=` to the text operations also records one
+`core.layout.PageLayout` per page, taken from the same parse that produced its text.
+The backend is chosen once per process: `ARIA_PDF_BACKEND` if set, otherwise
+the fastest installed library in BACKEND_PREFERENCE order (PyMuPDF, then pypdf, then
+pdfminer.six; see benchmarks/bench_pdf_backends.py for the measurements).
+"""
+import functools
+import math
+import os
+import re
+from typing import Iterator
+
+from core.layout import analyze_page, is_content_image
+
+# PyMuPDF names Type3 fonts by their object reference, e.g. "Type3 (12 0 R)"
+_TYPE3_FONT_RE = re.compile(r'^Type3 \((\d+) 0 R\)$')
+
+
+class PDFBackend:
+    """Base class for PDF extraction backends. Page text is stripped of surrounding whitespace."""
+    name = None
+    # Bump when a backend's output changes so cached extractions are ignored
+    version = 1
+
+    def is_available(self) -> bool:
+        raise NotImplementedError
+
+    def page_count(self, file_path: str) -> int:
+        raise NotImplementedError
+
+    def iter_pages(self, file_path: str, layout: list = None) -> Iterator[str]:
+        """Yields page text lazily, one page at a time, appending each page's PageLayout to `layout` if given."""
+        raise NotImplementedError
+
+    def extract_range(self, file_path: str, start: int, stop: int, layout: list = None) -> list[str]:
+        """Returns the text of pages [start, stop). Re-opens the file, so it is safe in a worker process."""
+        raise NotImplementedError
+
+    @property
+    def cache_tag(self) -> str:
+        """Identifies this backend's output in cache keys."""
+        return f"{self.name}-{self.version}"
+
+
+class PyMuPDFBackend(PDFBackend):
+    """MuPDF via PyMuPDF: native C extraction, the fastest of the three."""
+    name = "pymupdf"
+
+    def _module(self):
+        try:
+            import pymupdf
+        except ImportError:  # PyMuPDF < 1.24 only ships the `fitz` name
+            import fitz as pymupdf
+        return pymupdf
+
+    def is_available(self) -> bool:
+        try:
+            self._module()
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, file_path: str) -> int:
+        with self._module().open(file_path) as document:
+            return document.page_count
+
+    @staticmethod
+    def _font_name(document, font: str, names: dict) -> str:
+        """Resolves PyMuPDF's Type3 placeholder names to the font descriptor's FontName."""
+        match = _TYPE3_FONT_RE.match(font)
+        if match is None:
+            return font
+        if font not in names:
+            kind, descriptor = document.xref_get_key(int(match.group(1)), "FontDescriptor")
+            name = font
+            if kind == "xref":
+                kind, value = document.xref_get_key(int(descriptor.split()[0]), "FontName")
+                if kind == "name":
+                    name = value
+            names[font] = name
+        return names[font]
+
+    def _page_text(self, page, layout: list, font_names: dict = None) -> str:
+        if layout is None:
+            return page.get_text("text").strip()
+        # One text page serves both the plain text and the block/line/span structure
+        pymupdf = self._module()
+        textpage = page.get_textpage(flags=pymupdf.TEXTFLAGS_TEXT | pymupdf.TEXT_PRESERVE_IMAGES)
+        boxes, fonts, images = [], set(), 0
+        for block in textpage.extractDICT()["blocks"]:
+            if block["type"] == 1:
+                x0, y0, x1, y1 = block["bbox"]
+                images += is_content_image(x1 - x0, y1 - y0)
+                continue
+            for line in block["lines"]:
+                spans = [span for span in line["spans"] if span["text"].strip()]
+                if spans:
+                    boxes.append(tuple(line["bbox"]))
+                    fonts.update(span["font"] for span in spans)
+        fonts = {self._font_name(page.parent, font, font_names) for font in fonts}
+        layout.append(analyze_page(boxes, page.rect.width, images, fonts))
+        return textpage.extractText().strip()
+
+    def iter_pages(self, file_path: str, layout: list = None) -> Iterator[str]:
+        with self._module().open(file_path) as document:
+            font_names = {}
+            for page in document:
+                yield self._page_text(page, layout, font_names)
+
+    def extract_range(self, file_path: str, start: int, stop: int, layout: list = None) -> list[str]:
+        with self._module().open(file_path) as document:
+            font_names = {}
+            return [self._page_text(document[i], layout, font_names) for i in range(start, stop)]
+
+
+class PyPDFBackend(PDFBackend):
+    """Pure-Python pypdf, the library LangChain's PyPDFLoader wraps (same page text, without the wrapper)."""
+    name = "pypdf"
+
+    def is_available(self) -> bool:
+        try:
+            import pypdf  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def page_count(self, file_path: str) -> int:
+        from pypdf import PdfReader
+        return len(PdfReader(file_path).pages)
+
+    @staticmethod
+    def _page_text(page, layout: list) -> str:
+        if layout is None:
+            return page.extract_text(extraction_mode="plain").strip()
+        # pypdf reports text runs and operators to visitors while it extracts, but not glyph
+        # widths, so a run's width is estimated from its font size
+        boxes, fonts = [], set()
+        images = 0
+        resources = page.get("/Resources")
+        xobjects = resources.get_object().get("/XObject") if resources else None
+        xobjects = xobjects.get_object() if xobjects else {}
+
+        def visit_text(text, cm, tm, font_dict, font_size):
+            line = max(text.split("\n"), key=len).strip()
+            if not line:
+                return
+            if font_dict:
+                name = font_dict.get("/BaseFont")
+                if name is None and "/FontDescriptor" in font_dict:  # Type3 fonts only name their descriptor
+                    name = font_dict["/FontDescriptor"].get_object().get("/FontName")
+                fonts.add(str(name or ""))
+            x = cm[0] * tm[4] + cm[2] * tm[5] + cm[4]
+            y = cm[1] * tm[4] + cm[3] * tm[5] + cm[5]
+            size = font_size * math.hypot(tm[0], tm[1]) * math.hypot(cm[0], cm[1]) or font_size
+            # PDF y grows upwards; boxes are top-down like the other backends
+            top = float(page.mediabox.top) - y - size
+            boxes.append((x, top, x + 0.5 * size * len(line), top + size))
+
+        def visit_operand(operator, operands, cm, tm):
+            nonlocal images
+            if operator == b"Do" and operands:
+                xobject = xobjects.get(operands[0])
+                if xobject is not None and xobject.get_object().get("/Subtype") == "/Image":
+                    images += is_content_image(math.hypot(cm[0], cm[1]), math.hypot(cm[2], cm[3]))
+
+        text = page.extract_text(extraction_mode="plain", visitor_text=visit_text,
+                                 visitor_operand_before=visit_operand).strip()
+        layout.append(analyze_page(boxes, float(page.mediabox.width), images, fonts))
+        return text
+
+    def iter_pages(self, file_path: str, layout: list = None) -> Iterator[str]:
+        from pypdf import PdfReader
+        for page in PdfReader(file_path).pages:
+            yield self._page_text(page, layout)
+
+    def extract_range(self, file_path: str, start: int, stop: int, layout: list = None) -> list[str]:
+        from pypdf import PdfReader
+        reader = PdfReader(file_path)
+        return [self._page_text(reader.pages[i], layout) for i in range(start, stop)]
+
+
+class PDFMinerBackend(PDFBackend):
+    """Pure-Python pdfminer.six layout analysis: slowest, kept as a fallback."""
+    name = "pdfminer"
+
+    def is_available(self) -> bool:
+        try:
+            import pdfminer.high_level  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    @staticmethod
+    def _page_text(page_layout, layout: list = None) -> str:
+        from pdfminer.layout import LTChar, LTFigure, LTImage, LTTextContainer, LTTextLine
+        text = "".join(element.get_text() for element in page_layout if isinstance(element, LTTextContainer)).strip()
+        if layout is None:
+            return text
+        boxes, fonts, images = [], set(), 0
+        pending = list(page_layout)
+        while pending:
+            element = pending.pop()
+            if isinstance(element, LTImage):
+                images += is_content_image(element.width, element.height)
+            elif isinstance(element, LTTextLine):
+                if element.get_text().strip():
+                    x0, y0, x1, y1 = element.bbox
+                    # pdfminer y grows upwards; boxes are top-down like the other backends
+                    boxes.append((x0, page_layout.height - y1, x1, page_layout.height - y0))
+                    fonts.update(char.fontname for char in element
+                                 if isinstance(char, LTChar) and not char.get_text().isspace())
+            elif isinstance(element, (LTTextContainer, LTFigure)):
+                pending.extend(element)
+        layout.append(analyze_page(boxes, page_layout.width, images, fonts))
+        return text
+
+    def page_count(self, file_path: str) -> int:
+        from pdfminer.pdfpage import PDFPage
+        with open(file_path, 'rb') as f:
+            return sum(1 for _ in PDFPage.get_pages(f))
+
+    def iter_pages(self, file_path: str, layout: list = None) -> Iterator[str]:
+        from pdfminer.high_level import extract_pages
+        for page_layout in extract_pages(file_path):
+            yield self._page_text(page_layout, layout)
+
+    def extract_range(self, file_path: str, start: int, stop: int, layout: list = None) -> list[str]:
+        from pdfminer.high_level import extract_pages
+        return [self._page_text(page_layout, layout)
+                for page_layout in extract_pages(file_path, page_numbers=range(start, stop))]
+
+
+PDF_BACKENDS = {backend.name: backend for backend in (PyMuPDFBackend(), PyPDFBackend(), PDFMinerBackend())}
+
+# Fastest first
+BACKEND_PREFERENCE = ("pymupdf", "pypdf", "pdfminer")
+
+
+def available_backends() -> list[str]:
+    """Names of the installed backends, fastest first."""
+    return [name for name in BACKEND_PREFERENCE if PDF_BACKENDS[name].is_available()]
+
+
+def get_pdf_backend(name: str = None) -> PDFBackend:
+    """
+    Returns the named backend, or the process-wide default when `name` is None.
+    Raises ValueError for an unknown name and ImportError if its library is missing.
+    """
+    if name is None:
+        return _default_backend()
+    if name not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{name}'. Expected one of {', '.join(BACKEND_PREFERENCE)}.")
+    backend = PDF_BACKENDS[name]
+    if not backend.is_available():
+        raise ImportError(f"PDF backend '{name}' is not installed.")
+    return backend
+
+
+@functools.lru_cache(maxsize=None)
+def _default_backend() -> PDFBackend:
+    configured = os.environ.get("ARIA_PDF_BACKEND")
+    if configured:
+        return get_pdf_backend(configured)
+    available = available_backends()
+    if not available:
+        raise ImportError("No PDF backend is installed. Install PyMuPDF, pypdf or pdfminer.six.")
+    return PDF_BACKENDS[available[0]]
@@ -8,6 +8,7 @@ from fpdf import FPDF # For PDF generation
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.utils import process_documents
+from core.jd_normalizer import strip_jd_boilerplate
 load_dotenv()
 groq_api_key = os.environ.get("GROQ_API_KEY")
 
@@ -22,7 +23,9 @@ is_mock_llm = False
 def generate_tailored_cv_content_from_llm(original_resume_text: str, original_jd_text: str) -> str:
     """
     Generates tailored CV content using an LLM, structured for a new CV document.
+    JD boilerplate is stripped before it goes into the prompt.
     """
+    original_jd_text = strip_jd_boilerplate(original_jd_text, caller="generate_tailored_cv_content_from_llm")
     if is_mock_llm:
         print("MOCK LLM: Returning structured placeholder content.")
         return """
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# Cache location can be overridden so containers can point it at a volume.
+DEFAULT_CACHE_DIR = os.environ.get(
+    "ARIA_CACHE_DIR",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'cache'))
+)
+DEFAULT_MAX_ENTRIES = 256
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    Returns the hex SHA-256 digest of a file's bytes, read in 1 MiB chunks.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResumeCache:
+    """
+    Content-addressed, size-bounded on-disk cache for parsed resumes.
+
+    Entries are keyed by the SHA-256 of the file bytes plus the extractor version,
+    so the same resume uploaded from different tabs or reruns is parsed only once.
+    Each entry holds the extracted text, the layout facts collected with it and,
+    optionally, the cleaned tokens together with the cleaner version that produced
+    them. The least recently used entries are evicted once `max_entries` is exceeded.
+    """
+    def __init__(self, db_path: str = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path or os.path.join(DEFAULT_CACHE_DIR, "resume_cache.sqlite3")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Token lookups follow a text hit for the same key, so they are counted apart
+        self.token_hits = 0
+        self.token_misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS resumes (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    tokens TEXT,
+                    cleaner_version TEXT,
+                    last_access REAL NOT NULL,
+                    layout TEXT
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(resumes)")}
+            if "layout" not in columns:  # databases created before layout facts were cached
+                conn.execute("ALTER TABLE resumes ADD COLUMN layout TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON resumes(last_access)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:  # commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(content_hash: str, extractor_version: str) -> str:
+        """Builds the cache key for a content hash and extractor version."""
+        return f"{content_hash}:{extractor_version}"
+
+    def key_for_file(self, file_path: str, extractor_version: str) -> str:
+        """Hashes the file at `file_path` and returns its cache key."""
+        return self.make_key(file_sha256(file_path), extractor_version)
+
+    def get_text(self, key: str) -> str | None:
+        """Returns the cached extracted text for `key`, or None on a miss."""
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT text FROM resumes WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE resumes SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+            return row[0]
+
+    def get_tokens(self, key: str, cleaner_version: str) -> list[str] | None:
+        """
+        Returns the cached cleaned tokens for `key`, or None if they are missing
+        or were produced by a different cleaner version. Counted in `token_hits` and
+        `token_misses`, not in the text lookups behind `hit_rate`.
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT tokens FROM resumes WHERE key = ? AND cleaner_version = ?",
+                (key, cleaner_version)
+            ).fetchone()
+            if row is None or row[0] is None:
+                self.token_misses += 1
+                return None
+            conn.execute("UPDATE resumes SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.token_hits += 1
+            return json.loads(row[0])
+
+    def get_layout(self, key: str) -> dict | None:
+        """
+        Returns the layout facts stored with `key`'s text, or None. Meant to follow a
+        `get_text` hit, so it is not counted as a separate lookup.
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT layout FROM resumes WHERE key = ?", (key,)).fetchone()
+            return json.loads(row[0]) if row and row[0] else None
+
+    def put_text(self, key: str, text: str, layout: dict = None) -> None:
+        """Stores extracted text (and its layout facts) for `key`, dropping any tokens cached for older text."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO resumes (key, text, tokens, cleaner_version, last_access, layout) "
+                "VALUES (?, ?, NULL, NULL, ?, ?)",
+                (key, text, time.time(), json.dumps(layout) if layout is not None else None)
+            )
+            self._evict(conn)
+
+    def put_tokens(self, key: str, tokens: list[str], cleaner_version: str) -> None:
+        """Attaches cleaned tokens to an existing entry. No-op if the entry was evicted."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE resumes SET tokens = ?, cleaner_version = ?, last_access = ? WHERE key = ?",
+                (json.dumps(tokens), cleaner_version, time.time(), key)
+            )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        count = conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM resumes WHERE key IN "
+                "(SELECT key FROM resumes ORDER BY last_access ASC LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+
+    def stats(self) -> dict:
+        """
+        Returns hit/miss/eviction counters for this process and the current entry count.
+        `hit_rate` covers text lookups; token lookups have their own counters.
+        """
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "token_hits": self.token_hits,
+            "token_misses": self.token_misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM resumes")
+        self.hits = self.misses = self.token_hits = self.token_misses = self.evictions = 0
@@ -0,0 +1,255 @@
+"""
+Supervised worker processes for extracting untrusted resume files.
+
+A malformed or decompression-bomb PDF can pin a core or exhaust memory inside the PDF
+library, and in the web UIs that happens on a server thread. With sandboxing enabled
+(`sandbox=True` on the loaders, or ARIA_SANDBOX_EXTRACTION=1), extraction runs in one
+of a small pool of long-lived worker processes instead. The supervisor waits for each
+job with a wall-clock timeout while polling the worker's resident memory; a worker that
+hits either limit, or crashes, is killed and replaced on next use, and the caller gets
+an `ExtractionError` describing what went wrong. Only as many files as there are
+workers are parsed at once, so a burst of uploads cannot starve the rest of the server.
+
+Memory is read with psutil when installed, else from /proc. Where neither exists
+(Windows without psutil) only the timeout and the worker's address-space backstop apply.
+"""
+import importlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+EXTRACTION_TIMEOUT_S = float(os.environ.get("ARIA_EXTRACT_TIMEOUT", 30))
+EXTRACTION_MAX_RSS_MB = int(os.environ.get("ARIA_EXTRACT_MAX_RSS_MB", 512))
+SANDBOX_WORKERS = int(os.environ.get("ARIA_SANDBOX_WORKERS", min(2, os.cpu_count() or 1)))
+# Workers are also replaced after this many jobs, so leaks in the PDF libraries cannot accumulate
+MAX_JOBS_PER_WORKER = 200
+
+_POLL_INTERVAL_S = 0.05
+# Starting a worker (interpreter plus preloaded modules) is not counted against a job's timeout
+_STARTUP_TIMEOUT_S = 120
+# The worker's address-space limit sits this far above the RSS cap: a backstop for allocations
+# faster than the supervisor's polling, loose enough that normal virtual-memory overhead fits
+_ADDRESS_SPACE_HEADROOM = 1 << 30
+
+
+def sandbox_enabled(sandbox: bool = None) -> bool:
+    """Resolves a `sandbox=` argument, defaulting to the ARIA_SANDBOX_EXTRACTION environment variable."""
+    if sandbox is None:
+        return os.environ.get("ARIA_SANDBOX_EXTRACTION", "").lower() in ("1", "true", "yes")
+    return sandbox
+
+
+class ExtractionError(Exception):
+    """
+    Raised when sandboxed extraction fails. `kind` is one of:
+    "timeout", "memory", "crashed", "busy" (no worker became free in time) or
+    "invalid" (the extractor itself rejected the file).
+    """
+    def __init__(self, kind: str, message: str, file_name: str = None):
+        super().__init__(message)
+        self.kind = kind
+        self.message = message
+        self.file_name = file_name
+
+    def as_dict(self) -> dict:
+        return {"error": self.message, "error_kind": self.kind, "file_name": self.file_name}
+
+
+def _rss_bytes(pid: int) -> int | None:
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _limit_address_space(max_rss: int) -> None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    limit = max_rss + _ADDRESS_SPACE_HEADROOM
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker_main(conn, max_rss: int, preload: tuple) -> None:
+    """Worker loop: imports `preload`, reports ready, then runs (function, args) jobs until the pipe closes."""
+    for module in preload:
+        importlib.import_module(module)
+    _limit_address_space(max_rss)
+    conn.send(("ready",))
+    while True:
+        try:
+            func, args = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            reply = ("ok", func(*args))
+        except MemoryError:
+            reply = ("memory", "MemoryError")
+        except Exception as e:
+            reply = ("invalid", str(e) or type(e).__name__)
+        try:
+            conn.send(reply)
+        except (EOFError, OSError):
+            return  # the supervisor closed the pipe
+        except Exception as e:  # the result could not be pickled
+            conn.send(("invalid", str(e) or type(e).__name__))
+
+
+class _Worker:
+    def __init__(self, context, max_rss: int, preload: tuple):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, max_rss, preload), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        try:
+            ready = self.conn.poll(_STARTUP_TIMEOUT_S) and self.conn.recv() == ("ready",)
+        except EOFError:
+            ready = False
+        if not ready:
+            self.stop()
+            raise EOFError("sandbox worker did not start")
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class SandboxPool:
+    """
+    A fixed number of supervised worker processes. `run` sends a job to an idle worker
+    and enforces the time and memory limits while it runs. Workers import the `preload`
+    modules when they start, so a job's time limit covers only its own work.
+    """
+    def __init__(self, workers: int = SANDBOX_WORKERS, timeout: float = EXTRACTION_TIMEOUT_S,
+                 max_rss_mb: int = EXTRACTION_MAX_RSS_MB, preload: tuple = ()):
+        self.timeout = timeout
+        self.max_rss = max_rss_mb * 1024 * 1024
+        self.preload = tuple(preload)
+        # Spawned rather than forked: the UIs run this from server threads, which fork does not copy safely
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = queue.Queue()
+        for _ in range(workers):
+            self._idle.put(None)  # started on first use
+        self.stats = {"jobs": 0, "timeouts": 0, "memory": 0, "crashes": 0, "recycled": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def run(self, func, *args, timeout: float = None, file_name: str = None):
+        """
+        Returns func(*args) computed in a worker process. `func` must be a module-level
+        function. Raises ExtractionError if a limit is hit, the worker dies or `func` raises.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        label = file_name or "the file"
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise ExtractionError("busy", "The server is busy extracting other files. Please try again.", file_name)
+
+        healthy = False
+        try:
+            if worker is None or worker.jobs >= MAX_JOBS_PER_WORKER:
+                if worker is not None:
+                    worker.stop()
+                    self._count("recycled")
+                worker = None
+                try:
+                    worker = _Worker(self._context, self.max_rss, self.preload)
+                except (EOFError, OSError):
+                    self._count("crashes")
+                    raise ExtractionError("crashed", "The extraction worker failed to start.", file_name)
+            worker.jobs += 1
+            self._count("jobs")
+            try:
+                worker.conn.send((func, args))
+
+                deadline = time.monotonic() + timeout
+                while not worker.conn.poll(_POLL_INTERVAL_S):
+                    if not worker.process.is_alive():
+                        self._count("crashes")
+                        raise ExtractionError(
+                            "crashed", f"The extractor crashed while reading {label}. The file may be corrupt.",
+                            file_name)
+                    rss = _rss_bytes(worker.process.pid)
+                    if rss is not None and rss > self.max_rss:
+                        self._count("memory")
+                        raise ExtractionError(
+                            "memory", f"Reading {label} needed more than {self.max_rss >> 20} MB and was stopped. "
+                                      f"The file may be malformed; try re-exporting it as a PDF.", file_name)
+                    if time.monotonic() > deadline:
+                        self._count("timeouts")
+                        raise ExtractionError(
+                            "timeout", f"Reading {label} took longer than {timeout:g}s and was stopped. "
+                                       f"The file may be malformed; try re-exporting it as a PDF.", file_name)
+
+                status, *payload = worker.conn.recv()
+            except (EOFError, OSError):
+                # The pipe broke (BrokenPipeError, ConnectionResetError) or closed: the worker is gone
+                self._count("crashes")
+                raise ExtractionError(
+                    "crashed", f"The extractor crashed while reading {label}. The file may be corrupt.", file_name)
+            if status == "memory":
+                self._count("memory")
+                raise ExtractionError(
+                    "memory", f"Reading {label} ran out of memory and was stopped. "
+                              f"The file may be malformed; try re-exporting it as a PDF.", file_name)
+            healthy = True
+            if status == "invalid":
+                raise ExtractionError("invalid", payload[0], file_name)
+            return payload[0]
+        finally:
+            if not healthy and worker is not None:
+                # Killed, crashed or out of memory: never reuse it; a fresh worker starts on next use
+                worker.stop()
+                worker = None
+            self._idle.put(worker)
+
+    def shutdown(self) -> None:
+        """Stops every idle worker; later jobs start fresh ones."""
+        stopped = 0
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.stop()
+            stopped += 1
+        for _ in range(stopped):
+            self._idle.put(None)
+
+
+_sandbox = None
+_sandbox_lock = threading.Lock()
+
+
+def get_sandbox() -> SandboxPool:
+    """Returns the process-wide sandbox pool, creating it on first use."""
+    global _sandbox
+    with _sandbox_lock:
+        if _sandbox is None:
+            _sandbox = SandboxPool(preload=("core.utils",))
+        return _sandbox
@@ -0,0 +1,141 @@
+"""
+One-pass resume section segmenter.
+
+`segment_sections` walks the extracted resume text once, recognises heading lines
+("EXPERIENCE", "Work History:", "Technical Skills", ...) and returns a SectionIndex
+of character spans. ATS checks, section-level embeddings and prompt trimming can then
+look a section up directly instead of re-scanning the whole resume.
+"""
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+# The sections the rest of the project asks for by name
+CORE_SECTIONS = ("contact", "summary", "experience", "education", "skills", "projects")
+
+# Canonical section -> heading phrasings. Other headings are recognised only so they
+# end the preceding section instead of being swallowed into it.
+SECTION_HEADINGS = {
+    "contact": ["contact", "contact information", "contact info", "contact details", "personal information", "personal details"],
+    "summary": ["summary", "professional summary", "career summary", "executive summary", "profile", "professional profile",
+                "career profile", "objective", "career objective", "professional objective", "about", "about me"],
+    "experience": ["experience", "work experience", "professional experience", "relevant experience", "employment",
+                   "employment history", "work history", "career history", "internships", "internship experience"],
+    "education": ["education", "academic background", "academic qualifications", "education and training",
+                  "educational background", "qualifications"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "skills summary", "core competencies",
+               "competencies", "expertise", "areas of expertise", "technologies", "tech stack", "tools and technologies"],
+    "projects": ["projects", "project", "personal projects", "academic projects", "selected projects", "key projects",
+                 "project experience"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "courses", "training"],
+    "awards": ["awards", "honors", "honours", "achievements", "awards and achievements", "accomplishments"],
+    "publications": ["publications", "research"],
+    "languages": ["languages"],
+    "interests": ["interests", "hobbies", "hobbies and interests"],
+    "volunteering": ["volunteering", "volunteer experience", "leadership", "extracurricular activities"],
+    "references": ["references"],
+}
+
+_HEADING_TO_SECTION = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+
+# A heading is a line holding only a known phrase (any case, & or "and", optional trailing colon).
+# Longest phrasings first so "work experience" wins over "experience".
+_HEADING_RE = re.compile(
+    r'^[ \t]*(' +
+    '|'.join(
+        r'[ \t]+'.join(re.escape(word) if word != "and" else r'(?:and|&)' for word in heading.split())
+        for heading in sorted(_HEADING_TO_SECTION, key=len, reverse=True)
+    ) +
+    r')[ \t]*:?[ \t]*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class SectionSpan(NamedTuple):
+    """A section's heading and body as character offsets into the resume text."""
+    name: str
+    heading: str
+    start: int       # start of the heading line (or 0 for the implicit contact header)
+    body_start: int  # first character after the heading line
+    end: int         # start of the next heading, or the end of the text
+
+
+class SectionIndex:
+    """
+    Section spans of one resume text. Only the first occurrence of each section is
+    indexed by name; every span is kept in document order in `spans`.
+    """
+    __slots__ = ("text", "spans", "_by_name")
+
+    def __init__(self, text: str, spans: List[SectionSpan]):
+        self.text = text
+        self.spans = spans
+        self._by_name = {}
+        for span in spans:
+            self._by_name.setdefault(span.name, span)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[SectionSpan]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __repr__(self) -> str:
+        return f"SectionIndex({[span.name for span in self.spans]})"
+
+    def get(self, name: str) -> Optional[SectionSpan]:
+        """The span of section `name`, or None if the resume has no such section."""
+        return self._by_name.get(name)
+
+    def section_text(self, name: str, default: str = "") -> str:
+        """The body of section `name` (without its heading), stripped."""
+        span = self._by_name.get(name)
+        if span is None:
+            return default
+        return self.text[span.body_start:span.end].strip()
+
+    def as_dict(self, names=CORE_SECTIONS) -> Dict[str, str]:
+        """{section name: body text} for the requested sections that are present."""
+        return {name: self.section_text(name) for name in names if name in self._by_name}
+
+
+def heading_section(line: str) -> Optional[str]:
+    """The section a single line opens if it is a heading line, else None."""
+    match = _HEADING_RE.match(line)
+    if match is None:
+        return None
+    return _HEADING_TO_SECTION[_WHITESPACE_RE.sub(' ', match.group(1).lower()).replace('&', 'and')]
+
+
+def segment_sections(text: str) -> SectionIndex:
+    """
+    Splits resume text into sections in a single pass over the text.
+
+    Text before the first heading is the resume header and is indexed as "contact"
+    unless the resume has an explicit contact heading. Text without any recognised
+    heading yields an empty index.
+    """
+    spans = []
+    previous = None
+    for match in _HEADING_RE.finditer(text):
+        heading = _WHITESPACE_RE.sub(' ', match.group(1).lower()).replace('&', 'and')
+        if previous is None:
+            if match.start() > 0 and text[:match.start()].strip():
+                spans.append(SectionSpan("contact", "", 0, 0, match.start()))
+        else:
+            spans.append(previous._replace(end=match.start()))
+        body_start = match.end() + 1 if match.end() < len(text) else match.end()
+        previous = SectionSpan(_HEADING_TO_SECTION[heading], match.group(1).strip(),
+                               match.start(), body_start, len(text))
+
+    if previous is not None:
+        spans.append(previous)
+    if spans and spans[0].start == 0 and not spans[0].heading and \
+            any(span.name == "contact" for span in spans[1:]):
+        spans[0] = spans[0]._replace(name="header")
+    return SectionIndex(text, spans)
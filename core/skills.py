@@ -0,0 +1,230 @@
+"""
+Skills taxonomy extractor.
+
+The taxonomy (data/taxonomy/skills.json, or ARIA_SKILLS_TAXONOMY) maps canonical skills
+to their aliases and multi-word phrasings. It is compiled once per process into a token
+trie, and `extract_skills` makes a single left-to-right pass over the text, taking the
+longest phrase that starts at each token. The work per token is bounded by the longest
+phrase in the taxonomy, so matching is linear in the length of the text no matter how
+many skills the taxonomy holds.
+
+Text is tokenized with its own light normalization (lowercase, "+", "#" and inner "."
+kept) rather than `clean_text`, which would reduce "C++", "C#", ".NET" and "Node.js" to
+ambiguous fragments.
+
+Skills that are also common English words ("Go", "Make", "Express", "Chef", "Oracle") are
+listed with a "~" alias: they match only with exactly that casing, and only where they
+read as a skill rather than as the first word of a sentence, i.e. mid-sentence ("Skills:
+Go, Rust", "built with Chef") or at the start of a line or sentence when a list separator
+or the end of the line follows ("Go, Python" or a "- Chef" bullet).
+"""
+import functools
+import json
+import os
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from core.sections import SectionIndex
+
+DEFAULT_TAXONOMY_PATH = os.environ.get(
+    "ARIA_SKILLS_TAXONOMY",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'taxonomy', 'skills.json'))
+)
+
+# Categories that describe tools and technologies, as opposed to soft skills and business software
+TECHNICAL_CATEGORIES = frozenset({
+    "programming_languages", "frontend", "backend", "mobile", "databases", "cloud", "devops",
+    "data_engineering", "machine_learning", "generative_ai", "data_science_analytics", "testing_qa",
+    "security", "systems_networking", "embedded_hardware", "game_blockchain_xr", "architecture_practices",
+})
+
+# Words, keeping "+" and "#" ("c++", "c#") and inner dots ("node.js", "asp.net"), or a leading-dot word (".net")
+_TOKEN_RE = re.compile(r"(?:[^\W_]|[+#])+(?:\.(?:[^\W_]|[+#])+)*|\.[^\W_]+")
+_END = object()  # trie key holding the terminal entry
+_BULLET_CHARS = " \t-*\u2022\u00b7\u25aa\u25e6>"
+_SENTENCE_END_CHARS = ".!?"
+_LIST_SEPARATOR_CHARS = ",;/|)"
+
+
+class _Terminal(NamedTuple):
+    skill: str
+    surface: Optional[tuple]  # exact-case tokens for case-sensitive aliases, else None
+    ambiguous: bool = False   # "~" alias: also needs `_reads_as_skill` context
+
+
+class SkillMatch(NamedTuple):
+    """All occurrences of one canonical skill in a text."""
+    name: str
+    category: str
+    count: int
+    spans: list      # (start, end) character offsets of every occurrence
+    sections: list   # distinct resume sections the skill occurs in, in document order
+
+
+def _tokenize(text: str) -> list:
+    return [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
+
+
+def _reads_as_skill(text: str, start: int, end: int) -> bool:
+    """
+    Whether an ambiguous alias at text[start:end] is used as a skill: anywhere mid-sentence,
+    or first in its line or sentence only when a list separator or the end of the line follows.
+    """
+    line_start = text.rfind("\n", 0, start) + 1
+    before = text[line_start:start].lstrip(_BULLET_CHARS).rstrip()
+    if before and before[-1] not in _SENTENCE_END_CHARS:
+        return True
+    line_end = text.find("\n", end)
+    after = text[end:line_end if line_end >= 0 else len(text)].strip()
+    return not after or after[0] in _LIST_SEPARATOR_CHARS
+
+
+class SkillTaxonomy:
+    """A skills taxonomy compiled into a token trie."""
+
+    def __init__(self, taxonomy: Dict[str, Dict[str, List[str]]]):
+        self.categories = {}
+        self.conflicts = []
+        self._trie = {}
+        self.max_phrase_tokens = 0
+        for category, skills in taxonomy.items():
+            for skill, aliases in skills.items():
+                self.categories[skill] = category
+                forms = list(aliases)
+                if "=" + skill not in forms and "~" + skill not in forms:
+                    forms.append(skill)
+                for form in forms:
+                    self._add(skill, form)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_TAXONOMY_PATH) -> "SkillTaxonomy":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["skills"])
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def _insert(self, tokens: Iterable[str], terminal: _Terminal) -> None:
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        existing = node.get(_END)
+        if existing is not None and existing.skill != terminal.skill:
+            self.conflicts.append((" ".join(tokens), existing.skill, terminal.skill))
+            return  # the first definition wins
+        node[_END] = terminal
+
+    def _add(self, skill: str, form: str) -> None:
+        ambiguous = form.startswith("~")
+        case_sensitive = ambiguous or form.startswith("=")
+        tokens = [token for token, _, _ in _tokenize(form.lstrip("=~"))]
+        if not tokens:
+            return
+        lowered = [token.lower() for token in tokens]
+        self.max_phrase_tokens = max(self.max_phrase_tokens, len(tokens))
+        terminal = _Terminal(skill, tuple(tokens) if case_sensitive else None, ambiguous)
+        self._insert(lowered, terminal)
+        # Plural of the last word ("llms", "neural networks", "microservices")
+        last = lowered[-1]
+        if not case_sensitive and last.isalpha() and len(last) > 2 and not last.endswith("s"):
+            plural = lowered[:-1] + [last + "s"]
+            node = self._trie
+            for token in plural:
+                node = node.get(token)
+                if node is None:
+                    break
+            if node is None or _END not in node:
+                self._insert(plural, terminal)
+
+    def match(self, text: str, sections: SectionIndex = None) -> Dict[str, SkillMatch]:
+        """
+        Returns {canonical skill: SkillMatch} for every skill in `text`, in order of first
+        occurrence. With a SectionIndex of the same text, each match also records the resume
+        sections it occurs in.
+        """
+        tokens = _tokenize(text)
+        lowered = [token.lower() for token, _, _ in tokens]
+        section_starts = [span.start for span in sections.spans] if sections else []
+
+        found = {}
+        i, n = 0, len(tokens)
+        trie = self._trie
+        while i < n:
+            node = trie.get(lowered[i])
+            best = None
+            j = i
+            while node is not None:
+                j += 1
+                terminal = node.get(_END)
+                if terminal is not None and (
+                        terminal.surface is None or
+                        tuple(token for token, _, _ in tokens[i:j]) == terminal.surface) and (
+                        not terminal.ambiguous or _reads_as_skill(text, tokens[i][1], tokens[j - 1][2])):
+                    best = (j, terminal.skill)
+                node = node.get(lowered[j]) if j < n else None
+            if best is None:
+                i += 1
+                continue
+
+            end, skill = best
+            start_offset, end_offset = tokens[i][1], tokens[end - 1][2]
+            entry = found.get(skill)
+            if entry is None:
+                entry = found[skill] = {"spans": [], "sections": []}
+            entry["spans"].append((start_offset, end_offset))
+            if section_starts:
+                index = bisect_right(section_starts, start_offset) - 1
+                section = sections.spans[index].name if index >= 0 else None
+                if section and section not in entry["sections"]:
+                    entry["sections"].append(section)
+            i = end
+
+        return {
+            skill: SkillMatch(skill, self.categories[skill], len(entry["spans"]), entry["spans"], entry["sections"])
+            for skill, entry in found.items()
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def get_skill_taxonomy(path: str = DEFAULT_TAXONOMY_PATH) -> SkillTaxonomy:
+    """The compiled taxonomy, loaded once per process."""
+    taxonomy = SkillTaxonomy.from_file(path)
+    if taxonomy.conflicts:
+        print(f"Warning: {len(taxonomy.conflicts)} alias(es) in {path} map to more than one skill; "
+              f"the first definition is used.")
+    return taxonomy
+
+
+def extract_skills(text: str, sections: SectionIndex = None) -> Dict[str, SkillMatch]:
+    """Matches the default taxonomy against `text`; see `SkillTaxonomy.match`."""
+    return get_skill_taxonomy().match(text, sections)
+
+
+def technical_skills(skills: Dict[str, SkillMatch]) -> Dict[str, SkillMatch]:
+    """The subset of `skills` in TECHNICAL_CATEGORIES."""
+    return {name: match for name, match in skills.items() if match.category in TECHNICAL_CATEGORIES}
+
+
+def missing_skills(resume_skills: Dict[str, SkillMatch], jd_skills: Dict[str, SkillMatch]) -> List[str]:
+    """Skills the JD asks for that the resume never mentions, most-mentioned in the JD first."""
+    missing = [match for name, match in jd_skills.items() if name not in resume_skills]
+    return [match.name for match in sorted(missing, key=lambda match: -match.count)]
+
+
+def skills_chart_data(resume_skills: Dict[str, SkillMatch], jd_skills: Dict[str, SkillMatch] = None,
+                      top_n: int = 10) -> Dict[str, int]:
+    """
+    {skill: 0-100} for the report's skills chart. Skills the JD asks for come first, then
+    the resume's other technical skills; values are mention counts scaled to the most
+    mentioned skill.
+    """
+    candidates = technical_skills(resume_skills) or resume_skills
+    ranked = sorted(
+        candidates.values(),
+        key=lambda match: (jd_skills is not None and match.name not in jd_skills, -match.count)
+    )[:top_n]
+    if not ranked:
+        return {}
+    top_count = max(match.count for match in ranked)
+    return {match.name: round(100 * match.count / top_count) for match in ranked}
@@ -1,28 +1,338 @@
 import os
-from langchain_community.document_loaders import PyPDFLoader
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
 import re
 import string
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+import functools
+import zipfile
+import xml.etree.ElementTree as ET
 
-# Download NLTK data 
-# nltk.download('stopwords')
-# nltk.download('wordnet')
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.resume_cache import ResumeCache
+from core.document import ParsedDocument
+from core.pdf_backends import get_pdf_backend
+from core.layout import LayoutFacts, PageLayout, families, is_content_image
+from core.jd_normalizer import strip_jd_boilerplate
+from core.nltk_resources import get_stopwords, get_lemmatizer, word_tokenize
+from core.sandbox import get_sandbox, sandbox_enabled
 
-def load_resume(file_path: str):
+# Bump these whenever extraction or cleaning output changes so stale cache entries are ignored.
+# The PDF backend's own tag (see core.pdf_backends) is appended, since backends differ in output.
+EXTRACTOR_VERSION = "extract-3"
+CLEANER_VERSION = "nltk-1"
+
+# Upper bounds applied by the analysis pipelines so a mistakenly uploaded
+# portfolio or book does not cost a full parse.
+RESUME_MAX_PAGES = 20
+RESUME_MAX_CHARS = 100_000
+
+# Documents with fewer pages than this are always extracted in-process, since
+# spawning workers costs more than parsing a one- or two-page resume.
+PARALLEL_PAGE_THRESHOLD = 8
+
+_CACHEABLE_EXTENSIONS = ('.pdf', '.docx')
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_BODY = _WORD_NS + "body"
+_DOCX_PARAGRAPH = _WORD_NS + "p"
+_DOCX_TEXT = _WORD_NS + "t"
+_DOCX_TAB = _WORD_NS + "tab"
+_DOCX_BREAKS = (_WORD_NS + "br", _WORD_NS + "cr")
+_DOCX_BREAK_TYPE = _WORD_NS + "type"
+_DOCX_TABLE = _WORD_NS + "tbl"
+_DOCX_COLUMNS = _WORD_NS + "cols"
+_DOCX_COLUMN_COUNT = _WORD_NS + "num"
+_DOCX_RUN_FONTS = _WORD_NS + "rFonts"
+_DOCX_FONT_ATTRIBUTES = (_WORD_NS + "ascii", _WORD_NS + "hAnsi")
+_DOCX_EXTENT = "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}extent"
+_EMU_PER_POINT = 12700
+
+_resume_cache = None
+
+def get_resume_cache() -> ResumeCache:
+    """
+    Returns the process-wide resume cache, creating it on first use.
+    """
+    global _resume_cache
+    if _resume_cache is None:
+        _resume_cache = ResumeCache()
+    return _resume_cache
+
+def _iter_pdf_pages(file_path: str, backend: str = None, layout: list = None) -> Iterator[str]:
+    """Yields PDF page text lazily via the selected PDF backend."""
+    return get_pdf_backend(backend).iter_pages(file_path, layout=layout)
+
+def _iter_docx_pages(file_path: str, max_chars: int = None, layout: list = None) -> Iterator[str]:
     """
-    Loads a resume from a PDF file using Langchain's PyPDFLoader.
-    For .doc files, this function currently raises a NotImplementedError.
+    Streams `word/document.xml` out of a DOCX archive with an incremental XML parser and
+    yields the text between explicit page breaks (the whole document if there are none).
+    Paragraphs are separated by newlines so section headings stay on their own lines.
+    Parsed elements are discarded as soon as they are read, so memory does not grow with
+    document length, and parsing stops once a page exceeds `max_chars`.
+    If `layout` is a list, one PageLayout per page is appended from the same parse: drawings,
+    tables, multi-column sections and the fonts named on runs (style defaults are not read).
+    """
+    with zipfile.ZipFile(file_path) as archive, archive.open("word/document.xml") as xml_stream:
+        page_paragraphs = []
+        page_chars = 0
+        runs = []
+        split_by_page_break = False
+        body = None
+        body_depth = depth = 0
+        page_images = page_tables = 0
+        page_columns = 1
+        page_fonts = set()
+
+        def end_page():
+            nonlocal page_images, page_tables, page_columns, page_fonts
+            if layout is not None:
+                layout.append(PageLayout(page_images, families(page_fonts), page_columns > 1, page_tables))
+            page_images = page_tables = 0
+            page_columns = 1
+            page_fonts = set()
+
+        for event, elem in ET.iterparse(xml_stream, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if elem.tag == _DOCX_BODY:
+                    body, body_depth = elem, depth
+                continue
+            depth -= 1
+
+            tag = elem.tag
+            if tag == _DOCX_TEXT:
+                runs.append(elem.text or "")
+            elif tag == _DOCX_TAB:
+                runs.append("\t")
+            elif tag in _DOCX_BREAKS:
+                if elem.get(_DOCX_BREAK_TYPE) == "page":
+                    if runs:
+                        page_paragraphs.append("".join(runs))
+                        runs = []
+                    end_page()
+                    yield "\n".join(page_paragraphs)
+                    page_paragraphs = []
+                    page_chars = 0
+                    split_by_page_break = True
+                else:
+                    runs.append("\n")
+            elif tag == _DOCX_PARAGRAPH:
+                # A paragraph that only carried a page break adds no empty line to the next page
+                if runs or not split_by_page_break:
+                    paragraph = "".join(runs)
+                    page_paragraphs.append(paragraph)
+                    page_chars += len(paragraph) + 1
+                runs = []
+                split_by_page_break = False
+                elem.clear()
+                if max_chars is not None and page_chars > max_chars:
+                    break
+            elif tag == _DOCX_RUN_FONTS:
+                page_fonts.update(filter(None, map(elem.get, _DOCX_FONT_ATTRIBUTES)))
+            elif tag == _DOCX_EXTENT:
+                width, height = (int(elem.get(name, 0)) / _EMU_PER_POINT for name in ("cx", "cy"))
+                page_images += is_content_image(width, height)
+            elif tag == _DOCX_TABLE:
+                page_tables += 1
+            elif tag == _DOCX_COLUMNS:
+                page_columns = max(page_columns, int(elem.get(_DOCX_COLUMN_COUNT, 1)))
+
+            # Drop finished top-level blocks (paragraphs, tables) from the tree
+            if body is not None and depth == body_depth:
+                body.clear()
+
+        if runs:
+            page_paragraphs.append("".join(runs))
+        if page_paragraphs:
+            end_page()
+            yield "\n".join(page_paragraphs)
+
+def iter_resume_pages(file_path: str, max_pages: int = None, max_chars: int = None,
+                      backend: str = None, layout: list = None) -> Iterator[str]:
+    """
+    Yields the text of a PDF or DOCX resume one page at a time. PDFs are read lazily with
+    the PDF backend named by `backend` (default: the fastest installed, see
+    core.pdf_backends); DOCX files are streamed from their XML (pages are split at
+    explicit page breaks).
+    Stops after `max_pages` pages or once `max_chars` characters have been yielded
+    (the last page is truncated to fit the budget), so later pages are never parsed.
+    Peak memory grows with a single page rather than with the whole document.
+    If `layout` is a list, a `core.layout.PageLayout` is appended for every page read,
+    collected in the same pass as its text.
     """
     if file_path.endswith('.pdf'):
-        loader = PyPDFLoader(file_path)
-        documents = loader.load()
-        return " ".join([doc.page_content for doc in documents])
-    elif file_path.endswith('.doc') or file_path.endswith('.docx'):
-        raise NotImplementedError("Loading .doc/.docx files is not yet implemented. Please convert to PDF or plain text.")
+        pages = _iter_pdf_pages(file_path, backend, layout)
+    elif file_path.endswith('.docx'):
+        pages = _iter_docx_pages(file_path, max_chars=max_chars, layout=layout)
+    elif file_path.endswith('.doc'):
+        raise NotImplementedError("Loading legacy .doc files is not supported. Please save as DOCX or PDF.")
     else:
-        raise ValueError("Unsupported file type. Only PDF and (placeholder for) DOC/DOCX are accepted.")
+        raise ValueError("Unsupported file type. Only PDF and DOCX are accepted.")
+    if max_pages is not None and max_pages <= 0:
+        return
+
+    remaining_chars = max_chars
+    for page_number, page_text in enumerate(pages, start=1):
+        if remaining_chars is not None:
+            page_text = page_text[:remaining_chars]
+            remaining_chars -= len(page_text)
+        yield page_text
+        if max_pages is not None and page_number >= max_pages:
+            break
+        if remaining_chars is not None and remaining_chars <= 0:
+            break
+
+def _extract_page_range(file_path: str, start: int, stop: int, backend: str,
+                        with_layout: bool = False) -> tuple[list[str], list[PageLayout]]:
+    """
+    Extracts the text (and, with `with_layout`, the PageLayouts) of pages [start, stop)
+    with the named backend. Runs inside a worker process, so it re-opens the file itself.
+    """
+    page_layouts = [] if with_layout else None
+    pages = get_pdf_backend(backend).extract_range(file_path, start, stop, layout=page_layouts)
+    return pages, page_layouts
+
+def extract_pages_parallel(file_path: str, max_workers: int = None, max_pages: int = None,
+                           max_chars: int = None, backend: str = None, layout: list = None) -> list[str]:
+    """
+    Extracts PDF page text by splitting the page range into contiguous chunks across
+    a process pool and stitching the results back in page order.
+    Output (text and `layout`) is identical to `iter_resume_pages` for the same bounds and backend.
+    """
+    # Resolve the backend here so every worker uses the same one
+    pdf_backend = get_pdf_backend(backend)
+    page_count = pdf_backend.page_count(file_path)
+    if max_pages is not None:
+        page_count = max(0, min(page_count, max_pages))
+    workers = max(1, min(max_workers or os.cpu_count() or 1, page_count))
+    chunk_size = -(-page_count // workers) if page_count else 0
+    ranges = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size or 1)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = list(pool.map(_extract_page_range, [file_path] * len(ranges),
+                               [r[0] for r in ranges], [r[1] for r in ranges], [pdf_backend.name] * len(ranges),
+                               [layout is not None] * len(ranges)))
+        pages = [page for chunk, _ in chunks for page in chunk]
+
+    if max_chars is not None:
+        bounded_pages = []
+        remaining_chars = max_chars
+        for page_text in pages:
+            page_text = page_text[:remaining_chars]
+            remaining_chars -= len(page_text)
+            bounded_pages.append(page_text)
+            if remaining_chars <= 0:
+                break
+        pages = bounded_pages
+    if layout is not None:
+        layout.extend([page_layout for _, page_layouts in chunks for page_layout in page_layouts][:len(pages)])
+    return pages
+
+def _extract_resume_text(file_path: str, max_pages: int = None, max_chars: int = None,
+                         parallel: bool = False, layout: list = None) -> str:
+    """
+    Extracts the text of a resume file without consulting the cache.
+    With `parallel=True`, PDFs of at least PARALLEL_PAGE_THRESHOLD pages are
+    extracted across a process pool; shorter ones use the in-process path.
+    Page layouts are appended to `layout` if it is a list.
+    """
+    if parallel and file_path.endswith('.pdf'):
+        page_count = get_pdf_backend().page_count(file_path)
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+        if page_count >= PARALLEL_PAGE_THRESHOLD:
+            return " ".join(extract_pages_parallel(file_path, max_pages=max_pages, max_chars=max_chars, layout=layout))
+    return " ".join(iter_resume_pages(file_path, max_pages=max_pages, max_chars=max_chars, layout=layout))
+
+def _extract_resume(file_path: str, max_pages: int = None, max_chars: int = None,
+                    parallel: bool = False, sandbox: bool = False) -> tuple[str, LayoutFacts]:
+    """
+    Extracts a resume's text and its layout facts in one pass, without consulting the cache.
+    With `sandbox=True` the extraction runs in a supervised worker process under time and
+    memory limits (see core.sandbox) and failures raise ExtractionError; sandboxed workers
+    cannot start process pools of their own, so `parallel` is ignored there.
+    """
+    if sandbox:
+        return get_sandbox().run(_extract_resume, file_path, max_pages, max_chars,
+                                 file_name=os.path.basename(file_path))
+    page_layouts = []
+    text = _extract_resume_text(file_path, max_pages=max_pages, max_chars=max_chars,
+                                parallel=parallel, layout=page_layouts)
+    return text, LayoutFacts.from_pages(page_layouts)
+
+def _cached_resume_text(file_path: str, max_pages: int = None, max_chars: int = None,
+                        parallel: bool = False, sandbox: bool = False) -> tuple[ResumeCache, str, str, LayoutFacts, bool]:
+    """
+    Returns (cache, key, text, layout, hit) for a resume, extracting and storing the text
+    and layout facts on a miss. Page and character bounds are part of the key, since they
+    change the extracted text.
+    """
+    cache = get_resume_cache()
+    version = EXTRACTOR_VERSION
+    if file_path.endswith('.pdf'):
+        version = f"{version}:{get_pdf_backend().cache_tag}"
+    if max_pages is not None or max_chars is not None:
+        version = f"{version}:p{max_pages}:c{max_chars}"
+    key = cache.key_for_file(file_path, version)
+    text = cache.get_text(key)
+    if text is not None:
+        layout = cache.get_layout(key)
+        return cache, key, text, LayoutFacts.from_dict(layout) if layout else None, True
+    text, layout = _extract_resume(file_path, max_pages=max_pages, max_chars=max_chars,
+                                   parallel=parallel, sandbox=sandbox)
+    cache.put_text(key, text, layout=layout.as_dict())
+    return cache, key, text, layout, False
+
+def load_resume(file_path: str, use_cache: bool = True, max_pages: int = None, max_chars: int = None,
+                parallel: bool = False) -> str:
+    """
+    Loads a resume from a PDF (via the selected PDF backend) or DOCX file.
+    Legacy .doc files raise a NotImplementedError.
+    Extracted text is cached by the SHA-256 of the file bytes, so the same resume
+    is parsed once per content rather than once per call.
+    `max_pages` and `max_chars` bound extraction (see `iter_resume_pages`).
+    `parallel=True` opts long PDFs into page-parallel extraction (see `extract_pages_parallel`).
+    """
+    if not use_cache or not file_path.endswith(_CACHEABLE_EXTENSIONS):
+        return _extract_resume_text(file_path, max_pages=max_pages, max_chars=max_chars, parallel=parallel)
+    return _cached_resume_text(file_path, max_pages, max_chars, parallel)[2]
+
+def _load_resume_parts(file_path: str, use_cache: bool, max_pages: int, max_chars: int,
+                       parallel: bool, sandbox: bool = None) -> tuple[str, list[str], LayoutFacts]:
+    """Returns (text, cleaned tokens, layout facts), served from the resume cache when possible."""
+    sandbox = sandbox_enabled(sandbox)
+    if not use_cache or not file_path.endswith(_CACHEABLE_EXTENSIONS):
+        resume_text, layout = _extract_resume(file_path, max_pages=max_pages, max_chars=max_chars,
+                                              parallel=parallel, sandbox=sandbox)
+        return resume_text, clean_text(resume_text), layout
+
+    cache, key, resume_text, layout, hit = _cached_resume_text(file_path, max_pages, max_chars, parallel, sandbox)
+    tokens = cache.get_tokens(key, CLEANER_VERSION) if hit else None
+    if tokens is None:
+        tokens = clean_text(resume_text)
+        cache.put_tokens(key, tokens, CLEANER_VERSION)
+    return resume_text, tokens, layout
+
+def load_resume_with_tokens(file_path: str, use_cache: bool = True, max_pages: int = None,
+                            max_chars: int = None, parallel: bool = False) -> tuple[str, list[str]]:
+    """
+    Loads a resume and returns its raw text together with its cleaned tokens.
+    Both are served from the resume cache when the same content was seen before.
+    """
+    return _load_resume_parts(file_path, use_cache, max_pages, max_chars, parallel)[:2]
+
+def load_resume_document(file_path: str, use_cache: bool = True, max_pages: int = None,
+                         max_chars: int = None, parallel: bool = False, sandbox: bool = None) -> ParsedDocument:
+    """
+    Loads a resume as a ParsedDocument (raw text, interned cleaned tokens and the layout
+    facts collected during extraction), going through the resume cache like
+    `load_resume_with_tokens`.
+    `sandbox=True` extracts cache misses in a supervised worker process under time and memory
+    limits, raising core.sandbox.ExtractionError on failure; None follows ARIA_SANDBOX_EXTRACTION.
+    """
+    resume_text, tokens, layout = _load_resume_parts(file_path, use_cache, max_pages, max_chars, parallel, sandbox)
+    return ParsedDocument(resume_text, tokens, source=file_path, layout=layout)
 
 # def load_job_description(file_path: str) -> str:
 #     """
@@ -33,43 +343,139 @@ def load_resume(file_path: str):
 #     with open(file_path, 'r', encoding='utf-8') as f:
         # return f.read()
 
-def clean_text(text: str) -> list[str]:
+# --- Precompiled text-cleaning pipeline ---
+# clean_text runs on every resume and JD, so everything that does not depend on
+# the input is built once per process instead of once per call.
+LEMMA_CACHE_SIZE = 65536
+
+# Deletes ASCII punctuation and digits in a single pass.
+_PUNCT_DIGIT_TABLE = str.maketrans('', '', string.punctuation + string.digits)
+# Non-ASCII decimal digits, which `\d+` removed in the original regex pipeline.
+_DIGITS_RE = re.compile(r'\d+')
+# Characters NLTK's Treebank tokenizer splits off even after ASCII punctuation is gone:
+# curly/angle quotes and figure/en/em dashes.
+_TREEBANK_SPLIT_RE = re.compile('([«“‘„»”’\u2012-\u2015])')
+# Treebank contractions that survive punctuation removal ("cannot" -> "can", "not").
+_CONTRACTIONS_RE = re.compile(
+    r"\b(can)(not)\b|\b(gim)(me)\b|\b(gon)(na)\b|\b(got)(ta)\b|\b(lem)(me)\b|\b(wan)(na)(?=\s|$)",
+    re.IGNORECASE
+)
+
+@functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def _lemmatize(word: str) -> str:
+    return get_lemmatizer().lemmatize(word)
+
+def _split_contraction(match: re.Match) -> str:
+    return " " + " ".join(group for group in match.groups() if group) + " "
+
+def _regex_tokenize(text: str) -> list[str]:
     """
-    Performs NLP-based text preprocessing on the input text.
-    Steps include lowercasing, removing punctuation, numbers, stopwords, and lemmatization.
-    Returns a list of cleaned tokens.
+    Tokenizes text that has already had punctuation and digits removed.
+    Produces the same tokens as `nltk.word_tokenize` on such text: without sentence
+    punctuation, Punkt yields a single sentence and the Treebank rules reduce to
+    splitting off a few non-ASCII characters and contractions before a whitespace split.
     """
-    text = text.lower() # Lowercasing
-    text = re.sub(f'[{re.escape(string.punctuation)}]', '', text) # Remove punctuation
-    text = re.sub(r'\d+', '', text) # Remove numbers
+    if not text.isascii():
+        text = _TREEBANK_SPLIT_RE.sub(r' \1 ', text)
+    return _CONTRACTIONS_RE.sub(_split_contraction, text).split()
 
-    tokens = nltk.word_tokenize(text) # Tokenization
+def raw_tokens(text: str, tokenizer: str = "regex") -> list[str]:
+    """
+    The tokens `clean_text` starts from: lowercased, without punctuation and numbers, before
+    stopword removal and lemmatization. Needs no NLTK corpora with the regex tokenizer.
+    """
+    text = text.lower().translate(_PUNCT_DIGIT_TABLE) # Lowercase, remove punctuation and numbers
+    if not text.isascii():
+        text = _DIGITS_RE.sub('', text) # Remove non-ASCII digits
 
-    stop_words = set(stopwords.words('english'))
-    tokens = [word for word in tokens if word not in stop_words] # Remove stopwords
+    if tokenizer == "regex":
+        return _regex_tokenize(text)
+    if tokenizer == "nltk":
+        return word_tokenize(text)
+    raise ValueError(f"Unknown tokenizer '{tokenizer}'. Expected 'regex' or 'nltk'.")
 
-    lemmatizer = WordNetLemmatizer()
-    tokens = [lemmatizer.lemmatize(word) for word in tokens] # Lemmatization
+def clean_text(text: str, tokenizer: str = "regex") -> list[str]:
+    """
+    Performs NLP-based text preprocessing on the input text.
+    Steps include lowercasing, removing punctuation, numbers, stopwords, and lemmatization.
+    Returns a list of cleaned tokens.
 
-    return tokens
+    `tokenizer="regex"` (default) uses the precompiled fast path, which yields the same
+    tokens as `tokenizer="nltk"` (`nltk.word_tokenize`).
+    """
+    tokens = raw_tokens(text, tokenizer)
+    stop_words = get_stopwords()
+    return [_lemmatize(word) for word in tokens if word not in stop_words] # Remove stopwords, lemmatize
 
-def process_documents(resume_path: str, jd_text: str) -> dict:
+def parse_documents(resume_path: str, jd_text: str, max_pages: int = RESUME_MAX_PAGES,
+                    max_chars: int = RESUME_MAX_CHARS, sandbox: bool = None) -> tuple[ParsedDocument, ParsedDocument]:
     """
     Loads and preprocesses both the resume and job description.
-    Returns a dictionary containing the raw text and cleaned text for both.
+    Returns (resume_document, jd_document) as ParsedDocuments that later stages share
+    instead of re-tokenizing. Resume extraction stops after `max_pages` pages or `max_chars` characters,
+    and runs sandboxed when `sandbox` is set (see `load_resume_document`).
+    The JD has its boilerplate (benefits, EEO statements, ...) stripped first, so neither the
+    embedding nor the LLM prompts built from it pay for that text.
     """
-    resume_text = load_resume(resume_path)
+    resume_document = load_resume_document(resume_path, max_pages=max_pages, max_chars=max_chars, sandbox=sandbox)
+    jd_text = strip_jd_boilerplate(jd_text, caller="parse_documents")
+    jd_document = ParsedDocument.from_text(jd_text, source="job_description")
+    return resume_document, jd_document
 
-    cleaned_resume = clean_text(resume_text)
-    cleaned_jd = clean_text(jd_text)
+def process_documents(resume_path: str, jd_text: str, max_pages: int = RESUME_MAX_PAGES,
+                      max_chars: int = RESUME_MAX_CHARS) -> dict:
+    """
+    Loads and preprocesses both the resume and job description.
+    Returns a dictionary containing the raw text and cleaned text for both.
+    Resume extraction stops after `max_pages` pages or `max_chars` characters.
+    """
+    resume_document, jd_document = parse_documents(resume_path, jd_text, max_pages=max_pages, max_chars=max_chars)
 
     return {
-        "raw_resume_text": resume_text,
-        "raw_jd_text": jd_text,
-        "cleaned_resume": cleaned_resume,
-        "cleaned_job_description": cleaned_jd
+        "raw_resume_text": resume_document.raw_text,
+        "raw_jd_text": jd_document.raw_text,
+        "cleaned_resume": resume_document.tokens,
+        "cleaned_job_description": jd_document.tokens
     }
 
+def _ingest_resume(resume_path: str, max_pages: int, max_chars: int) -> tuple[str, list[str]]:
+    """Worker entry point for `process_many`: parses and cleans one resume."""
+    return load_resume_with_tokens(resume_path, max_pages=max_pages, max_chars=max_chars)
+
+def process_many(resume_paths: list[str], jd_text: str, max_workers: int = None,
+                 max_pages: int = RESUME_MAX_PAGES, max_chars: int = RESUME_MAX_CHARS) -> Iterator[dict]:
+    """
+    Batch variant of `process_documents` for screening many resumes against one job description.
+    The JD is normalized and cleaned once; resumes are parsed and cleaned across a process pool of
+    `max_workers` workers (default: CPU count).
+
+    Yields one dictionary per resume as soon as it finishes, in completion order. Each has
+    the same keys as `process_documents` plus "resume_path"; a resume that fails yields
+    {"resume_path": ..., "error": ...} instead of aborting the batch.
+    """
+    jd_text = strip_jd_boilerplate(jd_text, caller="process_many")
+    cleaned_jd = clean_text(jd_text)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_ingest_resume, resume_path, max_pages, max_chars): resume_path
+            for resume_path in resume_paths
+        }
+        for future in as_completed(futures):
+            resume_path = futures[future]
+            try:
+                resume_text, cleaned_resume = future.result()
+            except Exception as e:
+                yield {"resume_path": resume_path, "error": str(e)}
+                continue
+            yield {
+                "resume_path": resume_path,
+                "raw_resume_text": resume_text,
+                "raw_jd_text": jd_text,
+                "cleaned_resume": cleaned_resume,
+                "cleaned_job_description": cleaned_jd
+            }
+
 # if __name__ == "__main__":
 #     # Example usage of the process_documents function
 #     resume_path = "../data/raw/resumes/Ahmed Raza - AI Engineer.pdf"
@@ -15,6 +15,7 @@ from ui.resume_match_ui import show_resume_match_ui
 from ui.ats_checker_ui import show_ats_checker_ui
 from ui.interview_prep_ui import show_interview_prep_ui
 from ui.mock_interview_ui import show_mock_interview_ui
+from core.embedding_provider import warm_up as warm_up_embeddings
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "."))
 if project_root not in sys.path:
@@ -22,6 +23,9 @@ if project_root not in sys.path:
 
 st.set_page_config(page_title="ARIA – Agentic Resume Intelligence Analyzer", layout="wide")
 
+# Load the shared embedding model while the first page renders (once per server process)
+warm_up_embeddings(background=True)
+
 st.title("🤖 ARIA – Agentic Resume Intelligence Analyzer")
 
 # Create tabs for each module
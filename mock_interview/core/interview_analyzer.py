@@ -9,30 +9,26 @@ import re
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from textblob import TextBlob
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import streamlit as st
 from dotenv import load_dotenv
+from core.nltk_resources import get_sentiment_analyzer, get_stopwords, word_tokenize
+from core.jd_normalizer import strip_jd_boilerplate
 
 load_dotenv()
 groq_api_key = os.environ.get("GROQ_API_KEY")
 if not groq_api_key:
     raise ValueError("GROQ_API_KEY not found. Please set in .env file.")
 llm = ChatGroq(groq_api_key=groq_api_key, model_name="llama-3.3-70b-versatile")
-# Download required NLTK data
-try:
-    nltk.download('vader_lexicon', quiet=True)
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-except:
-    pass
 
 class InterviewAnalyzer:
-    def __init__(self):
-        self.sia = SentimentIntensityAnalyzer()
-        self.stop_words = set(stopwords.words('english'))
+    # NLTK resources are shared per process and loaded on first use (see core/nltk_resources.py)
+    @property
+    def sia(self):
+        return get_sentiment_analyzer()
+
+    @property
+    def stop_words(self) -> frozenset:
+        return get_stopwords()
 
     def analyze_response(self, 
             transcript: str, 
@@ -43,6 +39,7 @@ class InterviewAnalyzer:
         """
         LLM-based analysis of interview response using Groq
         """
+        job_description = strip_jd_boilerplate(job_description, caller="analyze_response")
           # Make sure groq is installed and your API key is set
         prompt = f"""
 You are an expert interview evaluator. Analyze the following response and provide scores (0-1) for:
@@ -9,6 +9,7 @@ import re
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
+from core.jd_normalizer import strip_jd_boilerplate
 
 load_dotenv()
 
@@ -37,6 +38,7 @@ class QuestionGenerator:
         """
         if not question_types:
             question_types = ["technical", "behavioral", "general"]
+        job_description = strip_jd_boilerplate(job_description, caller="generate_questions")
         
         prompt = f"""
 You are an expert interview coach and HR professional. Generate {num_questions} relevant interview questions based on the following job description.
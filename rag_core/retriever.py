@@ -5,7 +5,6 @@ from langchain_groq import ChatGroq
 from langchain_community.vectorstores import FAISS
 from langchain_community.retrievers import BM25Retriever
 from langchain_classic.retrievers.ensemble import EnsembleRetriever 
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough, RunnableBranch
@@ -16,6 +15,9 @@ from langchain_classic.chains import create_history_aware_retriever,create_retri
 from langchain_classic.chains.combine_documents import create_stuff_documents_chain
 
 # Internal project imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.embedding_cache import get_cached_embeddings
+from core.embedding_provider import EMBEDDING_MODEL
 from .rag_loader import load_interview_json_files
 load_dotenv()
 groq_api_key = os.environ["GROQ_API_KEY"]
@@ -24,7 +26,6 @@ llm = ChatGroq(groq_api_key=groq_api_key, model_name="llama-3.1-8b-instant")
 # --- Configuration Constants ---
 KB_DIR = os.path.join(os.path.dirname(__file__), "interview_prep_kb")
 VECTORSTORE_PATH = os.path.join(os.path.dirname(__file__), "vectorstores", "interview_prep_faiss")
-EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2" 
 
 # --- Retriever Functions ---
 def get_hybrid_retriever(k: int):
@@ -32,7 +33,8 @@ def get_hybrid_retriever(k: int):
     Initializes and returns a hybrid retriever combining FAISS (vector search)
     and BM25 (keyword search) with Reciprocal Rank Fusion (RRF).
     """
-    embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+    # Shared with the rest of the process; repeated questions are answered from the embedding cache
+    embeddings = get_cached_embeddings(EMBEDDING_MODEL)
     vectordb = FAISS.load_local(VECTORSTORE_PATH, embeddings, allow_dangerous_deserialization=True)
     faiss_retriever = vectordb.as_retriever(search_kwargs={"k": k})
 
@@ -1,19 +1,20 @@
 import os
+import sys
 from rag_loader import load_interview_json_files, chunk_documents
 from langchain_community.vectorstores import FAISS
-from langchain_huggingface import HuggingFaceEmbeddings
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.embedding_provider import EMBEDDING_MODEL, get_embeddings
 
 # --- CONFIGS ---
 KB_DIR = os.path.join(os.path.dirname(__file__), "interview_prep_kb")
 VECTORSTORE_DIR = os.path.join(os.path.dirname(__file__), "vectorstores")
 VECTORSTORE_PATH = os.path.join(VECTORSTORE_DIR, "interview_prep_faiss")
-EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-l6-v2"
 
 
 def build_faiss_vectorstore(chunks, persist_dir):
     #Step 1: Intialize embeddings model
-    print("🧠 Initializing embedding model (HuggingFace MiniLM)...")
-    embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    embeddings = get_embeddings(EMBEDDING_MODEL)
 
     # Step 2: Build FAISS index
     print("⚙️ Creating FAISS index and adding document chunks...")
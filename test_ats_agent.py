@@ -0,0 +1,129 @@
+"""
+Tests for bulk scoring in agents/ats_agent.py
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import core.utils as utils
+from agents.ats_agent import RowWriter, expand_inputs, main, score_resumes, scored_hashes, trim_partial_row
+from core.resume_cache import ResumeCache, file_sha256
+
+RESUMES = os.path.join(os.path.dirname(__file__), 'data', 'raw', 'resumes')
+CATEGORIES = ['format_compatibility', 'keyword_optimization']
+
+
+def _tree(tmp_path):
+    nested = tmp_path / 'batch' / 'nested'
+    nested.mkdir(parents=True)
+    pdfs = sorted(os.listdir(RESUMES))
+    shutil.copy(os.path.join(RESUMES, pdfs[0]), tmp_path / 'batch' / 'a.pdf')
+    shutil.copy(os.path.join(RESUMES, pdfs[1]), nested / 'b.pdf')
+    shutil.copy(os.path.join(RESUMES, pdfs[0]), nested / 'copy_of_a.pdf')
+    (nested / 'notes.txt').write_text('not a resume')
+    return tmp_path / 'batch'
+
+
+def test_expand_inputs_walks_directories_and_globs(tmp_path):
+    batch = _tree(tmp_path)
+    names = [os.path.basename(path) for path in expand_inputs([str(batch)])]
+    assert names == ['a.pdf', 'b.pdf', 'copy_of_a.pdf']
+    assert expand_inputs([str(batch / '*.pdf'), str(batch / 'a.pdf')]) == [str(batch / 'a.pdf')]
+    assert len(expand_inputs([str(batch / '**' / '*.pdf')])) == 3
+
+
+def tokenize(text):
+    # Stands in for clean_text, which needs the NLTK corpora
+    return re.findall(r'[a-z]+', text.lower())
+
+
+def test_score_resumes_skips_known_and_duplicate_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, 'clean_text', tokenize)
+    monkeypatch.setattr(utils, '_resume_cache', ResumeCache(str(tmp_path / 'cache.sqlite3')))
+    batch = _tree(tmp_path)
+    paths = expand_inputs([str(batch)])
+    rows = list(score_resumes(paths, workers=1))
+    # The copy has the same content hash as a.pdf and is scored once
+    assert len(rows) == 2
+    assert {row['sha256'] for row in rows} == {file_sha256(path) for path in paths}
+    for row in rows:
+        assert set(row) >= {'resume_path', 'sha256', 'overall_score', 'missing_skills', 'top_improvements', 'error'}
+        assert row['error'] is None and row['overall_score'] > 0
+
+    known = {file_sha256(str(batch / 'a.pdf'))}
+    rows = list(score_resumes(paths, workers=1, skip_hashes=known))
+    assert [os.path.basename(row['resume_path']) for row in rows] == ['b.pdf']
+
+
+def test_rows_stream_as_jsonl_and_csv():
+    rows = [
+        {'resume_path': 'a.pdf', 'sha256': 'aa', 'overall_score': 72.5, 'format_compatibility': 0.9,
+         'missing_skills': ['Terraform', 'AWS'], 'top_improvements': ['EXPERIENCE'], 'error': None},
+        {'resume_path': 'b.pdf', 'sha256': 'bb', 'overall_score': 0, 'error': 'unreadable'},
+    ]
+    stream = io.StringIO()
+    writer = RowWriter(stream, 'jsonl', CATEGORIES)
+    writer.write(rows[0])
+    assert json.loads(stream.getvalue())['missing_skills'] == ['Terraform', 'AWS']
+    writer.write(rows[1])
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line['resume_path'] for line in lines] == ['a.pdf', 'b.pdf']
+    assert list(lines[0]) == writer.fields
+
+    stream = io.StringIO()
+    writer = RowWriter(stream, 'csv', CATEGORIES)
+    for row in rows:
+        writer.write(row)
+    parsed = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert parsed[0]['missing_skills'] == 'Terraform; AWS'
+    assert parsed[0]['keyword_optimization'] == '' and parsed[1]['error'] == 'unreadable'
+
+
+def test_resume_from_keeps_scored_rows_and_retries_failures(tmp_path):
+    jsonl = tmp_path / 'out.jsonl'
+    jsonl.write_text(json.dumps({'sha256': 'aa', 'error': None}) + '\n' +
+                     json.dumps({'sha256': 'bb', 'error': 'unreadable'}) + '\n' +
+                     '{"sha256": "cc", "overall_sc')  # cut off mid-row
+    assert scored_hashes(str(jsonl)) == {'aa'}
+
+    out = tmp_path / 'out.csv'
+    with open(out, 'w', newline='') as f:
+        writer = RowWriter(f, 'csv', CATEGORIES)
+        writer.write({'sha256': 'aa', 'overall_score': 80})
+        writer.write({'sha256': 'bb', 'error': 'unreadable'})
+    assert scored_hashes(str(out)) == {'aa'}
+    assert scored_hashes(str(tmp_path / 'missing.jsonl')) == set()
+
+
+def test_partial_last_row_is_trimmed_before_appending(tmp_path):
+    jsonl = tmp_path / 'out.jsonl'
+    jsonl.write_text(json.dumps({'sha256': 'aa', 'error': None}) + '\n' + '{"sha256": "bb", "overall_sc')
+    trim_partial_row(str(jsonl), block_size=8)
+    with open(jsonl, 'a') as f:
+        RowWriter(f, 'jsonl', CATEGORIES).write({'sha256': 'cc'})
+    assert scored_hashes(str(jsonl)) == {'aa', 'cc'}
+
+    trim_partial_row(str(jsonl))  # complete files are left alone
+    assert len(jsonl.read_text().splitlines()) == 2
+    jsonl.write_text('{"sha256": "aa"')
+    trim_partial_row(str(jsonl))
+    assert jsonl.read_text() == ''
+
+
+def test_job_description_alone_is_a_usage_error(tmp_path, monkeypatch, capsys):
+    jd = tmp_path / 'job.txt'
+    jd.write_text('Python engineer')
+    monkeypatch.setattr(sys, 'argv', ['ats_agent.py', str(jd)])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 2
+    assert 'no resume given' in capsys.readouterr().err
@@ -0,0 +1,75 @@
+"""
+Tests for scoring resume × job description matrices
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.ats import ATSAnalyzer
+from core.document import SHARED_VOCABULARY, ParsedDocument
+
+RESUMES = [
+    ParsedDocument("EXPERIENCE\nDeveloped Python APIs on AWS, improved latency by 40%\nEDUCATION\nBS",
+                   ["experience", "developed", "python", "apis", "aws", "improved", "latency", "education"]),
+    ParsedDocument("Led a React team. jane@mail.com, github.com/jane",
+                   ["led", "react", "team", "jane", "github"]),
+    ParsedDocument("", []),
+]
+JDS = [
+    ParsedDocument("Python engineer with AWS", ["python", "engineer", "aws"]),
+    ParsedDocument("React developer", ["react", "developer"]),
+    ParsedDocument("!!!", []),   # text but no tokens: no keyword-match points
+    None,                         # no job description: the default keyword points
+]
+
+
+def _single_pair_scores(analyzer, resume, jd):
+    text = resume.raw_text
+    return {
+        'format_compatibility': ATSAnalyzer.check_format_compatibility.fn(analyzer, text, resume.sections, resume.layout),
+        'keyword_optimization': ATSAnalyzer.check_keyword_optimization.fn(analyzer, text, resume, jd),
+        'structure_quality': ATSAnalyzer.check_structure_quality.fn(analyzer, text, resume.sections),
+        'content_quality': ATSAnalyzer.check_content_quality.fn(analyzer, text, resume),
+    }
+
+
+@pytest.mark.parametrize("chunk_cells", [1, 5, 1 << 20])
+def test_matrix_matches_single_pair_checks(chunk_cells):
+    analyzer = ATSAnalyzer()
+    result = analyzer.score_matrix(RESUMES, JDS, chunk_cells=chunk_cells)
+    assert result.overall.shape == (len(RESUMES), len(JDS))
+
+    for i, resume in enumerate(RESUMES):
+        for j, jd in enumerate(JDS):
+            expected = _single_pair_scores(analyzer, resume, jd)
+            for category, score in expected.items():
+                assert result.category_scores[category][i, j] == score, (i, j, category)
+            total = sum(score * analyzer.ats_criteria[category]['weight'] for category, score in expected.items())
+            assert result.overall[i, j] == pytest.approx(total * 100)
+
+
+def test_empty_batches():
+    result = ATSAnalyzer().score_matrix([], JDS)
+    assert result.overall.shape == (0, len(JDS))
+    assert ATSAnalyzer().score_matrix(RESUMES, []).overall.shape == (len(RESUMES), 0)
+
+
+def test_scores_survive_vocabulary_rollover(monkeypatch):
+    """With every document in a vocabulary of its own, ids are still never mixed up"""
+    monkeypatch.setattr(SHARED_VOCABULARY, "max_tokens", 0)
+    resumes = [ParsedDocument(doc.raw_text, doc.tokens) for doc in RESUMES]
+    jds = [ParsedDocument(jd.raw_text, jd.tokens) if jd is not None else None for jd in JDS]
+    assert resumes[0].vocabulary is not jds[0].vocabulary
+
+    analyzer = ATSAnalyzer()
+    result = analyzer.score_matrix(resumes, jds)
+    for i, resume in enumerate(resumes):
+        for j, jd in enumerate(jds):
+            for category, score in _single_pair_scores(analyzer, resume, jd).items():
+                assert result.category_scores[category][i, j] == score, (i, j, category)
+    monkeypatch.undo()
+    assert result.overall.tolist() == analyzer.score_matrix(RESUMES, JDS).overall.tolist()
@@ -0,0 +1,98 @@
+"""
+Tests for the single-pass ATS feature scan: scores match the original per-pattern checks
+"""
+
+import glob
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.ats import ATSAnalyzer
+from core.sections import segment_sections
+from core.skills import extract_skills, technical_skills
+from core.utils import iter_resume_pages
+
+RESUME_DIR = os.path.join(os.path.dirname(__file__), "data", "raw", "resumes")
+
+EDGE_CASES = [
+    "",
+    "Skilled engineer; enabled teams. Profiled services.",   # "led" only inside other words
+    "TECHNICAL SKILLS\nPython\nImproved by 40% and increased by 3x, $200k saved, 10+ years",
+    "Call (555) 123-4567 or 555-987-6543, jane@mail.com, linkedin.com/in/jane, github.com/jane",
+    "Two-column layout with a <table> and an <img>; Font: Garamond",
+    "Font: Arial. Work history and employment at a college; bachelor and master degrees",
+    "1 year, 2 years, 100%, x10, 7x",
+]
+
+
+def _legacy_scores(text, tokens, sections):
+    """The category checks as they were written before the shared scan, pattern by pattern"""
+    lower = text.lower()
+    found = lambda patterns: sum(1 for p in patterns if re.search(p, lower))
+    has = lambda keywords: any(k in lower for k in keywords)
+
+    fmt = sum(1 for s in ['experience', 'education', 'skills', 'summary', 'objective']
+              if s in sections or s in lower) / 5 * 0.3
+    if not found([r'<table>', r'<img>', r'<graphic>', r'<image>', r'columns?', r'table', r'graphic', r'image']):
+        fmt += 0.3
+    if found([r'arial', r'times', r'calibri', r'helvetica']) or not re.search(r'font', lower):
+        fmt += 0.2
+    fmt = min(fmt + 0.2, 1.0)
+
+    verbs = sum(1 for v in ['developed', 'implemented', 'managed', 'led', 'created',
+                            'designed', 'built', 'optimized', 'improved', 'delivered'] if v in lower)
+    keyword = min(min(len(technical_skills(extract_skills(text))) / 10, 1.0) * 0.4
+                  + min(verbs / 5, 1.0) * 0.3 + 0.3, 1.0)  # no job description
+
+    structure = min(found([r'@\w+\.\w+', r'\(\d{3}\)\s*\d{3}-\d{4}', r'\d{3}-\d{3}-\d{4}',
+                           r'linkedin\.com', r'github\.com']) / 3, 1.0) * 0.25
+    for name, keywords, points in [
+        ('summary', ['summary', 'profile', 'objective', 'about'], 0.2),
+        ('experience', ['experience', 'employment', 'work history', 'career'], 0.2),
+        ('education', ['education', 'degree', 'university', 'college', 'bachelor', 'master'], 0.2),
+        ('skills', ['skills', 'technical skills', 'competencies', 'expertise'], 0.15),
+    ]:
+        if name in sections or has(keywords):
+            structure += points
+
+    content = min(found([r'\d+%', r'\$\d+', r'\d+x', r'\d+\+', r'\d+ years?', r'increased by \d+',
+                         r'reduced by \d+', r'improved by \d+']) / 3, 1.0) * 0.3
+    if 200 <= len(tokens) <= 800:
+        content += 0.3
+    elif 100 <= len(tokens) < 200 or 800 < len(tokens) <= 1200:
+        content += 0.15
+    if len([line for line in text.split('\n') if line.strip()]) > 10:
+        content += 0.2
+    content += min(sum(1 for k in ['achieved', 'developed', 'implemented', 'managed', 'led'] if k in lower) / 3,
+                   1.0) * 0.2
+    return fmt, keyword, min(structure, 1.0), min(content, 1.0)
+
+
+def _texts():
+    resumes = [" ".join(iter_resume_pages(path)) for path in sorted(glob.glob(os.path.join(RESUME_DIR, "*.pdf")))]
+    return resumes + EDGE_CASES
+
+
+@pytest.mark.parametrize("text", _texts())
+def test_scores_match_per_pattern_checks(text):
+    analyzer = ATSAnalyzer()
+    tokens = text.lower().split()
+    sections = segment_sections(text)
+    fmt, keyword, structure, content = _legacy_scores(text, tokens, sections)
+
+    assert ATSAnalyzer.check_format_compatibility.fn(analyzer, text, sections) == fmt
+    assert ATSAnalyzer.check_structure_quality.fn(analyzer, text, sections) == structure
+    assert ATSAnalyzer.check_content_quality.fn(analyzer, text, tokens) == content
+    assert ATSAnalyzer.check_keyword_optimization.fn(analyzer, text, tokens) == keyword
+
+
+def test_counts_every_overlapping_match():
+    scanner = ATSAnalyzer().plan.scanner
+    text = "Led and skilled; improved by 20%. 555-123-4567"
+    lower = text.lower()
+    expected = [sum(1 for i in range(len(lower)) if re.compile(p).match(lower, i)) for p in scanner.features]
+    assert list(scanner.scan(text)) == expected
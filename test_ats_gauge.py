@@ -0,0 +1,65 @@
+"""
+Tests for the ATS score gauge renderer
+"""
+
+import os
+import struct
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.ats import create_ats_score_circle
+from core.ats_gauge import gauge_cache_info, gauge_png, gauge_svg, save_gauge, score_band
+
+
+def test_svg_is_well_formed_and_shows_the_score():
+    svg = gauge_svg(73.44)
+    root = ET.fromstring(svg)
+    assert root.get('width') == root.get('height') == '400'
+    texts = [element.text for element in root.iter('{http://www.w3.org/2000/svg}text')]
+    assert '73.4%' in texts and 'Good ATS Compatibility' in texts
+
+
+@pytest.mark.parametrize("score, verdict", [(100, "Excellent"), (80, "Excellent"), (79.9, "Good"),
+                                            (60, "Good"), (0, "Needs"), (-5, "Needs")])
+def test_score_bands(score, verdict):
+    assert score_band(score)[2].startswith(verdict)
+
+
+def test_memoized_by_rounded_score_size_and_theme():
+    first = gauge_svg(61.23, 300, 'dark')
+    misses = gauge_cache_info()['svg']['misses']
+    assert gauge_svg(61.2, 300, 'dark') is first
+    assert gauge_cache_info()['svg']['misses'] == misses
+    assert gauge_svg(61.2, 300, 'light') != first
+    assert gauge_svg(150) == gauge_svg(100)
+    with pytest.raises(ValueError):
+        gauge_svg(50, theme='neon')
+
+
+def test_png_has_requested_size():
+    png = gauge_png(42, size=200)
+    assert png.startswith(b'\x89PNG\r\n\x1a\n')
+    assert struct.unpack('>II', png[16:24]) == (200, 200)
+    assert gauge_png(42.01, size=200) is png
+
+
+def test_save_picks_format_from_extension(tmp_path):
+    svg_path = save_gauge(90, str(tmp_path / "score.svg"))
+    png_path = create_ats_score_circle(90, str(tmp_path / "score.png"))
+    with open(svg_path, encoding='utf-8') as f:
+        assert f.read() == gauge_svg(90)
+    with open(png_path, 'rb') as f:
+        assert f.read() == gauge_png(90)
+    assert create_ats_score_circle(90) == gauge_svg(90)
+
+
+def test_rendering_does_not_load_pyplot():
+    code = "from core.ats_gauge import gauge_png; gauge_png(50); import sys; print('matplotlib.pyplot' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.stdout.strip() == "False", result.stderr
@@ -0,0 +1,84 @@
+"""
+Tests for the declarative ATS rules and their compiled plan
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.ats import ATSAnalyzer
+from core.ats_rules import ATS_CRITERIA, compile_plan, with_profile
+from core.document import ParsedDocument
+from core.layout import LayoutFacts
+
+RESUME = ParsedDocument(
+    "SUMMARY\nBackend engineer\nEXPERIENCE\nDeveloped Python services, led code review and CI/CD, "
+    "improved throughput by 40%\nEDUCATION\nBS Computer Science\ngithub.com/jane",
+    ["summary", "backend", "engineer", "experience", "developed", "python", "services", "led", "code", "review"],
+    layout=LayoutFacts(1, 0, ("Calibri",), 0, 0),
+)
+
+
+def test_plan_runs_every_check_with_one_scan():
+    analyzer = ATSAnalyzer()
+    plan = analyzer.plan
+    plan.scanner.scan.cache_clear()
+    scores = ATSAnalyzer.score_categories.fn(analyzer, RESUME)
+    assert plan.scanner.scan.cache_info().misses == 1
+    assert list(scores) == list(ATS_CRITERIA)
+
+    text = RESUME.raw_text
+    assert scores == {
+        'format_compatibility': ATSAnalyzer.check_format_compatibility.fn(analyzer, text, RESUME.sections, RESUME.layout),
+        'keyword_optimization': ATSAnalyzer.check_keyword_optimization.fn(analyzer, text, RESUME),
+        'structure_quality': ATSAnalyzer.check_structure_quality.fn(analyzer, text, RESUME.sections),
+        'content_quality': ATSAnalyzer.check_content_quality.fn(analyzer, text, RESUME),
+    }
+
+
+def test_profile_adds_a_category_to_the_same_scan():
+    base = ATSAnalyzer().plan
+    analyzer = ATSAnalyzer("software_engineering")
+    plan = analyzer.plan
+    assert plan is compile_plan(with_profile(ATS_CRITERIA, "software_engineering"))
+    assert sum(plan.weights.values()) == pytest.approx(1.0)
+    assert len(plan.scanner.features) > len(base.scanner.features)
+
+    plan.scanner.scan.cache_clear()
+    scores = ATSAnalyzer.score_categories.fn(analyzer, RESUME)
+    assert plan.scanner.scan.cache_info().misses == 1
+    # "code review", "ci/cd" and "git" (inside github) of 3 needed, plus a code link
+    assert scores['engineering_practices'] == pytest.approx(1.0)
+
+    with pytest.raises(ValueError):
+        ATSAnalyzer("astronaut")
+
+
+def test_custom_rules_and_recommendations():
+    criteria = {
+        'certifications': {
+            'weight': 1.0,
+            'recommendation': "List your certifications",
+            'rules': [
+                {'check': 'cloud_certs', 'type': 'count', 'target': 2, 'points': 0.5,
+                 'keywords': ['AWS Certified', 'CKA'], 'patterns': [r'az-\d{3}']},
+                {'check': 'no_photo', 'type': 'absent', 'points': 0.5, 'keywords': ['photo'],
+                 'layout_facts': ['image_count']},
+            ],
+        },
+    }
+    analyzer = ATSAnalyzer()
+    analyzer.ats_criteria = criteria
+    plan = analyzer.plan
+    context = plan.context("AWS Certified; passed AZ-104. Photo attached.", [])
+    assert plan.evaluate(context) == {'certifications': 0.5}
+    # Extracted files are judged on their layout facts instead of the word "photo"
+    context = plan.context("AWS Certified. Photo attached.", [], layout=LayoutFacts(1, 0, (), 0, 0))
+    assert plan.evaluate(context) == {'certifications': 0.75}
+
+    scores, total = analyzer.weigh_scores({'certifications': 0.5})
+    assert total == 0.5
+    assert analyzer._generate_recommendations(scores, "") == ["List your certifications"]
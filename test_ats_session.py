@@ -0,0 +1,124 @@
+"""
+Tests for incremental ATS re-scoring sessions
+"""
+
+import os
+import re
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.ats import ATSAnalyzer
+from core.document import SHARED_VOCABULARY, ParsedDocument
+
+
+def tokenize(text):
+    # Stands in for clean_text, which needs the NLTK corpora
+    return re.findall(r'[a-z]+', text.lower())
+
+
+RESUME = """Jane Doe
+jane@mail.com | (555) 123-4567 | linkedin.com/in/jane
+
+SUMMARY
+Backend engineer building data platforms.
+
+EXPERIENCE
+Acme Corp - Software Engineer
+- Developed Python services on AWS, reduced latency by 40%
+- Managed a team of 4 engineers
+
+EDUCATION
+BS Computer Science, State University
+
+SKILLS
+Python, Docker, Kubernetes, PostgreSQL"""
+
+JD = ParsedDocument("Python engineer: AWS, Kubernetes, Terraform",
+                    ["python", "engineer", "aws", "kubernetes", "terraform"])
+
+EDITS = [
+    lambda text: text.replace("Managed a team of 4 engineers", "Led a team of 4 engineers, improved uptime by 20%"),
+    lambda text: text.replace("SUMMARY\n", ""),                                   # a heading disappears
+    lambda text: text + "\n- Built CI/CD with Terraform and React, 3x faster deploys",
+    lambda text: text.replace("Jane Doe\n", ""),
+    lambda text: "PROFILE\n" + text,                                               # header text moves under a heading
+    lambda text: text.replace("jane@mail.com | ", ""),
+    lambda text: "",
+    lambda text: RESUME,
+]
+
+
+def _full_scores(analyzer, text, jd):
+    document = ParsedDocument(text, tokenize(text))
+    plan = analyzer.plan
+    return plan.evaluate(plan.context(text, document, job_description=jd))
+
+
+@pytest.mark.parametrize("profile", [None, "software_engineering"])
+@pytest.mark.parametrize("jd", [JD, None])
+def test_session_matches_full_rescoring_after_each_edit(profile, jd):
+    analyzer = ATSAnalyzer(profile)
+    session = analyzer.start_session(RESUME, jd, tokenizer=tokenize)
+    assert session.scores == _full_scores(analyzer, RESUME, jd)
+
+    text = RESUME
+    for edit in EDITS:
+        text = edit(text)
+        assert session.update(text) == _full_scores(analyzer, text, jd)
+        assert session.text == text
+
+
+def test_only_changed_lines_and_categories_are_rescored():
+    analyzer = ATSAnalyzer()
+    session = analyzer.start_session(RESUME, JD, tokenizer=tokenize)
+    before = dict(session.stats)
+
+    session.update(RESUME.replace("Acme Corp", "Acme Inc"))
+    assert session.stats['lines_rescanned'] - before['lines_rescanned'] == 1
+    # Only the token set changed, so only the keyword category is scored again
+    assert session.stats['categories_rescored'] - before['categories_rescored'] == 1
+
+    rescored = session.stats['categories_rescored']
+    session.update(session.text)
+    assert session.stats['categories_rescored'] == rescored
+
+
+def test_apply_edit_and_job_description_changes():
+    analyzer = ATSAnalyzer()
+    session = analyzer.start_session(RESUME, None, tokenizer=tokenize)
+    start = RESUME.index("Managed")
+    session.apply_edit(start, start + len("Managed a team"), "Led a\nsmall team")
+    expected = RESUME[:start] + "Led a\nsmall team" + RESUME[start + len("Managed a team"):]
+    assert session.text == expected
+    assert session.scores == _full_scores(analyzer, expected, None)
+
+    assert session.set_job_description(JD) == _full_scores(analyzer, expected, JD)
+    result = session.result()
+    assert result['overall_score'] == session.overall_score
+    assert set(result['category_scores']) == set(analyzer.ats_criteria)
+
+
+def test_one_line_edit_is_fast():
+    session = ATSAnalyzer().start_session(RESUME * 5, JD, tokenizer=tokenize)
+    text = session.text
+    start = time.perf_counter()
+    for i in range(100):
+        text = text.replace(f"latency by {40 + i}%", f"latency by {41 + i}%", 1)
+        session.update(text)
+    assert (time.perf_counter() - start) / 100 < 0.005
+
+
+def test_session_keeps_its_vocabulary_across_rollovers(monkeypatch):
+    analyzer = ATSAnalyzer()
+    session = analyzer.start_session(RESUME, JD, tokenizer=tokenize)
+    monkeypatch.setattr(SHARED_VOCABULARY, "max_tokens", 0)   # every new document starts a new vocabulary
+    text = RESUME
+    for edit in EDITS:
+        text = edit(text)
+        assert session.update(text) == _full_scores(analyzer, text, JD)
+    assert [improvement.phrase for improvement in session.rank_improvements()] == \
+        [improvement.phrase for improvement in analyzer.rank_improvements(ParsedDocument(text, tokenize(text)), JD, top_n=None, tokenizer=tokenize)]
@@ -0,0 +1,57 @@
+"""
+Tests for the what-if simulation of ATS score gains
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.ats import ATSAnalyzer
+from core.ats_whatif import candidate_phrases, simulate
+from core.document import ParsedDocument
+from test_ats_session import JD, RESUME, tokenize
+
+NO_HEADINGS = "Jane Doe\nWrote some Python scripts.\nManaged a small team"
+
+
+def _document(text):
+    return ParsedDocument(text, tokenize(text))
+
+
+@pytest.mark.parametrize("text", [RESUME, NO_HEADINGS, ""])
+@pytest.mark.parametrize("jd", [JD, None])
+@pytest.mark.parametrize("profile", [None, "software_engineering"])
+def test_simulated_scores_equal_rescoring_with_the_phrase_added(text, jd, profile):
+    analyzer = ATSAnalyzer(profile)
+    plan = analyzer.plan
+    session = analyzer.start_session(text, jd, tokenizer=tokenize)
+    context = session._context()
+    candidates = candidate_phrases(plan, context)
+    assert candidates
+    scores = simulate(plan, context, [phrase for _, phrase, _ in candidates], tokenize)
+
+    assert {category: scores[category][0] for category in plan.categories} == session.scores
+    for row, (_, phrase, _) in enumerate(candidates, 1):
+        session.update(text + "\n" + phrase)
+        assert {category: scores[category][row] for category in plan.categories} == session.scores, phrase
+        session.update(text)
+
+
+def test_ranking_is_ordered_and_quantified():
+    analyzer = ATSAnalyzer()
+    improvements = analyzer.rank_improvements(_document(NO_HEADINGS), JD, top_n=None, tokenizer=tokenize)
+    gains = [improvement.gain for improvement in improvements]
+    assert gains == sorted(gains, reverse=True) and gains[-1] > 0
+    kinds = {improvement.kind for improvement in improvements}
+    assert kinds == {'section', 'keyword', 'skill', 'jd_keyword'}
+
+    phrases = {improvement.phrase: improvement for improvement in improvements}
+    # Terraform and AWS are in the JD but not the resume; "developed" is an unused action verb
+    assert phrases['Terraform'].kind == 'skill' and phrases['aws'].kind == 'jd_keyword'
+    assert phrases['developed'].category_gains.keys() >= {'keyword_optimization', 'content_quality'}
+    # Present keywords are never suggested
+    assert 'managed' not in phrases and 'python' not in phrases
+    assert len(analyzer.rank_improvements(_document(NO_HEADINGS), JD, top_n=3, tokenizer=tokenize)) == 3
@@ -0,0 +1,73 @@
+"""
+Parity tests for the precompiled clean_text pipeline
+"""
+
+import glob
+import os
+import re
+import string
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+nltk = pytest.importorskip("nltk")
+pytest.importorskip("langchain_community")
+from core.utils import clean_text, iter_resume_pages, _regex_tokenize, _PUNCT_DIGIT_TABLE, _DIGITS_RE
+
+EDGE_CASES = [
+    "",
+    "   \n\t ",
+    "I cannot attend; gonna ship it, wanna help? GIMME 5 mins, lemme know & gotta go",
+    "“Quoted” ‘text’ «guillemets» „low” – en—em ‒ figure ― bar",
+    "Résumé • naïve café ٣٤٥ digits² and 2024",
+    "wanna’ cannot— C++/C# .NET Node.js 3.5 years 40% $100k",
+]
+
+
+def _sample_texts():
+    texts = list(EDGE_CASES)
+    for path in glob.glob(os.path.join(os.path.dirname(__file__), "data", "raw", "resumes", "*.pdf")):
+        texts.append(" ".join(iter_resume_pages(path)))
+    with open(os.path.join(os.path.dirname(__file__), "data", "raw", "job_descriptions", "ai_engineer.txt"), encoding="utf-8") as f:
+        texts.append(f.read())
+    return texts
+
+
+def _legacy_clean_text(text):
+    """The clean_text implementation the fast path replaced, kept verbatim as the reference"""
+    from nltk.corpus import stopwords
+    from nltk.stem import WordNetLemmatizer
+
+    text = text.lower()
+    text = re.sub(f'[{re.escape(string.punctuation)}]', '', text)
+    text = re.sub(r'\d+', '', text)
+    tokens = nltk.word_tokenize(text)
+    stop_words = set(stopwords.words('english'))
+    tokens = [word for word in tokens if word not in stop_words]
+    lemmatizer = WordNetLemmatizer()
+    return [lemmatizer.lemmatize(word) for word in tokens]
+
+
+def test_regex_tokenizer_matches_treebank():
+    """The regex tokenizer splits punctuation-free text exactly like NLTK's Treebank tokenizer"""
+    for text in _sample_texts():
+        stripped = text.lower().translate(_PUNCT_DIGIT_TABLE)
+        stripped = _DIGITS_RE.sub('', stripped)
+        assert _regex_tokenize(stripped) == nltk.word_tokenize(stripped, preserve_line=True)
+
+
+def test_clean_text_matches_legacy_output():
+    """Both tokenizer modes produce exactly the tokens of the original implementation"""
+    try:
+        nltk.data.find("corpora/stopwords")
+        nltk.data.find("corpora/wordnet")
+        nltk.data.find("tokenizers/punkt_tab")
+    except LookupError:
+        pytest.skip("NLTK corpora are not installed")
+
+    for text in _sample_texts():
+        expected = _legacy_clean_text(text)
+        assert clean_text(text) == expected
+        assert clean_text(text, tokenizer="nltk") == expected
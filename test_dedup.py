@@ -0,0 +1,54 @@
+"""
+Tests for MinHash LSH near-duplicate clustering
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.dedup import cluster_near_duplicates
+
+WORDS = ["python", "data", "pipeline", "model", "team", "cloud", "deploy", "api", "sql", "spark",
+         "design", "build", "lead", "test", "scale", "react", "docker", "train", "serve", "metric"]
+
+
+def resume_tokens(seed: int, length: int = 300) -> list[str]:
+    rng = random.Random(seed)
+    return [rng.choice(WORDS) + str(rng.randrange(50)) for _ in range(length)]
+
+
+def test_trivial_edits_cluster_behind_the_first_copy():
+    original = resume_tokens(1)
+    edited = original[:100] + ["phone555"] + original[101:]   # one token changed
+    reordered = original[150:] + original[:150]               # sections swapped
+    other = resume_tokens(2)
+
+    clusters = cluster_near_duplicates([
+        ("a.pdf", original), ("b.pdf", other), ("a_v2.pdf", edited), ("a_v3.pdf", reordered), ("empty.pdf", []),
+    ])
+    assert [cluster.representative for cluster in clusters] == ["a.pdf", "b.pdf", "empty.pdf"]
+    duplicates = dict(clusters[0].duplicates)
+    assert list(duplicates) == ["a_v2.pdf", "a_v3.pdf"]
+    assert all(similarity >= 0.8 for similarity in duplicates.values())
+    assert clusters[1].duplicates == [] and clusters[2].duplicates == []
+
+
+def test_duplicates_are_compared_with_the_representative():
+    words = [f"word{i}" for i in range(120)]
+    # b is close to a and c is close to b, but c is not close to a
+    clusters = cluster_near_duplicates([("a", words[:100]), ("b", words[10:110]), ("c", words[20:120])],
+                                       threshold=0.78)
+    assert [cluster.representative for cluster in clusters] == ["a", "c"]
+    assert [key for key, _ in clusters[0].duplicates] == ["b"]
+    assert clusters[1].duplicates == []
+
+
+def test_bundled_resumes_are_distinct():
+    from core.utils import iter_resume_pages
+    resumes_dir = os.path.join(os.path.dirname(__file__), "data", "raw", "resumes")
+    documents = [(name, " ".join(iter_resume_pages(os.path.join(resumes_dir, name))).lower().split())
+                 for name in sorted(os.listdir(resumes_dir)) if name.endswith(".pdf")]
+    # Same candidate, but each resume is tailored to a different role
+    assert all(not cluster.duplicates for cluster in cluster_near_duplicates(documents))
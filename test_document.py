@@ -0,0 +1,60 @@
+"""
+Tests for the shared ParsedDocument representation
+"""
+
+import os
+import pickle
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.document import ParsedDocument, SharedVocabulary, Vocabulary, as_document, ids_in, raw_text_of
+
+
+def test_tokens_are_interned_once():
+    """Documents share one vocabulary and behave like their token lists"""
+    vocabulary = Vocabulary()
+    resume = ParsedDocument("Python ML engineer", ["python", "ml", "engineer"], vocabulary=vocabulary)
+    jd = ParsedDocument("Python engineer wanted", ["python", "engineer", "wanted"], vocabulary=vocabulary)
+
+    assert len(vocabulary) == 4
+    assert list(resume) == resume.tokens == ["python", "ml", "engineer"]
+    assert len(resume) == 3
+    assert resume.cleaned_text == "python ml engineer"
+    assert resume.lower_text == "python ml engineer"
+    assert resume.overlap(jd) == 2
+
+
+def test_pickle_round_trip():
+    """Pickled documents re-intern their tokens on the receiving side"""
+    doc = ParsedDocument("Go developer", ["go", "developer"], source="resume.pdf")
+    restored = pickle.loads(pickle.dumps(doc))
+
+    assert restored.raw_text == doc.raw_text
+    assert restored.tokens == doc.tokens
+    assert restored.source == "resume.pdf"
+
+
+def test_helpers_accept_documents_and_strings():
+    doc = ParsedDocument("Rust", ["rust"])
+    assert as_document(doc) is doc
+    assert as_document("Rust", doc) is doc
+    assert as_document("Rust", ["rust"]).tokens == ["rust"]
+    assert raw_text_of(doc) == raw_text_of("Rust") == "Rust"
+
+
+def test_shared_vocabulary_is_bounded():
+    """A full shared vocabulary is replaced; documents keep the one that encoded them"""
+    shared = SharedVocabulary(max_tokens=3)
+    released = []
+    shared.on_release(lambda: released.append(True))
+    first = ParsedDocument("Python ML engineer", ["python", "ml", "engineer"], vocabulary=shared.acquire())
+    assert len(shared) == 3 and not released
+
+    second = ParsedDocument("Python developer", ["python", "developer"], vocabulary=shared.acquire())
+    assert released == [True] and shared.generation == 1
+    assert second.vocabulary is not first.vocabulary and len(shared) == 2
+    assert first.tokens == ["python", "ml", "engineer"]
+    assert first.overlap(second) == 1
+    assert ids_in(first, second.vocabulary) & second.token_id_set == set(second.vocabulary.encode(["python"]))
+    assert ids_in(second, second.vocabulary) is second.token_id_set
@@ -0,0 +1,60 @@
+"""
+Tests for streaming DOCX resume extraction
+"""
+
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+pytest.importorskip("langchain_community")
+from core.utils import iter_resume_pages, load_resume
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p><w:r><w:t>Jane Doe</w:t></w:r></w:p>
+    <w:p><w:r><w:t>SUMMARY</w:t></w:r></w:p>
+    <w:p><w:r><w:t xml:space="preserve">Python </w:t></w:r><w:r><w:t>engineer</w:t><w:tab/><w:t>Remote</w:t></w:r></w:p>
+    <w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell A</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>Cell B</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+    <w:p><w:r><w:t>Line one</w:t><w:br/><w:t>Line two</w:t></w:r></w:p>
+    <w:p><w:r><w:br w:type="page"/></w:r></w:p>
+    <w:p><w:r><w:t>EXPERIENCE</w:t></w:r></w:p>
+    <w:sectPr/>
+  </w:body>
+</w:document>
+"""
+
+
+def _write_docx(path):
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", DOCUMENT)
+
+
+def test_docx_pages_keep_paragraph_breaks(tmp_path):
+    """Paragraphs become lines and explicit page breaks split pages"""
+    path = str(tmp_path / "resume.docx")
+    _write_docx(path)
+
+    assert list(iter_resume_pages(path)) == [
+        "Jane Doe\nSUMMARY\nPython engineer\tRemote\nCell A\nCell B\nLine one\nLine two",
+        "EXPERIENCE",
+    ]
+    assert load_resume(path, use_cache=False).startswith("Jane Doe\nSUMMARY\n")
+
+
+def test_docx_respects_bounds(tmp_path):
+    """Page and character bounds apply to DOCX like they do to PDF"""
+    path = str(tmp_path / "resume.docx")
+    _write_docx(path)
+
+    assert len(list(iter_resume_pages(path, max_pages=1))) == 1
+    assert "".join(iter_resume_pages(path, max_chars=12)) == "Jane Doe\nSUM"
+
+
+def test_legacy_doc_is_rejected(tmp_path):
+    with pytest.raises(NotImplementedError):
+        list(iter_resume_pages(str(tmp_path / "resume.doc")))
@@ -0,0 +1,117 @@
+"""
+Tests for the persistent embedding cache
+"""
+
+import os
+import sys
+import time
+import zlib
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import core.embedding_provider as provider
+from core.embedding_cache import CachedEmbeddings, EmbeddingCache
+
+MODEL = provider.EMBEDDING_MODEL
+
+
+def vector_of(text, dim=8):
+    rng = np.random.default_rng(zlib.crc32(text.encode()))
+    return rng.standard_normal(dim).astype(np.float32)
+
+
+class CountingModel:
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [vector_of(text).tolist() for text in texts]
+
+
+@pytest.fixture
+def model(monkeypatch):
+    model = CountingModel()
+    monkeypatch.setattr(provider, '_load', lambda model_name, normalize: model)
+    monkeypatch.setattr(provider, '_models', {})
+    return model
+
+
+def test_vectors_round_trip_exactly_and_persist(tmp_path):
+    cache = EmbeddingCache(str(tmp_path))
+    texts = ["python engineer", "aws kubernetes", ""]
+    assert cache.get_many(MODEL, True, texts) == [None, None, None]
+    cache.put_many(MODEL, True, texts, [vector_of(text) for text in texts])
+
+    for text, vector in zip(texts, cache.get_many(MODEL, True, texts)):
+        assert vector.dtype == np.float32 and np.array_equal(vector, vector_of(text))
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (3, 3, 3)
+    assert stats["hit_rate"] == 0.5
+
+    # Keyed by model and normalize flag; model names ignore case like the provider's
+    assert cache.get_many(MODEL, False, texts[:1]) == [None]
+    assert cache.get_many("other/model", True, texts[:1]) == [None]
+    assert np.array_equal(cache.get_many(MODEL.lower(), True, texts[:1])[0], vector_of(texts[0]))
+
+    # Another process (or a restart) reads the same files
+    reopened = EmbeddingCache(str(tmp_path))
+    assert np.array_equal(reopened.get_many(MODEL, True, texts[1:2])[0], vector_of(texts[1]))
+
+    with pytest.raises(ValueError):
+        cache.put_many(MODEL, True, ["wrong size"], [np.zeros(4)])
+
+
+def test_least_recently_used_vectors_are_replaced(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), max_entries=2)
+    for text in ["a", "b"]:
+        cache.put_many(MODEL, True, [text], [vector_of(text)])
+        time.sleep(0.01)
+    cache.get_many(MODEL, True, ["a"])  # "b" is now the least recently used
+    time.sleep(0.01)
+    cache.put_many(MODEL, True, ["c"], [vector_of("c")])
+
+    a, b, c = cache.get_many(MODEL, True, ["a", "b", "c"])
+    assert b is None and np.array_equal(a, vector_of("a")) and np.array_equal(c, vector_of("c"))
+    assert cache.stats()["evictions"] == 1 and cache.stats()["entries"] == 2
+
+
+def test_rows_reused_by_another_process_are_not_served(tmp_path):
+    writer = EmbeddingCache(str(tmp_path), max_entries=1)
+    reader = EmbeddingCache(str(tmp_path), max_entries=1)
+    writer.put_many(MODEL, True, ["x"], [vector_of("x")])
+    assert np.array_equal(reader.get_many(MODEL, True, ["x"])[0], vector_of("x"))
+
+    writer.put_many(MODEL, True, ["y"], [vector_of("y")])  # overwrites the row holding "x"
+    assert reader.get_many(MODEL, True, ["x"]) == [None]
+    assert np.array_equal(reader.get_many(MODEL, True, ["y"])[0], vector_of("y"))
+
+
+def test_only_uncached_texts_reach_the_model(tmp_path, model):
+    embeddings = CachedEmbeddings(MODEL, True, EmbeddingCache(str(tmp_path)))
+    jd = "senior python engineer aws"
+    first = embeddings.embed_documents(["resume one", jd, jd])
+    assert model.embedded == ["resume one", jd]
+    assert first == [vector_of(text).tolist() for text in ["resume one", jd, jd]]
+
+    second = embeddings.embed_documents(["resume two", jd])
+    assert model.embedded == ["resume one", jd, "resume two"]
+    assert second[1] == first[1]
+    assert embeddings.embed_query(jd) == first[1]
+    assert len(model.embedded) == 3
+
+
+def test_warm_lookups_do_not_load_the_model(tmp_path, model):
+    cache = EmbeddingCache(str(tmp_path))
+    cache.put_many(MODEL, True, ["cached"], [vector_of("cached")])
+    embeddings = CachedEmbeddings(MODEL, True, cache)
+    assert embeddings.embed_query("cached") == vector_of("cached").tolist()
+    assert provider.loaded_models() == []
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        embeddings.embed_query("cached")
+    assert (time.perf_counter() - start) / 1000 < 0.0005
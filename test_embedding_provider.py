@@ -0,0 +1,85 @@
+"""
+Tests for the shared, lazily loaded embedding model
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import core.embedding_provider as provider
+from core.embedding import calculate_similarity
+
+
+class FakeEmbeddings:
+    def __init__(self, model_name, normalize):
+        self.model_name = model_name
+        self.normalize = normalize
+        self.queries = []
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return [1.0, 0.0]
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    calls = []
+
+    def load(model_name, normalize):
+        calls.append((model_name, normalize))
+        time.sleep(0.05)  # long enough for concurrent callers to overlap
+        return FakeEmbeddings(model_name, normalize)
+
+    monkeypatch.setattr(provider, '_load', load)
+    monkeypatch.setattr(provider, '_models', {})
+    monkeypatch.setattr(provider, '_warm_up_thread', None)
+    return calls
+
+
+def test_one_model_per_process_whatever_the_spelling(loads):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(provider.get_embeddings())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert loads == [(provider.EMBEDDING_MODEL, True)]
+    assert all(result is results[0] for result in results)
+
+    # The casing the vector store builder used to load a second copy with
+    assert provider.get_embeddings("sentence-transformers/all-MiniLM-l6-v2") is results[0]
+    assert provider.loaded_models() == [(provider.EMBEDDING_MODEL, True)]
+    assert provider.canonical_model_name("some/other-Model") == "some/other-Model"
+
+
+def test_warm_up_loads_and_embeds_once(loads):
+    thread = provider.warm_up(background=True)
+    assert provider.warm_up(background=True) is thread
+    thread.join()
+    embeddings = provider.get_embeddings()
+    assert embeddings.queries == ["warm up"] and len(loads) == 1
+
+    assert provider.warm_up() is None
+    assert embeddings.queries == ["warm up", "warm up"] and len(loads) == 1
+
+
+def test_importing_does_not_load_a_model_or_need_api_keys():
+    env = {key: value for key, value in os.environ.items()
+           if key not in ('GROQ_API_KEY', 'HUGGINGFACEHUB_API_TOKEN')}
+    code = ("import sys, core.embedding, core.embedding_provider as p; "
+            "assert p.loaded_models() == []; "
+            "assert not {'torch', 'langchain_huggingface', 'sentence_transformers'} & set(sys.modules)")
+    subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)), env=env, check=True)
+
+
+def test_calculate_similarity():
+    assert calculate_similarity([1.0, 0.0], [2.0, 0.0]) == pytest.approx(1.0)
+    assert calculate_similarity([1.0, 0.0], [0.0, 3.0]) == pytest.approx(0.0)
+    assert calculate_similarity([1.0, 1.0], [1.0, 0.0]) == pytest.approx(2 ** -0.5)
+    assert calculate_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
@@ -0,0 +1,106 @@
+"""
+Tests for BM25-weighted job description keyword profiles
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core import jd_keywords
+from core.ats import ATSAnalyzer
+from core.document import ParsedDocument
+from core.jd_keywords import IDFTable, jd_keyword_profile, jd_profile_cache_stats, load_idf_table, save_idf_table
+
+# "python" is in every corpus document, "kubernetes" in one of ten
+TABLE = IDFTable(10, {"python": 10, "kubernetes": 1, "engineer": 5}, "test-table")
+
+JD = ParsedDocument("Python engineer, Kubernetes, Python",
+                    ["python", "engineer", "kubernetes", "python"])
+
+
+@pytest.fixture(autouse=True)
+def idf_table():
+    jd_keywords.set_idf_table(TABLE)
+    yield
+    jd_keywords.set_idf_table(None)
+
+
+def test_weights_follow_idf_and_sum_to_one():
+    profile = jd_keyword_profile(JD)
+    weights = dict(profile.top_keywords())
+    assert sum(weights.values()) == pytest.approx(1.0)
+    assert list(weights)[0] == "kubernetes"
+    assert weights["kubernetes"] > weights["engineer"] > weights["python"]
+    assert list(profile.token_ids) == sorted(profile.token_ids)
+
+
+def test_profile_is_cached_by_text():
+    before = jd_profile_cache_stats()
+    first = jd_keyword_profile(JD)
+    assert jd_keyword_profile(JD) is first
+    # Same text, different tokens: a different profile
+    other = jd_keyword_profile(ParsedDocument(JD.raw_text, ["python"]))
+    assert other is not first and len(other) == 1
+    after = jd_profile_cache_stats()
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 2
+
+
+def test_rare_keywords_score_higher():
+    analyzer = ATSAnalyzer()
+    check = ATSAnalyzer.check_keyword_optimization.fn
+    rare = ParsedDocument("Kubernetes", ["kubernetes"])
+    common = ParsedDocument("Python", ["python"])
+    assert check(analyzer, rare.raw_text, rare, JD) > check(analyzer, common.raw_text, common, JD)
+    matrix = analyzer.score_matrix([rare, common], [JD]).category_scores['keyword_optimization']
+    assert matrix[0, 0] == check(analyzer, rare.raw_text, rare, JD)
+    assert matrix[1, 0] == check(analyzer, common.raw_text, common, JD)
+
+
+def test_uniform_table_weights_by_term_frequency():
+    jd_keywords.set_idf_table(jd_keywords.UNIFORM_IDF)
+    weights = dict(jd_keyword_profile(JD).top_keywords())
+    assert weights["python"] > weights["engineer"] == weights["kubernetes"]
+
+
+def test_idf_table_round_trip(tmp_path):
+    path = save_idf_table(TABLE, str(tmp_path / "idf.json"))
+    loaded = load_idf_table(path)
+    assert (loaded.documents, loaded.df) == (TABLE.documents, TABLE.df)
+    assert np.isclose(loaded.idf("kubernetes"), TABLE.idf("kubernetes"))
+    assert loaded.idf("unseen") > loaded.idf("kubernetes") > loaded.idf("python") > 0
+
+
+def test_requests_load_the_shipped_table_and_never_build_it(tmp_path, monkeypatch, capsys):
+    def build(*args):
+        raise AssertionError("the IDF table must not be built in the request path")
+    monkeypatch.setattr(jd_keywords, "build_idf_table", build)
+
+    monkeypatch.setattr(jd_keywords, "IDF_TABLE_PATH", save_idf_table(TABLE, str(tmp_path / "idf.json")))
+    jd_keywords.set_idf_table(None)
+    assert jd_keywords.get_idf_table().df == TABLE.df
+
+    monkeypatch.setattr(jd_keywords, "IDF_TABLE_PATH", str(tmp_path / "missing.json"))
+    jd_keywords.set_idf_table(None)
+    assert jd_keywords.get_idf_table() is jd_keywords.UNIFORM_IDF
+    out, err = capsys.readouterr()
+    # stdout may be a JSONL stream (agents/ats_agent.py)
+    assert out == "" and "python -m core.jd_keywords" in err
+
+
+def test_shipped_table_weights_common_terms_below_rare_ones(monkeypatch, capsys):
+    shipped = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "keywords", "idf_table.json")
+    monkeypatch.setattr(jd_keywords, "IDF_TABLE_PATH", shipped)
+    jd_keywords.set_idf_table(None)
+    table = jd_keywords.get_idf_table()
+    assert capsys.readouterr().err == ""
+
+    assert table is not jd_keywords.UNIFORM_IDF and table.documents > 1000
+    # Lemmas of plural corpus words have their own document frequency
+    assert table.df["pipeline"] and table.df["policy"]
+    assert table.idf("data") < table.idf("pipeline") < table.idf("kubernetes") < table.idf("tokenomics")
+    assert jd_keywords.lemma_candidates("policies") == {"policies", "policie", "policy"}
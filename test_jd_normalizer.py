@@ -0,0 +1,123 @@
+"""
+Tests for JD boilerplate stripping
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.jd_normalizer import estimate_tokens, normalize_job_description, jd_cache_stats, strip_jd_boilerplate
+
+JD_PATH = os.path.join(os.path.dirname(__file__), "data", "raw", "job_descriptions", "ai_engineer.txt")
+
+
+def test_sample_jd_keeps_role_and_drops_boilerplate():
+    with open(JD_PATH, encoding="utf-8") as f:
+        jd_text = f.read()
+    result = normalize_job_description(jd_text)
+
+    assert result.removed_headings == [
+        "Company Overview", "What We Offer", "Application Process", "Equal Opportunity Employer"
+    ]
+    for kept in ("Job Title: AI Engineer", "Key Responsibilities:", "Required Qualifications:",
+                 "Preferred Qualifications:", "TensorFlow, PyTorch, scikit-learn"):
+        assert kept in result.text
+    for dropped in ("Competitive salary", "cover letter", "veteran status"):
+        assert dropped not in result.text
+    assert result.tokens_saved > result.tokens_before // 4
+
+    # Normalizing is idempotent and served from the cache the second time
+    hits = jd_cache_stats()["hits"]
+    assert normalize_job_description(jd_text) is result
+    assert jd_cache_stats()["hits"] == hits + 1
+    assert normalize_job_description(result.text).text == result.text
+
+
+def test_unheaded_boilerplate_and_edge_cases():
+    jd_text = (
+        "Senior Data Engineer\n"
+        "Build Spark pipelines on AWS.\n\n"
+        "We are an equal opportunity employer and value diversity.\n\n"
+        "Benefits\n"
+        "- Health insurance\n"
+        "Requirements:\n"
+        "- 5 years of SQL"
+    )
+    text = strip_jd_boilerplate(jd_text)
+    assert text == "Senior Data Engineer\nBuild Spark pipelines on AWS.\nRequirements:\n- 5 years of SQL"
+
+    # A bullet that merely mentions benefits is not a heading
+    assert "health benefits" in strip_jd_boilerplate("Responsibilities:\n- Administer health benefits")
+    # A JD that is all boilerplate is returned as-is rather than emptied
+    assert strip_jd_boilerplate("Benefits:\n- Free lunch") == "Benefits:\n- Free lunch"
+    assert strip_jd_boilerplate("") == ""
+
+
+def test_unheaded_text_without_blank_lines_keeps_the_role():
+    """Only boilerplate sentences go; the title and role description stay"""
+    jd_text = (
+        "Senior Python Engineer at Acme\n"
+        "You will build Django APIs and Kafka pipelines. Competitive salary.\n"
+        "Requirements:\n"
+        "- 5 years Python"
+    )
+    result = normalize_job_description(jd_text)
+    assert result.text == (
+        "Senior Python Engineer at Acme\n"
+        "You will build Django APIs and Kafka pipelines.\n"
+        "Requirements:\n"
+        "- 5 years Python"
+    )
+    assert result.removed_headings == ["(unheaded boilerplate)"]
+
+
+def test_bare_headings_end_boilerplate_blocks():
+    jd_text = (
+        "Data Engineer\n"
+        "About Us\n"
+        "Acme is a leading fintech company with offices worldwide.\n"
+        "Responsibilities\n"
+        "- Build Spark pipelines\n"
+        "Requirements\n"
+        "- 5 years Python\n"
+        "Perks and Benefits\n"
+        "- Free lunch"
+    )
+    result = normalize_job_description(jd_text)
+    assert result.text == (
+        "Data Engineer\nResponsibilities\n- Build Spark pipelines\nRequirements\n- 5 years Python"
+    )
+    assert result.removed_headings == ["About Us", "Perks and Benefits"]
+
+
+def test_only_whole_boilerplate_headings_are_dropped():
+    jd_text = (
+        "Benefits Analyst\n"
+        "Benefits Administration Duties:\n"
+        "- Run open enrollment\n"
+        "Life at Acme:\n"
+        "- Hybrid office\n"
+        "Why Join Us?\n"
+        "- Great team"
+    )
+    result = normalize_job_description(jd_text)
+    assert result.text == "Benefits Analyst\nBenefits Administration Duties:\n- Run open enrollment"
+    assert result.removed_headings == ["Life at Acme", "Why Join Us?"]
+
+
+def test_savings_are_reported_on_stderr_once(capsys):
+    jd_text = "Platform Engineer\nBuild Kubernetes tooling.\nBenefits:\n- Free lunch and a gym membership"
+    strip_jd_boilerplate(jd_text, caller="test")
+    strip_jd_boilerplate(jd_text, caller="test")
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err.count("JD normalization for test") == 1
+
+
+def test_token_counts_are_exact_with_tiktoken():
+    tiktoken = pytest.importorskip("tiktoken")
+    text = "Senior Python Engineer: build Django APIs and Kafka pipelines."
+    assert estimate_tokens(text) == len(tiktoken.get_encoding("cl100k_base").encode(text))
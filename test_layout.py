@@ -0,0 +1,93 @@
+"""
+Tests for layout facts collected during extraction
+"""
+
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.layout import LayoutFacts, analyze_page, font_family, is_standard_font
+from core.pdf_backends import available_backends, get_pdf_backend
+from core.utils import iter_resume_pages
+
+
+@pytest.fixture
+def layout_pdf(tmp_path):
+    """Page 1: a skills sidebar beside the experience column. Page 2: plain text, then a 4x4 table."""
+    fpdf = pytest.importorskip("fpdf")
+    pdf = fpdf.FPDF()
+    pdf.set_font("Helvetica", size=10)
+    pdf.add_page()
+    pdf.cell(0, 8, "Jane Doe - Data Engineer", align="C")
+    top = pdf.get_y() + 10
+    for i in range(12):
+        pdf.set_xy(10, top + i * 6)
+        pdf.cell(50, 6, f"Skill number {i}")
+    for i in range(20):
+        pdf.set_xy(80, top + i * 5.5)
+        pdf.cell(110, 6, f"Built pipeline {i} that processed many records daily")
+    pdf.add_page()
+    for _ in range(5):
+        pdf.set_x(10)
+        pdf.multi_cell(190, 6, "Led a team that delivered analytics dashboards for the finance department.")
+    for row in range(4):
+        pdf.set_x(10)
+        for column in range(4):
+            pdf.cell(40, 7, f"r{row}c{column} value", border=1)
+        pdf.ln(7)
+    path = str(tmp_path / "layout.pdf")
+    pdf.output(path)
+    return path
+
+
+@pytest.mark.parametrize("name", ["pymupdf", "pypdf", "pdfminer"])
+def test_pdf_layout_is_collected_with_the_text(name, layout_pdf):
+    if name not in available_backends():
+        pytest.skip(f"{name} is not installed")
+    page_layouts = []
+    pages = list(iter_resume_pages(layout_pdf, backend=name, layout=page_layouts))
+
+    assert pages == list(get_pdf_backend(name).iter_pages(layout_pdf))
+    assert [(page.multi_column, page.tables) for page in page_layouts] == [(True, 0), (False, 1)]
+    facts = LayoutFacts.from_pages(page_layouts)
+    assert facts.fonts == ("Helvetica",) and not facts.nonstandard_fonts
+    assert LayoutFacts.from_dict(facts.as_dict()) == facts
+
+
+def test_single_column_with_right_aligned_dates():
+    # Title + date rows and full-width bullets, like most one-column resumes
+    boxes = []
+    for job in range(4):
+        y = job * 60
+        boxes += [(40, y, 140, y + 10), (430, y, 555, y + 10)]
+        boxes += [(40, y + 12 * line, 540, y + 12 * line + 10) for line in range(1, 4)]
+    page = analyze_page(boxes, 612, images=0, fonts=["ABCDEF+Calibri-Bold", "Type3 (12 0 R)"])
+    assert page == (0, ("Calibri",), False, 0)
+
+
+def test_font_names():
+    assert font_family("/QWERTY+TimesNewRomanPSMT") == "TimesNewRomanPSMT"
+    assert is_standard_font("TimesNewRomanPSMT") and is_standard_font("Arial")
+    assert not is_standard_font("MerriweatherLight18pt")
+
+
+def test_docx_layout(tmp_path):
+    w = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    wp = 'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"'
+    body = (
+        '<w:p><w:r><w:rPr><w:rFonts w:ascii="Garamond" w:hAnsi="Garamond"/></w:rPr><w:t>Jane Doe</w:t></w:r></w:p>'
+        '<w:p><w:r><w:drawing><wp:inline><wp:extent cx="1270000" cy="1270000"/></wp:inline></w:drawing></w:r></w:p>'
+        '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+        '<w:sectPr><w:cols w:num="2"/></w:sectPr>'
+    )
+    path = str(tmp_path / "resume.docx")
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", f'<w:document {w} {wp}><w:body>{body}</w:body></w:document>')
+
+    page_layouts = []
+    assert list(iter_resume_pages(path, layout=page_layouts)) == ["Jane Doe\n\nPython"]
+    assert page_layouts == [(1, ("Garamond",), True, 1)]
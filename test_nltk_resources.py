@@ -0,0 +1,68 @@
+"""
+Tests for the offline NLTK resource manager
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+nltk = pytest.importorskip("nltk")
+import core.nltk_resources as nltk_resources
+from core.nltk_resources import NLTKResourceError
+
+
+@pytest.fixture
+def bundled(monkeypatch, tmp_path):
+    """An empty bundled data directory as the only search path; downloads are recorded, not made."""
+    data_dir = tmp_path / 'nltk_data'
+    data_dir.mkdir()
+    downloads = []
+    monkeypatch.setattr(nltk_resources, 'BUNDLED_NLTK_DATA', str(data_dir))
+    monkeypatch.setattr(nltk.data, 'path', [])
+    monkeypatch.setattr(nltk, 'download', lambda *args, **kwargs: downloads.append((args, kwargs)))
+    caches = (nltk_resources.resource_status, nltk_resources.get_stopwords, nltk_resources.get_lemmatizer)
+    for cache in caches:
+        cache.cache_clear()
+    yield data_dir, downloads
+    for cache in caches:
+        cache.cache_clear()
+
+
+def test_missing_resource_raises_with_the_download_hint(bundled):
+    data_dir, downloads = bundled
+    with pytest.raises(NLTKResourceError) as error:
+        nltk_resources.require("stopwords")
+    assert "'stopwords'" in str(error.value)
+    assert "python -m core.nltk_resources" in str(error.value) and str(data_dir) in str(error.value)
+    assert isinstance(error.value, LookupError)
+
+    for load in (nltk_resources.get_stopwords, nltk_resources.get_lemmatizer,
+                 lambda: nltk_resources.word_tokenize("python engineer")):
+        with pytest.raises(NLTKResourceError):
+            load()
+    assert downloads == []
+
+
+def test_bundled_directory_is_searched_first(bundled):
+    data_dir, downloads = bundled
+    (data_dir / 'corpora' / 'stopwords').mkdir(parents=True)
+    (data_dir / 'corpora' / 'stopwords' / 'english').write_text("a\nthe\n")
+
+    status = nltk_resources.resource_status()
+    assert nltk.data.path[0] == str(data_dir)
+    assert status["stopwords"] and not status["wordnet"]
+    nltk_resources.require("stopwords")
+    assert downloads == []
+
+
+def test_only_warm_up_downloads(bundled):
+    data_dir, downloads = bundled
+    assert not any(nltk_resources.warm_up(download=False).values())
+    assert downloads == []
+
+    nltk_resources.warm_up(download_dir=str(data_dir))
+    assert [args[0] for args, _ in downloads] == list(nltk_resources.NLTK_RESOURCES)
+    assert all(kwargs["download_dir"] == str(data_dir) for _, kwargs in downloads)
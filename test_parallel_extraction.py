@@ -0,0 +1,52 @@
+"""
+Tests for page-parallel PDF extraction
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.pdf_backends import available_backends
+from core.utils import PARALLEL_PAGE_THRESHOLD, _extract_resume_text, extract_pages_parallel, iter_resume_pages
+
+PAGE_COUNT = PARALLEL_PAGE_THRESHOLD + 3
+
+
+@pytest.fixture(scope="module")
+def long_pdf(tmp_path_factory):
+    """A PDF above the parallel threshold whose pages all differ."""
+    fpdf = pytest.importorskip("fpdf")
+    pdf = fpdf.FPDF()
+    pdf.set_font("Helvetica", size=10)
+    for number in range(PAGE_COUNT):
+        pdf.add_page()
+        pdf.multi_cell(0, 6, f"Page {number}: led project {number} and shipped release {number * 7}.")
+    path = str(tmp_path_factory.mktemp("pdf") / "long.pdf")
+    pdf.output(path)
+    return path
+
+
+@pytest.mark.parametrize("name", ["pymupdf", "pypdf", "pdfminer"])
+def test_parallel_matches_sequential_text_and_page_order(name, long_pdf):
+    if name not in available_backends():
+        pytest.skip(f"{name} is not installed")
+    sequential_layout, parallel_layout = [], []
+    sequential = list(iter_resume_pages(long_pdf, backend=name, layout=sequential_layout))
+    parallel = extract_pages_parallel(long_pdf, max_workers=3, backend=name, layout=parallel_layout)
+
+    assert len(sequential) == PAGE_COUNT
+    assert parallel == sequential
+    assert [f"Page {number}:" in page for number, page in enumerate(parallel)] == [True] * PAGE_COUNT
+    assert parallel_layout == sequential_layout
+
+
+def test_parallel_respects_the_same_bounds(long_pdf):
+    bounds = [{"max_pages": PARALLEL_PAGE_THRESHOLD}, {"max_chars": 150}, {"max_pages": 0}]
+    for bound in bounds:
+        assert extract_pages_parallel(long_pdf, max_workers=4, **bound) == list(iter_resume_pages(long_pdf, **bound))
+
+    # The opt-in path joins pages exactly like the in-process one
+    assert _extract_resume_text(long_pdf, parallel=True) == _extract_resume_text(long_pdf)
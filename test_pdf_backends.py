@@ -0,0 +1,52 @@
+"""
+Tests for the pluggable PDF extraction backends
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import core.pdf_backends as pdf_backends
+from core.pdf_backends import BACKEND_PREFERENCE, available_backends, get_pdf_backend
+
+PAGES = ["EXPERIENCE\nBuilt data pipelines in Python", "EDUCATION\nBSc Computer Science"]
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    fpdf = pytest.importorskip("fpdf")
+    pdf = fpdf.FPDF()
+    pdf.set_font("Helvetica", size=12)
+    for page in PAGES:
+        pdf.add_page()
+        pdf.multi_cell(0, 8, page)
+    path = str(tmp_path / "resume.pdf")
+    pdf.output(path)
+    return path
+
+
+@pytest.mark.parametrize("name", BACKEND_PREFERENCE)
+def test_backends_agree_on_simple_text(name, sample_pdf):
+    """Every backend returns the same words per page, lazily and by page range"""
+    if name not in available_backends():
+        pytest.skip(f"{name} is not installed")
+    backend = get_pdf_backend(name)
+
+    pages = list(backend.iter_pages(sample_pdf))
+    assert backend.page_count(sample_pdf) == 2
+    assert [page.split() for page in pages] == [page.split() for page in PAGES]
+    assert backend.extract_range(sample_pdf, 1, 2) == pages[1:]
+
+
+def test_default_is_fastest_available(monkeypatch):
+    monkeypatch.delenv("ARIA_PDF_BACKEND", raising=False)
+    pdf_backends._default_backend.cache_clear()
+    try:
+        assert get_pdf_backend().name == available_backends()[0]
+    finally:
+        pdf_backends._default_backend.cache_clear()
+    with pytest.raises(ValueError):
+        get_pdf_backend("pdftotext")
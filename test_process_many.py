@@ -0,0 +1,50 @@
+"""
+Tests for batch resume ingestion with process_many
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import core.utils as utils
+from core.resume_cache import ResumeCache
+from core.utils import process_many
+
+RESUMES = os.path.join(os.path.dirname(__file__), 'data', 'raw', 'resumes')
+
+
+def tokenize(text):
+    # Stands in for clean_text, which needs the NLTK corpora
+    return re.findall(r'[a-z]+', text.lower())
+
+
+@pytest.fixture
+def offline_utils(monkeypatch, tmp_path):
+    # Forked workers inherit these, and test tokens never reach the real resume cache
+    monkeypatch.setattr(utils, 'clean_text', tokenize)
+    monkeypatch.setattr(utils, '_resume_cache', ResumeCache(str(tmp_path / 'cache.sqlite3')))
+
+
+def test_failing_resume_yields_an_error_and_the_rest_succeed(offline_utils, tmp_path):
+    good = [os.path.join(RESUMES, name) for name in sorted(os.listdir(RESUMES))[:2]]
+    broken = tmp_path / 'broken.pdf'
+    broken.write_bytes(b'not a pdf at all')
+    legacy = str(tmp_path / 'resume.doc')
+
+    results = list(process_many(good[:1] + [str(broken), legacy] + good[1:], "Python engineer with AWS",
+                                max_workers=2))
+
+    by_path = {result['resume_path']: result for result in results}
+    assert len(results) == 4 and set(by_path) == set(good) | {str(broken), legacy}
+    for path in (str(broken), legacy):
+        assert set(by_path[path]) == {'resume_path', 'error'} and by_path[path]['error']
+    assert '.doc' in by_path[legacy]['error']
+    for path in good:
+        result = by_path[path]
+        assert 'error' not in result
+        assert result['raw_resume_text'] and result['cleaned_resume'] == tokenize(result['raw_resume_text'])
+        assert result['cleaned_job_description'] == ['python', 'engineer', 'with', 'aws']
@@ -0,0 +1,72 @@
+"""
+Tests for the content-addressed resume cache
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.resume_cache import ResumeCache, file_sha256
+
+
+def test_cache_is_keyed_by_content(tmp_path):
+    """Two files with the same bytes share one cache entry"""
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_bytes(b"%PDF-1.4 same bytes")
+    second.write_bytes(b"%PDF-1.4 same bytes")
+
+    cache = ResumeCache(str(tmp_path / "cache.sqlite3"))
+    key = cache.key_for_file(str(first), "v1")
+    assert cache.get_text(key) is None
+    cache.put_text(key, "resume text")
+
+    assert cache.key_for_file(str(second), "v1") == key
+    assert cache.get_text(cache.key_for_file(str(second), "v1")) == "resume text"
+    assert cache.key_for_file(str(first), "v2") != key
+    assert file_sha256(str(first)) == key.split(":")[0]
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_tokens_respect_cleaner_version(tmp_path):
+    """Tokens cached by one cleaner version are not served to another"""
+    cache = ResumeCache(str(tmp_path / "cache.sqlite3"))
+    cache.put_text("k", "text")
+    cache.put_tokens("k", ["python", "engineer"], "c1")
+
+    assert cache.get_tokens("k", "c1") == ["python", "engineer"]
+    assert cache.get_tokens("k", "c2") is None
+
+    # Re-extracting the text drops tokens derived from the previous text
+    cache.put_text("k", "new text")
+    assert cache.get_tokens("k", "c1") is None
+
+
+def test_token_lookups_do_not_skew_the_hit_rate(tmp_path):
+    cache = ResumeCache(str(tmp_path / "cache.sqlite3"))
+    cache.put_text("k", "text")
+    assert cache.get_text("k") == "text"
+    assert cache.get_tokens("k", "c1") is None  # the usual miss right after a text hit
+    cache.put_tokens("k", ["text"], "c1")
+    assert cache.get_tokens("k", "c1") == ["text"]
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 0, 1.0)
+    assert (stats["token_hits"], stats["token_misses"]) == (1, 1)
+
+
+def test_lru_eviction(tmp_path):
+    """The least recently used entry is evicted once the bound is exceeded"""
+    cache = ResumeCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.put_text("a", "A")
+    cache.put_text("b", "B")
+    assert cache.get_text("a") == "A"  # "b" is now the least recently used
+    cache.put_text("c", "C")
+
+    assert cache.get_text("b") is None
+    assert cache.get_text("a") == "A"
+    assert cache.get_text("c") == "C"
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,70 @@
+"""
+Tests for page- and character-bounded resume extraction
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+import core.utils as utils
+from core.utils import RESUME_MAX_CHARS, RESUME_MAX_PAGES, iter_resume_pages
+
+
+@pytest.fixture
+def fake_pages(monkeypatch):
+    """Replaces PDF parsing with generated pages and records how many were parsed."""
+    parsed = []
+
+    def install(page_count, page_chars):
+        def iter_pages(file_path, backend=None, layout=None):
+            for number in range(page_count):
+                parsed.append(number)
+                yield str(number % 10) * page_chars
+
+        monkeypatch.setattr(utils, '_iter_pdf_pages', iter_pages)
+        return parsed
+
+    return install
+
+
+def test_page_bound_stops_parsing(fake_pages):
+    parsed = fake_pages(page_count=RESUME_MAX_PAGES * 3, page_chars=100)
+    pages = list(iter_resume_pages("book.pdf", max_pages=RESUME_MAX_PAGES, max_chars=RESUME_MAX_CHARS))
+    assert len(pages) == RESUME_MAX_PAGES and all(len(page) == 100 for page in pages)
+    assert len(parsed) == RESUME_MAX_PAGES
+
+
+def test_over_long_document_is_truncated_at_the_char_limit(fake_pages):
+    page_chars = 30_000
+    parsed = fake_pages(page_count=RESUME_MAX_PAGES, page_chars=page_chars)
+    pages = list(iter_resume_pages("portfolio.pdf", max_pages=RESUME_MAX_PAGES, max_chars=RESUME_MAX_CHARS))
+
+    assert sum(map(len, pages)) == RESUME_MAX_CHARS
+    full_pages, last_chars = divmod(RESUME_MAX_CHARS, page_chars)
+    assert [len(page) for page in pages] == [page_chars] * full_pages + [last_chars]
+    assert pages[-1] == str(full_pages % 10) * last_chars
+    # Pages after the one that used up the budget are never parsed
+    assert len(parsed) == full_pages + 1
+
+
+def test_bounds_on_a_real_pdf(tmp_path):
+    fpdf = pytest.importorskip("fpdf")
+    pdf = fpdf.FPDF()
+    pdf.set_font("Helvetica", size=10)
+    for number in range(5):
+        pdf.add_page()
+        pdf.cell(0, 8, f"Page {number} of a long portfolio")
+    path = str(tmp_path / "portfolio.pdf")
+    pdf.output(path)
+
+    full = list(iter_resume_pages(path))
+    assert len(full) == 5 and all(f"Page {number}" in page for number, page in enumerate(full))
+    assert list(iter_resume_pages(path, max_pages=2)) == full[:2]
+    assert list(iter_resume_pages(path, max_pages=0)) == []
+
+    budget = len(full[0]) + 4
+    bounded = list(iter_resume_pages(path, max_chars=budget))
+    assert bounded == [full[0], full[1][:4]]
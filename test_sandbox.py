@@ -0,0 +1,75 @@
+"""
+Tests for sandboxed extraction in supervised worker processes
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.sandbox import ExtractionError, SandboxPool, _rss_bytes
+from core.utils import _extract_resume
+
+RESUME_PATH = os.path.join(os.path.dirname(__file__), "data", "raw", "resumes", "ahmed_raza_webdeveloper.pdf")
+
+
+def sleep_forever():
+    time.sleep(60)
+
+
+def allocate_forever():
+    blocks = []
+    while True:
+        blocks.append(bytearray(16 << 20))
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def pool():
+    pool = SandboxPool(workers=1, timeout=5, max_rss_mb=256)
+    yield pool
+    pool.shutdown()
+
+
+def test_sandboxed_extraction_matches_in_process(pool):
+    assert pool.run(_extract_resume, RESUME_PATH, None, None) == _extract_resume(RESUME_PATH)
+    with pytest.raises(ExtractionError) as error:
+        pool.run(_extract_resume, "resume.txt", None, None, file_name="resume.txt")
+    assert error.value.as_dict() == {
+        "error": "Unsupported file type. Only PDF and DOCX are accepted.", "error_kind": "invalid",
+        "file_name": "resume.txt",
+    }
+
+
+def test_limits_kill_and_recycle_the_worker(pool):
+    started = time.monotonic()
+    with pytest.raises(ExtractionError) as error:
+        pool.run(sleep_forever, timeout=1)
+    assert error.value.kind == "timeout" and time.monotonic() - started < 5
+
+    if _rss_bytes(os.getpid()) is not None:
+        with pytest.raises(ExtractionError) as error:
+            pool.run(allocate_forever)
+        assert error.value.kind == "memory"
+
+    # A fresh worker serves the next job
+    assert pool.run(_extract_resume, RESUME_PATH, None, None)[0]
+    assert pool.stats["timeouts"] == 1
+
+
+def test_broken_pipe_is_an_extraction_error(pool):
+    assert pool.run(_extract_resume, RESUME_PATH, None, None)[0]
+    worker = pool._idle.get_nowait()
+    worker.process.kill()
+    worker.process.join()
+    pool._idle.put(worker)
+
+    with pytest.raises(ExtractionError) as error:
+        pool.run(_extract_resume, RESUME_PATH, None, None, file_name="resume.pdf")
+    assert error.value.kind == "crashed" and error.value.file_name == "resume.pdf"
+    # The dead worker is replaced on the next job
+    assert pool.run(_extract_resume, RESUME_PATH, None, None)[0]
+    assert pool.stats["crashes"] == 1
@@ -0,0 +1,57 @@
+"""
+Tests for the one-pass resume section segmenter
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.sections import segment_sections
+
+RESUME = """Jane Doe
+jane@example.com | github.com/jane
+
+PROFESSIONAL SUMMARY
+Backend engineer with 5 years of experience.
+
+Work Experience:
+Acme Corp - Senior Engineer
+Built APIs for payments.
+
+Tools & Technologies
+Python, Go, PostgreSQL
+
+EDUCATION & TRAINING
+BSc Computer Science
+
+Certifications
+AWS Solutions Architect
+"""
+
+
+def test_sections_and_offsets():
+    """Headings split the text into spans whose offsets point back into it"""
+    index = segment_sections(RESUME)
+
+    assert [span.name for span in index] == [
+        "contact", "summary", "experience", "skills", "education", "certifications"
+    ]
+    assert index.section_text("contact") == "Jane Doe\njane@example.com | github.com/jane"
+    assert index.section_text("experience") == "Acme Corp - Senior Engineer\nBuilt APIs for payments."
+    assert index.section_text("skills") == "Python, Go, PostgreSQL"
+    assert index.get("education").heading == "EDUCATION & TRAINING"
+    assert index.section_text("education") == "BSc Computer Science"
+    assert "projects" not in index and index.section_text("projects") == ""
+
+    span = index.get("summary")
+    assert RESUME[span.start:span.body_start].strip() == "PROFESSIONAL SUMMARY"
+    assert all(a.end == b.start for a, b in zip(index.spans, index.spans[1:]))
+
+
+def test_explicit_contact_heading_and_no_headings():
+    index = segment_sections("Jane Doe\nContact Information\njane@example.com\nSkills\nPython")
+    assert index.section_text("contact") == "jane@example.com"
+    assert index.spans[0].name == "header"
+
+    assert len(segment_sections("just a paragraph of text")) == 0
@@ -0,0 +1,52 @@
+"""
+Tests for the trie-based skills taxonomy extractor
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from core.sections import segment_sections
+from core.skills import SkillTaxonomy, extract_skills, get_skill_taxonomy, missing_skills, skills_chart_data
+
+
+def test_symbols_longest_match_and_case():
+    skills = extract_skills(
+        "Wrote C++ and C# services on .NET and Node.js, trained machine learning models "
+        "with LLMs, and shipped React Native apps. Go to market with Go."
+    )
+    for name in ("C++", "C#", ".NET", "Node.js", "Machine Learning", "Large Language Models", "React Native", "Go"):
+        assert name in skills, name
+    # "React Native" is taken whole rather than as "React", and "Go to market" is not the language
+    assert "React" not in skills
+    assert skills["Go"].count == 1
+
+
+def test_sections_and_skill_gap():
+    resume = "SKILLS\nPython, Docker\n\nEXPERIENCE\nBuilt Python APIs on AWS"
+    resume_skills = extract_skills(resume, segment_sections(resume))
+    assert resume_skills["Python"].count == 2
+    assert resume_skills["Python"].sections == ["skills", "experience"]
+
+    jd_skills = extract_skills("Kubernetes, Python, Kubernetes operators and Terraform")
+    assert missing_skills(resume_skills, jd_skills) == ["Kubernetes", "Terraform"]
+
+    chart = skills_chart_data(resume_skills, jd_skills)
+    assert list(chart)[0] == "Python" and chart["Python"] == 100
+
+
+def test_taxonomy_is_consistent():
+    assert get_skill_taxonomy().conflicts == []
+    taxonomy = SkillTaxonomy({"a": {"Rust": ["rust lang"]}, "b": {"Rusty": ["rust lang"]}})
+    assert taxonomy.conflicts == [("rust lang", "Rust", "Rusty")]
+
+
+def test_english_words_are_not_skills_in_prose():
+    assert extract_skills("I make decisions and express ideas") == {}
+    assert extract_skills("Go to the office. Make it happen. Express yourself.") == {}
+    assert extract_skills("Chef at a restaurant; the apex of a career; a spark of oracle wisdom") == {}
+
+    # Used as skills: mid-sentence, in a list, or alone on a bullet line
+    skills = extract_skills("Skills: Go, Express, Oracle\nDeployed with Chef and Make.\nApex, Spark\n- Rust")
+    assert list(skills) == ["Go", "Express.js", "Oracle Database", "Chef", "Make", "Apex", "Apache Spark", "Rust"]
@@ -14,6 +14,7 @@ from workflows.ats_flow import ats_analysis_flow
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 from core.utils import load_resume
+from core.ats import ATSAnalyzer
 
 def show_ats_checker_ui():
     st.header("📊 ATS Checker Module")
@@ -73,8 +74,8 @@ def show_ats_checker_ui():
                             tmp_file.write(uploaded_file.getvalue())
                             tmp_file_path = tmp_file.name
                         
-                        # Run Prefect flow instead of direct call
-                        results = ats_analysis_flow(tmp_file_path, job_description)
+                        # Run Prefect flow instead of direct call; the upload is extracted in a sandboxed worker
+                        results = ats_analysis_flow(tmp_file_path, job_description, sandbox=True)
                         
                         # Store results in session state
                         st.session_state.ats_analysis_results = results
@@ -82,7 +83,8 @@ def show_ats_checker_ui():
                         # Clean up temporary file
                         os.unlink(tmp_file_path)
                         
-                        st.success("✅ Analysis completed successfully!")
+                        if 'error' not in results:
+                            st.success("✅ Analysis completed successfully!")
                         
                     except Exception as e:
                         st.error(f"❌ Error during analysis: {str(e)}")
@@ -96,6 +98,7 @@ def show_ats_checker_ui():
             st.error(f"❌ Analysis Error: {results['error']}")
         else:
             display_ats_results(results)
+            show_live_editor(results, job_description)
     
     # ATS Tips section
     with st.expander("📚 ATS Optimization Tips"):
@@ -129,6 +132,37 @@ def show_ats_checker_ui():
         - Include relevant keywords naturally
         """)
 
+def show_live_editor(results, job_description):
+    """Edit the resume text and see the score update without re-running the analysis"""
+    if 'resume_text' not in results:
+        return
+    st.divider()
+    st.subheader("✏️ Live Score Editor")
+    st.caption("Edit your resume text below; only the lines you change are re-scored.")
+
+    # One incremental session per analysis; reruns only feed it the edited text
+    session = st.session_state.get("ats_live_session")
+    if session is None or st.session_state.get("ats_live_results") is not results:
+        session = ATSAnalyzer().start_session(results['resume_text'], job_description or None,
+                                              layout=results.get('layout'))
+        st.session_state.ats_live_session = session
+        st.session_state.ats_live_results = results
+        st.session_state.ats_live_text = results['resume_text']
+
+    edited_text = st.text_area("Resume text", key="ats_live_text", height=400)
+    session.update(edited_text)
+    live = session.result()
+
+    st.metric("Live ATS Score", f"{live['overall_score']}%",
+              delta=f"{live['overall_score'] - results['overall_score']:+.1f}")
+    columns = st.columns(len(live['category_scores']))
+    for column, (category, data) in zip(columns, live['category_scores'].items()):
+        original = results['category_scores'].get(category, {}).get('score', data['score'])
+        column.metric(category.replace('_', ' ').title(), f"{data['score'] * 100:.0f}%",
+                      delta=f"{(data['score'] - original) * 100:+.0f}")
+    for i, rec in enumerate(live['recommendations'], 1):
+        st.write(f"**{i}.** {rec}")
+
 def display_ats_results(results):
     """Display comprehensive ATS analysis results"""
     
@@ -273,6 +307,14 @@ def display_ats_results(results):
     for i, rec in enumerate(recommendations, 1):
         st.write(f"**{i}.** {rec}")
     
+    # Ranked additions from the what-if simulation
+    improvements = results.get('improvements') or []
+    if improvements:
+        st.subheader("📈 Highest-Impact Additions")
+        for item in improvements:
+            kind = item['kind'].replace('_', ' ')
+            st.write(f"**+{item['gain']:.1f} pts**: add `{item['phrase']}` ({kind})")
+    
     # Action Items
     st.subheader("🎯 Action Items")
     
@@ -6,6 +6,7 @@ from dotenv import load_dotenv
 import tempfile
 import shutil
 from workflows.resume_match_pipeline import app 
+from core.sandbox import ExtractionError
 
 load_dotenv()
 
@@ -48,8 +49,8 @@ def show_resume_match_ui():
                         f.write(uploaded_resume.getbuffer())
                     
                         
-                    # Prepare initial state for the pipeline
-                    initial_state = {"resume_path": resume_path, "jd_text": jd_text_input}
+                    # Prepare initial state for the pipeline; the upload is extracted in a sandboxed worker
+                    initial_state = {"resume_path": resume_path, "jd_text": jd_text_input, "sandbox": True}
                     
                     # Run the pipeline
                     final_state = {}
@@ -98,6 +99,8 @@ def show_resume_match_ui():
                     else:
                         st.error("Failed to generate tailored CV. Please try again.")
                         
+                except ExtractionError as e:
+                    st.error(f"❌ Could not read {uploaded_resume.name}: {e.message}")
                 except Exception as e:
                     st.error(f"An error occurred during pipeline execution: {str(e)}")
                 finally:
@@ -3,52 +3,46 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.ats import ATSAnalyzer
-from core.utils import load_resume,clean_text
+from core.utils import load_resume_document, RESUME_MAX_PAGES, RESUME_MAX_CHARS
+from core.document import ParsedDocument
+from core.sandbox import ExtractionError
 
 @task
-def load_and_clean_resume(resume_path: str):
-    """Loads resume text and cleans it."""
+def load_and_clean_resume(resume_path: str, sandbox: bool = None) -> ParsedDocument:
+    """Loads resume text and cleans it into a ParsedDocument shared by all checks."""
     print(f"Loading and cleaning resume from: {resume_path}")
-    resume_text = load_resume(resume_path)
-    resume_tokens = clean_text(resume_text)
-    return resume_text, resume_tokens
+    return load_resume_document(resume_path, max_pages=RESUME_MAX_PAGES, max_chars=RESUME_MAX_CHARS, sandbox=sandbox)
 @flow(name="ATS Analysis Flow", log_prints=True)
-def ats_analysis_flow(resume_path: str, job_description: str = None):
+def ats_analysis_flow(resume_path: str, job_description: str = None, sandbox: bool = None, profile: str = None):
     """
-    Orchestrates the full ATS analysis by running individual checks as tasks.
+    Orchestrates the full ATS analysis: loading, the compiled check plan and recommendations run as tasks.
+    With `sandbox=True` the resume is extracted in a supervised worker process; if that
+    fails (timeout, memory limit, unreadable file) the result carries 'error' and 'error_kind'.
+    `profile` adds an industry profile's checks (core.ats_rules.ATS_PROFILES).
     """
-    analyzer = ATSAnalyzer()
-    ats_criteria = analyzer.ats_criteria
+    analyzer = ATSAnalyzer(profile)
 
     # 1. Load and preprocess resume
-    resume_text, resume_tokens = load_and_clean_resume(resume_path)
+    try:
+        resume_doc = load_and_clean_resume(resume_path, sandbox)
+    except ExtractionError as e:
+        print(f"Resume extraction failed ({e.kind}): {e}")
+        return {
+            'overall_score': 0,
+            **e.as_dict(),
+            'category_scores': {},
+            'recommendations': ['Error processing resume. Please check file format.']
+        }
+    resume_text = resume_doc.raw_text
+    jd_doc = ParsedDocument.from_text(job_description) if job_description else None
 
-    # 2. Run analysis tasks
-    print("Running individual analysis tasks...")
-    format_score = analyzer.check_format_compatibility(resume_text)
-    keyword_score = analyzer.check_keyword_optimization(resume_text, resume_tokens, job_description)
-    structure_score = analyzer.check_structure_quality(resume_text)
-    content_score = analyzer.check_content_quality(resume_text, resume_tokens)
+    # 2. Run every check in one pass of the compiled plan
+    print("Running ATS checks...")
+    category_scores_data = analyzer.score_categories(resume_doc, jd_doc)
 
     # 3. Aggregate scores (this logic runs inside the flow)
     print("Aggregating scores...")
-    category_scores_data = {
-        'format_compatibility': format_score,
-        'keyword_optimization': keyword_score,
-        'structure_quality': structure_score,
-        'content_quality': content_score
-    }
-    
-    scores = {}
-    total_score = 0
-    for category, score in category_scores_data.items():
-        config = ats_criteria[category]
-        scores[category] = {
-            'score': score,
-            'weight': config['weight'],
-            'weighted_score': score * config['weight']
-        }
-        total_score += scores[category]['weighted_score']
+    scores, total_score = analyzer.weigh_scores(category_scores_data)
 
     # 4. Generate recommendations
     recommendations = analyzer.generate_recommendations(scores, resume_text)
@@ -58,6 +52,11 @@ def ats_analysis_flow(resume_path: str, job_description: str = None):
         'overall_score': round(total_score * 100, 1),
         'category_scores': scores,
         'recommendations': recommendations,
+        'missing_skills': analyzer.skill_gap(resume_text, jd_doc, resume_doc) if jd_doc else [],
+        'improvements': [improvement._asdict() for improvement in analyzer.rank_improvements(resume_doc, jd_doc)],
+        # For ATSAnalyzer.start_session, which re-scores the text as it is edited
+        'resume_text': resume_text,
+        'layout': resume_doc.layout,
     }
     
     print("ATS Analysis Complete:")
@@ -1,4 +1,4 @@
-from typing import TypedDict, Annotated, List
+from typing import TypedDict, Annotated
 import operator
 from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph, END
@@ -10,16 +10,18 @@ from agents.ingestion_agent import IngestionAgent
 from agents.embedding_agent import EmbeddingAgent
 from agents.advisor_agent import AdvisorAgent
 from agents.pdf_generator_agent import PDFGeneratorAgent
+from core.document import ParsedDocument
 
 
 class AgentState(TypedDict):
     """ The state of the agentic RAG workflow. """
     resume_path: str
     jd_text: str 
-    raw_resume_text: str
-    raw_jd_text: str
-    cleaned_resume: List[str]
-    cleaned_jd: List[str]
+    # Extract the uploaded resume in a supervised worker process (see core.sandbox)
+    sandbox: bool
+    # Parsed once by the ingest node; raw text, tokens and derived views are shared by all nodes
+    resume_doc: ParsedDocument
+    jd_doc: ParsedDocument
     similarity_score: float
     insights: dict
     output_pdf_path: str
@@ -37,19 +39,19 @@ pdf_generator_agent = PDFGeneratorAgent()
 def ingest_node(state: AgentState):
     """Call ingestion once and extract all required data."""
     print("Ingesting documents...")
-    ingested_data = ingestion_agent.ingest(state["resume_path"], state["jd_text"])
+    resume_doc, jd_doc = ingestion_agent.ingest_documents(
+        state["resume_path"], state["jd_text"], sandbox=state.get("sandbox")
+    )
     print("Documents ingested successfully.")
     return {
-        "raw_resume_text": ingested_data["raw_resume_text"],
-        "raw_jd_text": ingested_data["raw_jd_text"],
-        "cleaned_resume": ingested_data["cleaned_resume"],
-        "cleaned_jd": ingested_data["cleaned_job_description"]
+        "resume_doc": resume_doc,
+        "jd_doc": jd_doc
     }
 
 def embed_node(state: AgentState):
     """Calculate similarity score."""
     print("Generating embeddings and calculating similarity...")
-    score = embedding_agent.process(state["cleaned_resume"], state["cleaned_jd"])
+    score = embedding_agent.process(state["resume_doc"], state["jd_doc"])
     print(f"Similarity score calculated: {score:.4f}")
     return {"similarity_score": score}
 
@@ -57,8 +59,8 @@ def advise_node(state: AgentState):
     """Generate AI-driven insights."""
     print("Generating AI-driven insights and suggestions...")
     insights = advisor_agent.advise(
-        state["raw_resume_text"], 
-        state["raw_jd_text"], 
+        state["resume_doc"].raw_text, 
+        state["jd_doc"].raw_text, 
         state["similarity_score"]
     )
     print("Insights generated successfully.")
@@ -68,7 +70,7 @@ def generate_pdf_node(state: AgentState):
     """Generate the tailored CV PDF."""
     print("--- Tailored CV Document Creation Phase ---")
     # REMOVED 'font_path=FONT_PATH'
-    pdf_path = pdf_generator_agent.generate_cv(state["raw_resume_text"], state["raw_jd_text"])
+    pdf_path = pdf_generator_agent.generate_cv(state["resume_doc"].raw_text, state["jd_doc"].raw_text)
     print(f"Tailored CV PDF generated at: {pdf_path}")
     return {"output_pdf_path": pdf_path}
 